@@ -85,6 +85,8 @@ common = '''
 .. |NumpyVectorArrays| replace:: :class:`NumpyVectorArrays <pymor.vectorarrays.numpy.NumpyVectorArray>`
 .. |ListVectorArray| replace:: :class:`~pymor.vectorarrays.list.ListVectorArray`
 .. |ListVectorArrays| replace:: :class:`ListVectorArrays <pymor.vectorarrays.list.ListVectorArray>`
+.. |MemmapVectorArray| replace:: :class:`~pymor.vectorarrays.memmap.MemmapVectorArray`
+.. |MemmapVectorArrays| replace:: :class:`MemmapVectorArrays <pymor.vectorarrays.memmap.MemmapVectorArray>`
 
 .. |NumpyHankelOperator| replace:: :class:`~pymor.operators.numpy.NumpyHankelOperator`
 .. |NumpyHankelOperators| replace:: :class:`NumpyHankelOperators <pymor.operators.numpy.NumpyHankelOperator>`
@@ -130,6 +132,8 @@ common = '''
 .. |parameter values| replace:: :class:`parameter values <pymor.parameters.base.Mu>`
 .. |Parameter value| replace:: :class:`Parameter value <pymor.parameters.base.Mu>`
 .. |parameter value| replace:: :class:`parameter value <pymor.parameters.base.Mu>`
+.. |MuArray| replace:: :class:`~pymor.parameters.base.MuArray`
+.. |MuArrays| replace:: :class:`MuArrays <pymor.parameters.base.MuArray>`
 .. |ParametricObject| replace:: :class:`~pymor.parameters.base.ParametricObject`
 .. |ParametricObjects| replace:: :class:`ParametricObjects <pymor.parameters.base.ParametricObject>`
 .. |parametric| replace:: :attr:`~pymor.parameters.base.ParametricObject.parametric`
@@ -97,8 +97,10 @@ def ei_greedy(U, error_norm=None, atol=None, rtol=None, max_interpolation_dofs=N
 
     interpolation_dofs = np.zeros((0,), dtype=np.int32)
     collateral_basis = U.empty()
-    K = np.eye(len(U))  # matrix s.t. U = U_initial.lincomb(K)
+    # U = U_initial.lincomb(I - dof_values.T @ coefficients), where the rows of dof_values
+    # contain the values of U at the interpolation DOFs before the respective update
     coefficients = np.zeros((0, len(U)))
+    dof_values = np.zeros((0, len(U)))
     max_errs = []
     triangularity_errs = []
 
@@ -143,13 +145,14 @@ def ei_greedy(U, error_norm=None, atol=None, rtol=None, max_interpolation_dofs=N
         new_vec *= 1 / new_dof_value
         interpolation_dofs = np.hstack((interpolation_dofs, new_dof))
         collateral_basis.append(new_vec)
-        coefficients = np.vstack([coefficients, K[max_err_ind] / new_dof_value])
+        coefficients = np.vstack([coefficients,
+                                  _initial_coefficients(max_err_ind, coefficients, dof_values) / new_dof_value])
         max_errs.append(max_err)
 
         # update U and ERR
-        new_dof_values = U.dofs([new_dof])
-        U.axpy(-new_dof_values[:, 0], new_vec)
-        K -= (K[max_err_ind] / new_dof_value) * new_dof_values
+        new_dof_values = U.dofs([new_dof])[:, 0]
+        U.axpy(-new_dof_values, new_vec)
+        dof_values = np.vstack([dof_values, new_dof_values])
         errs = ERR.norm() if error_norm is None else ERR.sup_norm() if error_norm == 'sup' else error_norm(ERR)
         max_err_ind = np.argmax(errs)
         max_err = errs[max_err_ind]
@@ -451,8 +454,9 @@ def _parallel_ei_greedy(U, pool, error_norm=None, atol=None, rtol=None, max_inte
         )
         snapshot_count = sum(snapshot_counts)
         cum_snapshot_counts = np.hstack(([0], np.cumsum(snapshot_counts)))
-        K = np.eye(snapshot_count)  # matrix s.t. U = U_initial.lincomb(K)
+        # see ei_greedy
         coefficients = np.zeros((0, snapshot_count))
+        dof_values = np.zeros((0, snapshot_count))
         max_err_ind = np.argmax(errs)
         initial_max_err = max_err = errs[max_err_ind]
 
@@ -490,14 +494,15 @@ def _parallel_ei_greedy(U, pool, error_norm=None, atol=None, rtol=None, max_inte
             interpolation_dofs = np.hstack((interpolation_dofs, new_dof))
             collateral_basis.append(new_vec)
             global_max_err_ind = cum_snapshot_counts[max_err_ind] + local_ind
-            coefficients = np.vstack([coefficients, K[global_max_err_ind] / new_dof_value])
+            coefficients = np.vstack([coefficients,
+                                      _initial_coefficients(global_max_err_ind, coefficients, dof_values)
+                                      / new_dof_value])
             max_errs.append(max_err)
 
             errs, new_dof_values = zip(
                 *pool.apply(_parallel_ei_greedy_update, new_vec=new_vec, new_dof=new_dof, data=distributed_data)
             )
-            new_dof_values = np.hstack(new_dof_values)
-            K -= (K[global_max_err_ind] / new_dof_value) * new_dof_values[:, np.newaxis]
+            dof_values = np.vstack([dof_values, np.hstack(new_dof_values)])
             max_err_ind = np.argmax(errs)
             max_err = errs[max_err_ind]
 
@@ -523,6 +528,13 @@ def _parallel_ei_greedy(U, pool, error_norm=None, atol=None, rtol=None, max_inte
     return interpolation_dofs, collateral_basis, data
 
 
+def _initial_coefficients(ind, coefficients, dof_values):
+    """Coefficients of the current `U[ind]` w.r.t. the initial `U` in :func:`ei_greedy`."""
+    c = -(dof_values[:, ind] @ coefficients)
+    c[ind] += 1
+    return c
+
+
 def _parallel_ei_greedy_get_empty(U=None):
     return U.empty()
 
@@ -11,6 +11,7 @@ import numpy as np
 from pymor.core.logger import getLogger
 from pymor.models.basic import StationaryModel
 from pymor.parallel.dummy import dummy_pool
+from pymor.parameters.base import MuArray
 
 
 def reduction_error_analysis(rom, fom, reductor, test_mus,
@@ -34,7 +35,7 @@ def reduction_error_analysis(rom, fom, reductor, test_mus,
     reductor
         The reductor which has created `rom`.
     test_mus
-        List of |Parameters| to compute the errors for.
+        List or |MuArray| of |Parameters| to compute the errors for.
     basis_sizes
         Either a list of reduced basis dimensions to consider, or
         the number of dimensions (which are then selected equidistantly,
@@ -75,7 +76,10 @@ def reduction_error_analysis(rom, fom, reductor, test_mus,
         If `True`, use a logarithmic y-axis to plot the computed custom
         values.
     pool
-        If not `None`, the |WorkerPool| to use for parallelization.
+        If not `None`, the |WorkerPool| to use for parallelization. The
+        test |Parameters| are distributed among the workers. The reduced
+        models for all basis sizes are only built once and sent to the
+        workers along with `fom` and `reductor`.
 
     Returns
     -------
@@ -184,13 +188,19 @@ def reduction_error_analysis(rom, fom, reductor, test_mus,
     if error_norm_names is None:
         error_norm_names = tuple(norm.name for norm in error_norms)
 
+    # reduce only once for each basis size and share the ROMs between all test parameters
+    logger.info(f'Reducing for {len(basis_sizes)} basis sizes ...')
+    roms = tuple(reductor.reduce(dims={k: N for k in reductor.bases}) for N in basis_sizes)
+
+    logger.info(f'Computing errors for {len(test_mus)} parameters ...')
     norms, error_estimates, errors, conditions, custom_values = \
-        list(zip(*pool.map(_compute_errors, test_mus, fom=fom, reductor=reductor, error_estimator=error_estimator,
-                           error_norms=error_norms, condition=condition, custom=custom, basis_sizes=basis_sizes)))
-    print()
+        list(zip(*pool.map(_compute_errors, test_mus if isinstance(test_mus, MuArray) else list(test_mus),
+                           fom=fom, reductor=reductor, roms=roms,
+                           error_estimator=error_estimator, error_norms=error_norms, condition=condition,
+                           custom=custom, basis_sizes=basis_sizes)))
 
     result = {}
-    result['mus'] = test_mus = np.array(test_mus)
+    result['mus'] = test_mus = test_mus if isinstance(test_mus, MuArray) else np.array(test_mus)
     result['basis_sizes'] = basis_sizes
 
     summary = [('number of samples', str(len(test_mus)))]
@@ -199,13 +209,13 @@ def reduction_error_analysis(rom, fom, reductor, test_mus,
         result['error_norm_names'] = error_norm_names
         result['norms'] = norms = np.array(norms)
         result['max_norms'] = max_norms = np.max(norms, axis=0)
-        result['max_norm_mus'] = max_norm_mus = test_mus[np.argmax(norms, axis=0)]
+        result['max_norm_mus'] = max_norm_mus = _select_mus(test_mus, np.argmax(norms, axis=0))
         result['errors'] = errors = np.array(errors)
         result['max_errors'] = max_errors = np.max(errors, axis=0)
-        result['max_error_mus'] = max_error_mus = test_mus[np.argmax(errors, axis=0)]
+        result['max_error_mus'] = max_error_mus = _select_mus(test_mus, np.argmax(errors, axis=0))
         result['rel_errors'] = rel_errors = errors / norms[:, :, np.newaxis]
         result['max_rel_errors'] = np.max(rel_errors, axis=0)
-        result['max_rel_error_mus'] = test_mus[np.argmax(rel_errors, axis=0)]
+        result['max_rel_error_mus'] = _select_mus(test_mus, np.argmax(rel_errors, axis=0))
         for name, norm, norm_mu, error, error_mu in zip(error_norm_names,
                                                         max_norms, max_norm_mus,
                                                         max_errors[:, -1], max_error_mus[:, -1]):
@@ -218,16 +228,17 @@ def reduction_error_analysis(rom, fom, reductor, test_mus,
     if error_estimator:
         result['error_estimates'] = error_estimates = np.array(error_estimates)
         result['max_error_estimates'] = max_error_estimates = np.max(error_estimates, axis=0)
-        result['max_error_estimate_mus'] = max_error_estimate_mus = test_mus[np.argmax(error_estimates, axis=0)]
+        result['max_error_estimate_mus'] = max_error_estimate_mus = \
+            _select_mus(test_mus, np.argmax(error_estimates, axis=0))
         summary.append(('maximum estimated error',
                         f'{max_error_estimates[-1]:.7e} (mu = {max_error_estimate_mus[-1]})'))
 
     if error_estimator and error_norms:
         result['effectivities'] = effectivities = errors[:, error_estimator_norm_index, :] / error_estimates
         result['max_effectivities'] = max_effectivities = np.max(effectivities, axis=0)
-        result['max_effectivity_mus'] = max_effectivity_mus = test_mus[np.argmax(effectivities, axis=0)]
+        result['max_effectivity_mus'] = max_effectivity_mus = _select_mus(test_mus, np.argmax(effectivities, axis=0))
         result['min_effectivities'] = min_effectivities = np.min(effectivities, axis=0)
-        result['min_effectivity_mus'] = min_effectivity_mus = test_mus[np.argmin(effectivities, axis=0)]
+        result['min_effectivity_mus'] = min_effectivity_mus = _select_mus(test_mus, np.argmin(effectivities, axis=0))
         summary.append(('minimum error estimator effectivity',
                         f'{min_effectivities[-1]:.7e} (mu = {min_effectivity_mus[-1]})'))
         summary.append(('maximum error estimator effectivity',
@@ -236,7 +247,7 @@ def reduction_error_analysis(rom, fom, reductor, test_mus,
     if condition:
         result['conditions'] = conditions = np.array(conditions)
         result['max_conditions'] = max_conditions = np.max(conditions, axis=0)
-        result['max_condition_mus'] = max_condition_mus = test_mus[np.argmax(conditions, axis=0)]
+        result['max_condition_mus'] = max_condition_mus = _select_mus(test_mus, np.argmax(conditions, axis=0))
         summary.append(('maximum system matrix condition',
                         f'{max_conditions[-1]:.7e} (mu = {max_condition_mus[-1]})'))
 
@@ -244,7 +255,8 @@ def reduction_error_analysis(rom, fom, reductor, test_mus,
         result['custom_names'] = custom_names
         result['custom_values'] = custom_values = np.array(custom_values)
         result['max_custom_values'] = max_custom_values = np.max(custom_values, axis=0)
-        result['max_custom_values_mus'] = max_custom_values_mus = test_mus[np.argmax(custom_values, axis=0)]
+        result['max_custom_values_mus'] = max_custom_values_mus = \
+            _select_mus(test_mus, np.argmax(custom_values, axis=0))
         for i, (value, mu) in enumerate(zip(max_custom_values[:, -1], max_custom_values_mus[:, -1])):
             summary.append((f'maximum {custom_names[i]}',
                             f'{value:.7e} (mu = {mu})'))
@@ -386,19 +398,24 @@ def plot_reduction_error_analysis(result, max_basis_size=None, plot_effectivitie
     plt.show()
 
 
-def _compute_errors(mu, fom, reductor, error_estimator, error_norms, condition, custom, basis_sizes):
-    import sys
+def _select_mus(mus, ind):
+    if not isinstance(mus, MuArray):
+        return mus[ind]
+    selected = np.empty(ind.shape, dtype=object)
+    for i, j in enumerate(ind.flat):
+        selected.flat[i] = mus[j]
+    return selected
 
-    print('.', end='')
-    sys.stdout.flush()
 
+def _compute_errors(mu, fom, reductor, roms, error_estimator, error_norms, condition, custom, basis_sizes):
     error_estimates = np.empty(len(basis_sizes)) if error_estimator else None
     norms = np.empty(len(error_norms))
     errors = np.empty((len(error_norms), len(basis_sizes)))
     conditions = np.empty(len(basis_sizes)) if condition else None
     custom_values = np.empty((len(custom), len(basis_sizes)))
 
-    if fom:
+    if fom and error_norms:
+        # fom.solve makes use of the solution cache of fom, if enabled
         logging_disabled = fom.logging_disabled
         fom.disable_logging()
         U = fom.solve(mu)
@@ -408,18 +425,18 @@ def _compute_errors(mu, fom, reductor, error_estimator, error_norms, condition,
             n = n[0] if hasattr(n, '__len__') else n
             norms[i_norm] = n
 
-    for i_N, N in enumerate(basis_sizes):
-        rom = reductor.reduce(dims={k: N for k in reductor.bases})
+    for i_N, (N, rom) in enumerate(zip(basis_sizes, roms)):
         result = rom.compute(solution=True, solution_error_estimate=error_estimator, mu=mu)
         u = result['solution']
         if error_estimator:
             e = result['solution_error_estimate']
             e = e[0] if hasattr(e, '__len__') else e
             error_estimates[i_N] = e
-        if fom and reductor:
+        if fom and reductor and error_norms:
             URB = reductor.reconstruct(u)
+            URB -= U
             for i_norm, norm in enumerate(error_norms):
-                e = norm(U - URB)
+                e = norm(URB)
                 e = e[0] if hasattr(e, '__len__') else e
                 errors[i_norm, i_N] = e
         if condition:
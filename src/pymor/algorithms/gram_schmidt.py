@@ -3,6 +3,7 @@
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 
 import numpy as np
+import scipy.linalg as spla
 
 from pymor.core.defaults import defaults
 from pymor.core.exceptions import AccuracyError
@@ -122,6 +123,185 @@ def gram_schmidt(A, product=None, return_R=False, atol=1e-13, rtol=1e-13, offset
         return A
 
 
+@defaults('atol', 'rtol', 'block_size', 'reiterate', 'reiteration_threshold', 'cond_threshold', 'check', 'check_tol')
+def block_gram_schmidt(A, product=None, return_R=False, atol=1e-13, rtol=1e-13, offset=0, block_size=64,
+                       reiterate=True, reiteration_threshold=9e-1, cond_threshold=1e4, check=True, check_tol=1e-3,
+                       copy=True):
+    """Orthonormalize a |VectorArray| using the block classical Gram-Schmidt algorithm.
+
+    The vectors in `A` are processed in blocks of `block_size` vectors. Each block is
+    orthogonalized against all previously computed basis vectors using block classical
+    Gram-Schmidt with reorthogonalization (BCGS2), i.e., using
+    :meth:`~pymor.vectorarrays.interface.VectorArray.inner` and
+    :meth:`~pymor.vectorarrays.interface.VectorArray.lincomb` on entire blocks.
+    Afterwards, the block is orthonormalized using CholeskyQR2. If the block is too
+    ill-conditioned for CholeskyQR2 or contains linearly dependent vectors, the block is
+    orthonormalized using :func:`gram_schmidt` instead.
+
+    In contrast to :func:`gram_schmidt`, the number of operations on the
+    |VectorArray| only grows linearly with the number of blocks, which makes this
+    algorithm considerably faster for large arrays and reduces communication for
+    distributed |VectorArrays|.
+
+    Parameters
+    ----------
+    A
+        The |VectorArray| which is to be orthonormalized.
+    product
+        The inner product |Operator| w.r.t. which to orthonormalize.
+        If `None`, the Euclidean product is used.
+    return_R
+        If `True`, the R matrix from QR decomposition is returned.
+    atol
+        Vectors of norm smaller than `atol` are removed from the array.
+    rtol
+        Relative tolerance used to detect linear dependent vectors
+        (which are then removed from the array).
+    offset
+        Assume that the first `offset` vectors are already orthonormal and start the
+        algorithm at the `offset + 1`-th vector.
+    block_size
+        Number of vectors which are orthonormalized at once.
+    reiterate
+        If `True`, orthogonalize a block again if the norm of one of its orthogonalized
+        vectors is much smaller than the norm of the original vector.
+    reiteration_threshold
+        If `reiterate` is `True`, re-orthogonalize if the ratio between the norms of
+        the orthogonalized vector and the original vector is smaller than this value.
+    cond_threshold
+        If the estimated condition number of an orthogonalized block is larger than this
+        value, :func:`gram_schmidt` is used instead of CholeskyQR2.
+    check
+        If `True`, check if the resulting |VectorArray| is really orthonormal.
+    check_tol
+        Tolerance for the check.
+    copy
+        If `True`, create a copy of `A` instead of modifying `A` in-place.
+
+    Returns
+    -------
+    Q
+        The orthonormalized |VectorArray|.
+    R
+        The upper-triangular/trapezoidal matrix (if `compute_R` is `True`).
+    """
+    assert block_size > 0
+
+    logger = getLogger('pymor.algorithms.gram_schmidt.block_gram_schmidt')
+
+    Q = A.empty(reserve=len(A))
+    Q.append(A[:offset])
+    R = np.eye(len(A))
+    kept = list(range(offset))  # indices of the vectors in A which have been added to Q
+
+    for start in range(offset, len(A), block_size):
+        ind = np.arange(start, min(start + block_size, len(A)))
+        X = A[ind].copy(deep=True)
+
+        # remove vectors of small norm
+        initial_norms = X.norm(product)
+        small = initial_norms <= atol
+        for i in ind[small]:
+            logger.info(f"Removing vector {i} of norm {initial_norms[i - start]}")
+        if np.any(small):
+            X = X[np.flatnonzero(~small)].copy()
+            ind, initial_norms = ind[~small], initial_norms[~small]
+
+        # orthogonalize block against Q
+        norms = initial_norms
+        while len(Q) > 0 and len(X) > 0:
+            C = Q.inner(X, product)
+            X.axpy(-1, Q.lincomb(C.T))
+            R = R.astype(np.promote_types(R.dtype, C.dtype), copy=False)
+            R[np.ix_(kept, ind)] += C
+
+            old_norms, norms = norms, X.norm(product)
+
+            # remove vectors which got too small
+            dependent = norms <= rtol * initial_norms
+            for i in ind[dependent]:
+                logger.info(f"Removing linearly dependent vector {i}")
+            if np.any(dependent):
+                X = X[np.flatnonzero(~dependent)].copy()
+                ind, initial_norms = ind[~dependent], initial_norms[~dependent]
+                norms, old_norms = norms[~dependent], old_norms[~dependent]
+
+            # check if reorthogonalization should be done
+            if reiterate and np.any(norms < reiteration_threshold * old_norms):
+                logger.info(f"Orthogonalizing block {start // block_size} again")
+            else:
+                break
+
+        if len(X) == 0:
+            continue
+
+        # orthonormalize block using CholeskyQR2
+        result = _cholesky_qr2(X, product, cond_threshold)
+        if result is None:
+            # fall back to vector-wise orthonormalization, which also makes sure that the
+            # vectors stay orthogonal to Q after normalization
+            logger.info(f"Block {start // block_size} is ill-conditioned, using gram_schmidt")
+            len_Q = len(Q)
+            Q.append(X, remove_from_other=True)
+            Q, RX = gram_schmidt(Q, product=product, return_R=True, atol=atol, rtol=rtol, offset=len_Q,
+                                 reiterate=reiterate, reiteration_threshold=reiteration_threshold,
+                                 check=False, copy=False)
+            RX = RX[:, len_Q:]
+            # each row of the R factor returned by gram_schmidt starts at the diagonal
+            # entry of the corresponding kept vector
+            new = [ind[np.flatnonzero(row)[0]] for row in RX[len_Q:]]
+            R = R.astype(np.promote_types(R.dtype, RX.dtype), copy=False)
+            R[np.ix_(kept, ind)] += RX[:len_Q]
+            R[np.ix_(new, ind)] = RX[len_Q:]
+        else:
+            X, RX = result
+            new = list(ind)
+            R = R.astype(np.promote_types(R.dtype, RX.dtype), copy=False)
+            R[np.ix_(new, ind)] = RX
+            Q.append(X, remove_from_other=True)
+        kept.extend(new)
+
+    R = R[kept]
+
+    if check:
+        error_matrix = Q[offset:len(Q)].inner(Q, product)
+        error_matrix[:len(Q) - offset, offset:len(Q)] -= np.eye(len(Q) - offset)
+        if error_matrix.size > 0:
+            err = np.max(np.abs(error_matrix))
+            if err >= check_tol:
+                raise AccuracyError(f"result not orthogonal (max err={err})")
+
+    if not copy:
+        del A[:]
+        A.append(Q, remove_from_other=True)
+        Q = A
+
+    if return_R:
+        return Q, R
+    else:
+        return Q
+
+
+def _cholesky_qr2(X, product, cond_threshold):
+    """Orthonormalize `X` using CholeskyQR2.
+
+    Returns the orthonormalized |VectorArray| and the R factor, or `None` if the
+    Cholesky factorization fails or the estimated condition number of `X` exceeds
+    `cond_threshold`.
+    """
+    R = np.eye(len(X))
+    for _ in range(2):
+        try:
+            R_step = spla.cholesky(X.gramian(product))
+        except spla.LinAlgError:
+            return None
+        if np.linalg.cond(R_step) > cond_threshold:
+            return None
+        X = X.lincomb(spla.solve_triangular(R_step, np.eye(len(X))).T)
+        R = R_step @ R
+    return X, R
+
+
 def gram_schmidt_biorth(V, W, product=None,
                         reiterate=True, reiteration_threshold=1e-1, check=True, check_tol=1e-3,
                         copy=True):
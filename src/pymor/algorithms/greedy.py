@@ -2,6 +2,7 @@
 # Copyright pyMOR developers and contributors. All rights reserved.
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 
+import heapq
 import time
 
 import numpy as np
@@ -9,11 +10,14 @@ import numpy as np
 from pymor.core.base import BasicObject, abstractmethod
 from pymor.core.exceptions import ExtensionError
 from pymor.core.logger import getLogger
+from pymor.models.basic import StationaryModel
 from pymor.parallel.dummy import dummy_pool
 from pymor.parallel.interface import RemoteObject
+from pymor.parameters.base import MuArray
 
 
-def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=None, pool=None):
+def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=None, pool=None,
+                saturation_constant=None):
     """Weak greedy basis generation algorithm :cite:`BCDDPW11`.
 
     This algorithm generates an approximation basis for a given set of vectors
@@ -25,6 +29,17 @@ def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=No
     The constructed basis is extracted from the surrogate after termination
     of the algorithm.
 
+    If a `saturation_constant` C is given, the lazy variant of the algorithm
+    is used :cite:`HSZ14`: assuming that the surrogate satisfies the saturation
+    assumption, i.e., that after each extension the surrogate value for any
+    parameter grows at most by the factor C, a surrogate value computed k
+    extensions ago, multiplied by C^k, is an upper bound for the current value.
+    These bounds are kept in a max-heap, and only the parameters whose bound
+    exceeds the largest current surrogate value found so far are re-evaluated.
+    To this end, the surrogate is first evaluated for the `len(pool)` parameters
+    with the largest bounds and then, at once, for all parameters whose bound
+    exceeds the largest value obtained.
+
     Parameters
     ----------
     surrogate
@@ -32,6 +47,7 @@ def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=No
         for the approximation error.
     training_set
         The set of parameter samples on which to perform the greedy search.
+        Can be given as a |MuArray|.
     atol
         If not `None`, stop the algorithm if the maximum (estimated) error
         on the training set drops below this value.
@@ -44,6 +60,10 @@ def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=No
     pool
         If not `None`, a |WorkerPool| to use for parallelization. Parallelization
         needs to be supported by `surrogate`.
+    saturation_constant
+        If not `None`, use the lazy variant of the algorithm with this
+        saturation constant (see above). A value of 1 corresponds to a
+        surrogate which is non-increasing w.r.t. basis extensions.
 
     Returns
     -------
@@ -52,16 +72,20 @@ def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=No
         :max_errs:               Sequence of maximum estimated errors during the greedy run.
         :max_err_mus:            The parameters corresponding to `max_errs`.
         :extensions:             Number of performed basis extensions.
+        :evaluations:            Total number of parameters for which the surrogate
+                                 has been evaluated.
         :time:                   Total runtime of the algorithm.
     """
+    assert saturation_constant is None or saturation_constant > 0
     logger = getLogger('pymor.algorithms.greedy.weak_greedy')
-    training_set = list(training_set)
+    if not isinstance(training_set, MuArray):
+        training_set = list(training_set)
     logger.info(f'Started greedy search on training set of size {len(training_set)}.')
 
     tic = time.perf_counter()
     if not training_set:
         logger.info('There is nothing else to do for an empty training set.')
-        return {'max_errs': [], 'max_err_mus': [], 'extensions': 0,
+        return {'max_errs': [], 'max_err_mus': [], 'extensions': 0, 'evaluations': 0,
                 'time': time.perf_counter() - tic}
 
     if pool is None:
@@ -70,16 +94,28 @@ def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=No
         logger.info(f'Using pool of {len(pool)} workers for parallel greedy search.')
 
     # Distribute the training set evenly among the workers.
-    if pool:
+    # In the lazy variant, subsets of the training set are evaluated instead.
+    num_mus = len(training_set)
+    if pool and saturation_constant is None:
         training_set = pool.scatter_list(training_set)
 
     extensions = 0
+    evaluations = 0
     max_errs = []
     max_err_mus = []
+    heap = []
 
     while True:
         with logger.block('Estimating errors ...'):
-            max_err, max_err_mu = surrogate.evaluate(training_set)
+            if saturation_constant is None:
+                max_err, max_err_mu = surrogate.evaluate(training_set)
+                evaluations += num_mus
+            else:
+                max_err, max_err_mu, num_evaluations = _lazy_evaluate(surrogate, training_set, heap,
+                                                                      saturation_constant, extensions,
+                                                                      len(pool) if pool else 1)
+                logger.info(f'Evaluated surrogate for {num_evaluations} of {num_mus} parameters.')
+                evaluations += num_evaluations
             max_errs.append(max_err)
             max_err_mus.append(max_err_mu)
 
@@ -110,7 +146,46 @@ def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=No
     tictoc = time.perf_counter() - tic
     logger.info(f'Greedy search took {tictoc} seconds')
     return {'max_errs': max_errs, 'max_err_mus': max_err_mus, 'extensions': extensions,
-            'time': tictoc}
+            'evaluations': evaluations, 'time': tictoc}
+
+
+def _lazy_evaluate(surrogate, training_set, heap, saturation_constant, extensions, batch_size):
+    # The heap contains for each parameter a tuple (key, index, k, err), where err is the
+    # surrogate value computed after k extensions and key = k*log(C) - log(err). The current
+    # bound err * C^(extensions - k) decreases with key, so the largest bound is on top.
+    log_c = np.log(saturation_constant)
+
+    def entries(indices, errs):
+        with np.errstate(divide='ignore'):
+            keys = extensions * log_c - np.log(errs)
+        return [(key, i, extensions, err) for key, i, err in zip(keys, indices, errs)]
+
+    def bound(entry):
+        _, _, k, err = entry
+        return err * saturation_constant**(extensions - k)
+
+    if not heap:
+        heap.extend(entries(range(len(training_set)), surrogate.evaluate(training_set, return_all_values=True)))
+        heapq.heapify(heap)
+        num_evaluations = len(training_set)
+    else:
+        num_evaluations = 0
+        max_err = 0.
+        # re-evaluate until the largest bound is a current surrogate value: first the
+        # batch_size largest bounds, then all bounds exceeding the largest current value
+        while heap[0][2] < extensions:
+            indices = []
+            while (heap and heap[0][2] < extensions
+                   and (len(indices) < batch_size or num_evaluations and bound(heap[0]) > max_err)):
+                indices.append(heapq.heappop(heap)[1])
+            errs = surrogate.evaluate([training_set[i] for i in indices], return_all_values=True)
+            for entry in entries(indices, errs):
+                heapq.heappush(heap, entry)
+            max_err = max(max_err, np.max(errs))
+            num_evaluations += len(indices)
+
+    _, max_err_ind, _, max_err = heap[0]
+    return max_err, training_set[max_err_ind], num_evaluations
 
 
 class WeakGreedySurrogate(BasicObject):
@@ -142,7 +217,8 @@ class WeakGreedySurrogate(BasicObject):
 
 
 def rb_greedy(fom, reductor, training_set, use_error_estimator=True, error_norm=None,
-              atol=None, rtol=None, max_extensions=None, extension_params=None, pool=None):
+              atol=None, rtol=None, max_extensions=None, extension_params=None, pool=None,
+              saturation_constant=None):
     """Weak Greedy basis generation using the RB approximation error as surrogate.
 
     This algorithm generates a reduced basis using the :func:`weak greedy <weak_greedy>`
@@ -185,6 +261,8 @@ def rb_greedy(fom, reductor, training_set, use_error_estimator=True, error_norm=
         problems.
     pool
         See :func:`weak_greedy`.
+    saturation_constant
+        See :func:`weak_greedy`.
 
     Returns
     -------
@@ -195,11 +273,14 @@ def rb_greedy(fom, reductor, training_set, use_error_estimator=True, error_norm=
         :max_errs:               Sequence of maximum errors during the greedy run.
         :max_err_mus:            The parameters corresponding to `max_errs`.
         :extensions:             Number of performed basis extensions.
+        :evaluations:            Total number of parameters for which the error
+                                 has been estimated.
         :time:                   Total runtime of the algorithm.
     """
     surrogate = RBSurrogate(fom, reductor, use_error_estimator, error_norm, extension_params, pool or dummy_pool)
 
-    result = weak_greedy(surrogate, training_set, atol=atol, rtol=rtol, max_extensions=max_extensions, pool=pool)
+    result = weak_greedy(surrogate, training_set, atol=atol, rtol=rtol, max_extensions=max_extensions,
+                         pool=pool, saturation_constant=saturation_constant)
     result['rom'] = surrogate.rom
 
     return result
@@ -266,15 +347,19 @@ def _rb_surrogate_evaluate(rom=None, fom=None, reductor=None, mus=None, error_no
         else:
             return -1., None
 
-    if fom is None:
-        errors = [rom.estimate_error(mu) for mu in mus]
-    elif error_norm is not None:
-        errors = [error_norm(fom.solve(mu) - reductor.reconstruct(rom.solve(mu))) for mu in mus]
+    if fom is None and isinstance(rom, StationaryModel):
+        # solve the ROM and estimate the errors for all mus at once
+        errors = rom.estimate_error_batch(mus)
     else:
-        errors = [(fom.solve(mu) - reductor.reconstruct(rom.solve(mu))).norm() for mu in mus]
-    # most error_norms will return an array of length 1 instead of a number,
-    # so we extract the numbers if necessary
-    errors = [x[0] if hasattr(x, '__len__') else x for x in errors]
+        if fom is None:
+            errors = [rom.estimate_error(mu) for mu in mus]
+        elif error_norm is not None:
+            errors = [error_norm(fom.solve(mu) - reductor.reconstruct(rom.solve(mu))) for mu in mus]
+        else:
+            errors = [(fom.solve(mu) - reductor.reconstruct(rom.solve(mu))).norm() for mu in mus]
+        # most error_norms will return an array of length 1 instead of a number,
+        # so we extract the numbers if necessary
+        errors = [x[0] if hasattr(x, '__len__') else x for x in errors]
     if return_all_values:
         return errors
     else:
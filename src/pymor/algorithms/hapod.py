@@ -8,7 +8,9 @@ from math import ceil
 import numpy as np
 from threading import Thread
 
+from pymor.algorithms.incremental_svd import IncrementalSVD
 from pymor.algorithms.pod import pod
+from pymor.core.defaults import defaults
 from pymor.core.logger import getLogger
 from pymor.tools.random import spawn_rng
 
@@ -131,6 +133,26 @@ def default_pod_method(U, eps, is_root_node, product):
                orth_tol=None if is_root_node else np.inf)
 
 
+@defaults('chunk_size')
+def incremental_svd_pod_method(U, eps, is_root_node, product, chunk_size=64):
+    """`pod_method` for :func:`hapod` based on an incremental SVD.
+
+    The POD of `U` is computed by updating an
+    :class:`~pymor.algorithms.incremental_svd.IncrementalSVD` with
+    chunks of `chunk_size` vectors of `U`. In contrast to
+    :func:`default_pod_method`, only the Gramians of the current modes
+    and a single chunk have to be computed. Singular values are truncated
+    relative to the largest singular value according to the default `rtol`
+    of :class:`~pymor.algorithms.incremental_svd.IncrementalSVD`. Use
+    `functools.partial` to specify `chunk_size`.
+    """
+    isvd = IncrementalSVD(U.space, product=product, atol=0., l2_err=eps,
+                          orth_tol=None if is_root_node else np.inf)
+    for i in range(0, len(U), chunk_size):
+        isvd.update(U[i:i+chunk_size])
+    return isvd.modes, isvd.svals
+
+
 def hapod(tree, snapshots, local_eps, product=None, pod_method=default_pod_method,
           executor=None, eval_snapshots_in_executor=False):
     """Compute the Hierarchical Approximate POD.
@@ -0,0 +1,217 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+"""Incremental SVD of |VectorArrays| which are given in chunks."""
+
+import numpy as np
+import scipy.linalg as spla
+
+from pymor.algorithms.gram_schmidt import gram_schmidt
+from pymor.core.base import BasicObject
+from pymor.core.defaults import defaults
+from pymor.operators.interface import Operator
+from pymor.vectorarrays.interface import VectorArray, VectorSpace
+
+
+class IncrementalSVD(BasicObject):
+    """Incremental truncated SVD of a stream of snapshot vectors.
+
+    Maintains the left singular vectors and singular values of the matrix
+    of all snapshot vectors passed to :meth:`update` so far, where the inner
+    product on R^(`dim`) is given by `product`. New snapshots are incorporated
+    by rank-k updates as described in :cite:`Bra06`: the snapshots are split
+    into their components in the span of the current modes and an
+    orthogonal residual, and the modes are updated using the SVD of a small
+    core matrix. After each update, the modes are truncated according to
+    `modes`, `rtol`, `atol` and `l2_err`. Residual components at the level
+    of round-off errors are always discarded.
+
+    Only the current modes and the snapshots of a single update have to be
+    held in memory. The right singular vectors are not computed.
+
+    Parameters
+    ----------
+    space
+        The |VectorSpace| of the snapshot vectors.
+    product
+        Inner product |Operator| w.r.t. which the SVD is computed.
+    modes
+        If not `None`, at most `modes` singular vectors are kept.
+    rtol
+        Singular values smaller than this value multiplied by the
+        largest singular value are discarded.
+    atol
+        Singular values smaller than this value are discarded.
+    l2_err
+        Only discard singular values as long as the l2-approximation error
+        of all snapshot vectors, accumulated over all updates, is bounded
+        by this value, i.e. the sum of the squares of all discarded singular
+        values is at most `l2_err**2`.
+    orth_tol
+        The modes are reorthogonalized if the orthogonality error is
+        above this value.
+
+    Attributes
+    ----------
+    modes
+        |VectorArray| of the current left singular vectors.
+    svals
+        One-dimensional |NumPy array| of the current singular values.
+    snapshot_count
+        The total number of snapshot vectors passed to :meth:`update`.
+    error
+        Square root of the sum of the squares of all discarded singular
+        values. This is an upper bound for the l2-approximation error of all
+        snapshot vectors by their projections onto the span of `modes`.
+    """
+
+    @defaults('rtol', 'atol', 'l2_err', 'orth_tol')
+    def __init__(self, space, product=None, modes=None, rtol=1e-7, atol=0., l2_err=0., orth_tol=1e-10):
+        assert isinstance(space, VectorSpace)
+        assert product is None or isinstance(product, Operator)
+        self.space = space
+        self.product = product
+        self.max_modes = modes
+        self.rtol = rtol
+        self.atol = atol
+        self.l2_err = l2_err
+        self.orth_tol = orth_tol
+        self.modes = space.empty()
+        self.svals = np.array([])
+        self.snapshot_count = 0
+        self._discarded = 0.
+
+    @property
+    def error(self):
+        return np.sqrt(self._discarded)
+
+    def update(self, U):
+        """Incorporate the snapshot vectors in the |VectorArray| `U`."""
+        assert U in self.space
+        if len(U) == 0:
+            return
+        self.snapshot_count += len(U)
+        product, Q, s = self.product, self.modes, self.svals
+
+        with self.logger.block(f'Updating SVD with {len(U)} vectors ...'):
+            # split U into components in span(Q) and the residual R, orthogonalizing twice
+            if len(Q) > 0:
+                C = Q.inner(U, product)
+                R = U - Q.lincomb(C.T)
+                PR = product.apply(R) if product else R
+                C2 = Q.inner(PR)
+                R.axpy(-1, Q.lincomb(C2.T))
+                PR = product.apply(R) if product else R
+                C += C2
+            else:
+                C = np.zeros((0, len(U)))
+                R = U
+                PR = product.apply(R) if product else R
+
+            # orthonormal basis Q_R of the residual with R = Q_R diag(s_R) Vh_R via the method
+            # of snapshots; residual components below the truncation tolerance are discarded,
+            # as are components at the level of the round-off errors of the eigenvalues,
+            # which would yield non-orthonormal modes
+            G = R.inner(PR)
+            evals, V = spla.eigh(G)
+            evals, V = evals[::-1], V[:, ::-1]
+            scale = max(evals[0], s[0]**2 if len(s) else 0., np.max(U.norm2(product)))
+            eps = np.finfo(G.dtype).eps
+            noise = max(len(U) * eps * evals[0], (10 * (len(Q) + len(U)) * eps)**2 * scale)
+            tol = max(self.rtol**2 * scale, self.atol**2, noise)
+            r = np.count_nonzero(evals > max(tol, 0.))
+            self._discarded += max(np.trace(G).real - np.sum(evals[:r]), 0.)
+            s_R = np.sqrt(evals[:r])
+            Q_R = R.lincomb((V[:, :r] / s_R).T)
+            Vh_R = V[:, :r].T.conj()
+
+            # SVD of the core matrix [[diag(s), C], [0, diag(s_R) Vh_R]]
+            k = len(Q)
+            K = np.zeros((k + r, k + len(U)), dtype=np.promote_types(C.dtype, Vh_R.dtype))
+            K[:k, :k] = np.diag(s)
+            K[:k, k:] = C
+            K[k:, k:] = s_R[:, np.newaxis] * Vh_R
+            U_K, s_K = spla.svd(K, full_matrices=False, lapack_driver='gesvd')[:2]
+
+            selected_modes = self._select_modes(s_K)
+            self._discarded += np.sum(s_K[selected_modes:]**2)
+            U_K = U_K[:, :selected_modes]
+
+            modes = Q.lincomb(U_K[:k].T)
+            modes.axpy(1, Q_R.lincomb(U_K[k:].T))
+            self.modes, self.svals = modes, s_K[:selected_modes]
+
+        # the modes are orthonormal if [Q, Q_R] is; as Q is already orthonormal,
+        # only Q_R needs to be checked, which does not require applying the product again
+        if len(modes) > 0 and r > 0 and np.isfinite(self.orth_tol):
+            PQ_R = PR.lincomb((V[:, :r] / s_R).T)
+            err = max(np.max(np.abs(Q.inner(PQ_R)), initial=0.),
+                      np.max(np.abs(Q_R.inner(PQ_R) - np.eye(r))))
+            if err >= self.orth_tol:
+                self.logger.info('Reorthogonalizing modes ...')
+                gram_schmidt(modes, product=product, atol=0., rtol=0., copy=False)
+
+    def _select_modes(self, s):
+        if len(s) == 0 or s[0] == 0.:
+            return 0
+        selected_modes = np.count_nonzero(s >= max(self.rtol * s[0], self.atol))
+        # the squared l2-errors when truncating after the first n modes
+        errs = np.concatenate((np.cumsum(s[::-1]**2)[::-1], [0.]))
+        below_err = np.flatnonzero(self._discarded + errs <= self.l2_err**2)
+        if len(below_err) > 0:
+            selected_modes = min(selected_modes, below_err[0])
+        if self.max_modes is not None:
+            selected_modes = min(selected_modes, self.max_modes)
+        return selected_modes
+
+
+@defaults('rtol', 'atol', 'l2_err', 'orth_tol')
+def incremental_svd(snapshots, space=None, product=None, modes=None, rtol=1e-7, atol=0., l2_err=0.,
+                    orth_tol=1e-10):
+    """Incremental SVD of snapshot vectors given in chunks.
+
+    See :class:`IncrementalSVD` for details.
+
+    Parameters
+    ----------
+    snapshots
+        An iterable of |VectorArrays| which are successively used to
+        update the SVD.
+    space
+        The |VectorSpace| of the snapshot vectors. If `None`, the space
+        of the first snapshot |VectorArray| is used.
+    product
+        Inner product |Operator| w.r.t. which the SVD is computed.
+    modes
+        If not `None`, at most `modes` singular vectors are computed.
+    rtol
+        Singular values smaller than this value multiplied by the
+        largest singular value are discarded.
+    atol
+        Singular values smaller than this value are discarded.
+    l2_err
+        Bound for the l2-approximation error of all snapshot vectors
+        by the computed modes, see :class:`IncrementalSVD`.
+    orth_tol
+        The modes are reorthogonalized if the orthogonality error is
+        above this value.
+
+    Returns
+    -------
+    modes
+        |VectorArray| of left singular vectors.
+    svals
+        One-dimensional |NumPy array| of singular values.
+    """
+    isvd = None
+    for U in snapshots:
+        assert isinstance(U, VectorArray)
+        if isvd is None:
+            isvd = IncrementalSVD(space or U.space, product=product, modes=modes, rtol=rtol, atol=atol,
+                                  l2_err=l2_err, orth_tol=orth_tol)
+        isvd.update(U)
+    if isvd is None:
+        assert space is not None
+        return space.empty(), np.array([])
+    return isvd.modes, isvd.svals
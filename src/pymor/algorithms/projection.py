@@ -15,7 +15,7 @@ from pymor.operators.numpy import NumpyMatrixOperator
 from pymor.vectorarrays.numpy import NumpyVectorSpace
 
 
-def project(op, range_basis, source_basis, product=None):
+def project(op, range_basis, source_basis, product=None, cache=None):
     """Petrov-Galerkin projection of a given |Operator|.
 
     Given an inner product `( ⋅, ⋅)`, source vectors `b_1, ..., b_N`
@@ -53,6 +53,14 @@ def project(op, range_basis, source_basis, product=None):
     product
         An |Operator| representing the inner product.  If `None`, the
         Euclidean inner product is chosen.
+    cache
+        If not `None`, a dict in which the projections of all linear non-parametric
+        |Operators| contained in `op` (e.g. the components of a |LincombOperator|)
+        are stored. When `project` is called again with the same `cache` and the
+        same `range_basis` and `source_basis` |VectorArrays|, which, in the
+        meantime, have only been extended by appending new vectors, only the
+        rows and columns of the projected matrices which correspond to the new
+        vectors are computed.
 
     Returns
     -------
@@ -62,10 +70,13 @@ def project(op, range_basis, source_basis, product=None):
     assert range_basis is None or range_basis in op.range
     assert product is None or product.source == product.range == op.range
 
-    rb = product.apply(range_basis) if product is not None and range_basis is not None else range_basis
+    if product is not None and range_basis is not None:
+        rb = _apply_product(product, range_basis, cache)
+    else:
+        rb = range_basis
 
     try:
-        return ProjectRules(rb, source_basis).apply(op)
+        return ProjectRules(rb, source_basis, cache).apply(op)
     except NoMatchingRuleError:
         op.logger.warning('Using inefficient generic projection operator')
         return ProjectedOperator(op, range_basis, source_basis, product)
@@ -74,10 +85,34 @@ def project(op, range_basis, source_basis, product=None):
 class ProjectRules(RuleTable):
     """|RuleTable| for the :func:`project` algorithm."""
 
-    def __init__(self, range_basis, source_basis):
+    def __init__(self, range_basis, source_basis, cache=None):
         super().__init__(use_caching=True)
         self.__auto_init(locals())
 
+    def _previous_projection(self, op):
+        """Return cached projection of `op` and the dimensions of the bases it was computed for."""
+        if self.cache is None:
+            return None, 0, 0
+        entry = self.cache.get((op.uid, self.range_basis is None, self.source_basis is None))
+        if entry is None:
+            return None, 0, 0
+        range_basis, source_basis, range_dim, source_dim, data = entry
+        if (range_basis is not self.range_basis or source_basis is not self.source_basis
+                or range_basis is not None and len(range_basis) < range_dim
+                or source_basis is not None and len(source_basis) < source_dim):
+            return None, 0, 0
+        return data, range_dim, source_dim
+
+    def _store_projection(self, op, data):
+        if self.cache is None:
+            return
+        range_basis, source_basis = self.range_basis, self.source_basis
+        self.cache[(op.uid, range_basis is None, source_basis is None)] = \
+            (range_basis, source_basis,
+             0 if range_basis is None else len(range_basis),
+             0 if source_basis is None else len(source_basis),
+             data)
+
     @match_always
     def action_no_bases(self, op):
         if self.range_basis is None and self.source_basis is None:
@@ -112,11 +147,17 @@ class ProjectRules(RuleTable):
     @match_generic(lambda op: op.linear and not op.parametric, 'linear and not parametric')
     def action_apply_basis(self, op):
         range_basis, source_basis = self.range_basis, self.source_basis
+        previous, range_dim, source_dim = self._previous_projection(op)
         if source_basis is None:
             try:
-                V = op.apply_adjoint(range_basis)
+                if previous is None:
+                    V = op.apply_adjoint(range_basis)
+                else:
+                    V = previous.copy()
+                    V.append(op.apply_adjoint(range_basis[range_dim:]))
             except NotImplementedError as e:
                 raise RuleNotMatchingError('apply_adjoint not implemented') from e
+            self._store_projection(op, V)
             if isinstance(op.source, NumpyVectorSpace):
                 from pymor.operators.numpy import NumpyMatrixOperator
                 return NumpyMatrixOperator(V.to_numpy(), source_id=op.source.id, name=op.name)
@@ -125,7 +166,12 @@ class ProjectRules(RuleTable):
                 return VectorArrayOperator(V, adjoint=True, name=op.name)
         else:
             if range_basis is None:
-                V = op.apply(source_basis)
+                if previous is None:
+                    V = op.apply(source_basis)
+                else:
+                    V = previous.copy()
+                    V.append(op.apply(source_basis[source_dim:]))
+                self._store_projection(op, V)
                 if isinstance(op.range, NumpyVectorSpace):
                     from pymor.operators.numpy import NumpyMatrixOperator
                     return NumpyMatrixOperator(V.to_numpy().T, range_id=op.range.id, name=op.name)
@@ -134,7 +180,12 @@ class ProjectRules(RuleTable):
                     return VectorArrayOperator(V, adjoint=False, name=op.name)
             else:
                 from pymor.operators.numpy import NumpyMatrixOperator
-                return NumpyMatrixOperator(op.apply2(range_basis, source_basis), name=op.name)
+                if previous is None:
+                    M = op.apply2(range_basis, source_basis)
+                else:
+                    M = _extend_projected_matrix(op, previous, range_basis, source_basis, range_dim, source_dim)
+                self._store_projection(op, M)
+                return NumpyMatrixOperator(M, name=op.name)
 
     @match_class(ConcatenationOperator)
     def action_ConcatenationOperator(self, op):
@@ -247,6 +298,39 @@ class ProjectRules(RuleTable):
         return QuadraticFunctional(project(op.operator, self.source_basis, self.source_basis), name=op.name)
 
 
+def _apply_product(product, range_basis, cache):
+    if cache is None:
+        return product.apply(range_basis)
+    key = (product.uid,)
+    entry = cache.get(key)
+    if entry is None or entry[0] is not range_basis or len(range_basis) < entry[1]:
+        rb = product.apply(range_basis)
+    else:
+        rb = entry[2]
+        # the projected operators do not keep references to rb, so we can extend it in-place
+        rb.append(product.apply(range_basis[entry[1]:]))
+    cache[key] = (range_basis, len(range_basis), rb)
+    return rb
+
+
+def _extend_projected_matrix(op, M, range_basis, source_basis, range_dim, source_dim):
+    """Extend `M == op.apply2(range_basis[:range_dim], source_basis[:source_dim])` to full bases."""
+    if range_dim == len(range_basis) and source_dim == len(source_basis):
+        return M
+    # new columns for the old range basis vectors
+    right = op.apply2(range_basis[:range_dim], source_basis[source_dim:])
+    # new rows for all source basis vectors
+    new_range_basis = range_basis[range_dim:]
+    if len(new_range_basis) == 0:
+        bottom = np.zeros((0, len(source_basis)), dtype=right.dtype)
+    else:
+        try:
+            bottom = op.apply_adjoint(new_range_basis).inner(source_basis)
+        except NotImplementedError:
+            bottom = op.apply2(new_range_basis, source_basis)
+    return np.vstack([np.hstack([M, right]), bottom])
+
+
 def project_to_subbasis(op, dim_range=None, dim_source=None):
     """Project already projected |Operator| to a subbasis.
 
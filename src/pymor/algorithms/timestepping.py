@@ -15,9 +15,20 @@ common interface that has to be fulfilled by the time-steppers used
 by |InstationaryModel|. The classes :class:`ExplicitEulerTimeStepper`
 and :class:`ImplicitEulerTimeStepper` encapsulate :func:`explicit_euler` and
 :func:`implicit_euler` to provide this interface.
+
+Using :meth:`TimeStepper.iterate`, the solution trajectory can be processed
+time step by time step without storing it as a whole.
+
+In addition to these fixed-step methods, the :class:`EmbeddedRungeKuttaTimeStepper`
+for non-stiff and the :class:`SDIRKTimeStepper` for stiff problems choose the
+time-step size adaptively based on local error estimates.
 """
 
-from pymor.core.base import ImmutableObject, abstractmethod
+import numpy as np
+
+from pymor.core.base import ImmutableObject
+from pymor.core.exceptions import AccuracyError, InversionError
+from pymor.core.logger import getLogger
 from pymor.operators.interface import Operator
 from pymor.parameters.base import Mu
 from pymor.vectorarrays.interface import VectorArray
@@ -35,7 +46,6 @@ class TimeStepper(ImmutableObject):
     this interface.
     """
 
-    @abstractmethod
     def solve(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mu=None, num_values=None):
         """Apply time-stepper to the equation.
 
@@ -43,6 +53,8 @@ class TimeStepper(ImmutableObject):
 
             M * d_t u + A(u, mu, t) = F(mu, t).
 
+        The default implementation collects the vectors yielded by :meth:`iterate`.
+
         Parameters
         ----------
         initial_time
@@ -69,7 +81,96 @@ class TimeStepper(ImmutableObject):
         -------
         |VectorArray| containing the solution trajectory.
         """
-        pass
+        return _collect(operator.source, num_values,
+                        self.iterate(initial_time, end_time, initial_data, operator, rhs=rhs, mass=mass, mu=mu,
+                                     num_values=num_values))
+
+    def iterate(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mu=None,
+                num_values=None):
+        """Iterate over the solution trajectory of the equation.
+
+        Yields the same vectors as :meth:`solve` one after another as soon as
+        they have been computed, without storing the entire trajectory. This
+        allows to process long trajectories (e.g. to compute outputs or to
+        write them to disk) with constant memory requirements.
+
+        The default implementation iterates over the |VectorArray| returned by
+        :meth:`solve`. Implementations have to override at least one of both
+        methods.
+
+        Parameters
+        ----------
+        initial_time
+            The time at which to begin time-stepping.
+        end_time
+            The time until which to perform time-stepping.
+        initial_data
+            The solution vector at `initial_time`.
+        operator
+            The |Operator| A.
+        rhs
+            The right-hand side F (either |VectorArray| of length 1 or |Operator| with
+            `source.dim == 1`). If `None`, zero right-hand side is assumed.
+        mass
+            The |Operator| M. If `None`, the identity operator is assumed.
+        mu
+            |Parameter values| for which `operator` and `rhs` are evaluated. The current
+            time is added to `mu` with key `t`.
+        num_values
+            The number of yielded vectors of the solution trajectory. If `None`, each
+            intermediate vector that is calculated is yielded.
+
+        Yields
+        ------
+        t
+            The time of the current solution vector.
+        U
+            |VectorArray| of length 1 containing the solution at time `t`.
+        """
+        if type(self).solve is TimeStepper.solve:
+            raise NotImplementedError(f'{type(self).__name__} has to override solve or iterate')
+        U = self.solve(initial_time, end_time, initial_data, operator, rhs=rhs, mass=mass, mu=mu,
+                       num_values=num_values)
+        return zip(np.linspace(initial_time, end_time, len(U)), (U[i] for i in range(len(U))))
+
+    def solve_batch(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, num_values=None):
+        """Apply time-stepper to a batch of linear time-independent equations given by dense arrays.
+
+        Simultaneously solves the equations ::
+
+            M * d_t u_i + A_i u_i = F_i,
+
+        for `i = 0, ..., n-1`, where the states of all equations are stored as
+        rows of a single |NumPy array|, such that each time step amounts to a few
+        batched matrix-vector products.
+
+        The default implementation raises `NotImplementedError`.
+
+        Parameters
+        ----------
+        initial_time
+            The time at which to begin time-stepping.
+        end_time
+            The time until which to perform time-stepping.
+        initial_data
+            |NumPy array| of shape `(n, N)` of the initial values of all equations.
+        operator
+            |NumPy array| of shape `(n, N, N)` of the matrices A_i.
+        rhs
+            |NumPy array| of shape `(n, N)` of the right-hand sides F_i. If `None`,
+            zero right-hand sides are assumed.
+        mass
+            |NumPy array| of shape `(N, N)` of the mass matrix M. If `None`, the
+            identity matrix is assumed.
+        num_values
+            The number of returned vectors of each solution trajectory. If `None`,
+            each intermediate vector that is calculated is returned.
+
+        Returns
+        -------
+        |NumPy array| of shape `(n, num_values, N)` containing the solution trajectories.
+        """
+        raise NotImplementedError
 
 
 class ImplicitEulerTimeStepper(TimeStepper):
@@ -97,6 +198,15 @@ class ImplicitEulerTimeStepper(TimeStepper):
         return implicit_euler(operator, rhs, mass, initial_data, initial_time, end_time, self.nt, mu, num_values,
                               solver_options=self.solver_options)
 
+    def iterate(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mu=None,
+                num_values=None):
+        return _implicit_euler(operator, rhs, mass, initial_data, initial_time, end_time, self.nt, mu, num_values,
+                               solver_options=self.solver_options)
+
+    def solve_batch(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, num_values=None):
+        return _dense_linear_time_stepping_batch(operator, rhs, mass, initial_data, initial_time, end_time,
+                                                 self.nt, num_values, theta=1.)
+
 
 class ExplicitEulerTimeStepper(TimeStepper):
     """Explicit Euler time-stepper.
@@ -114,10 +224,17 @@ class ExplicitEulerTimeStepper(TimeStepper):
     def __init__(self, nt):
         self.__auto_init(locals())
 
-    def solve(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mu=None, num_values=None):
+    def iterate(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mu=None,
+                num_values=None):
+        if mass is not None:
+            raise NotImplementedError
+        return _explicit_euler(operator, rhs, initial_data, initial_time, end_time, self.nt, mu, num_values)
+
+    def solve_batch(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, num_values=None):
         if mass is not None:
             raise NotImplementedError
-        return explicit_euler(operator, rhs, initial_data, initial_time, end_time, self.nt, mu, num_values)
+        return _dense_linear_time_stepping_batch(operator, rhs, mass, initial_data, initial_time, end_time,
+                                                 self.nt, num_values, theta=0.)
 
 
 class ImplicitMidpointTimeStepper(TimeStepper):
@@ -147,6 +264,124 @@ class ImplicitMidpointTimeStepper(TimeStepper):
         return implicit_midpoint_rule(operator, rhs, mass, initial_data, initial_time, end_time,
                                       self.nt, mu, num_values, solver_options=self.solver_options)
 
+    def iterate(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mu=None,
+                num_values=None):
+        if not operator.linear:
+            raise NotImplementedError
+        return _implicit_midpoint_rule(operator, rhs, mass, initial_data, initial_time, end_time,
+                                       self.nt, mu, num_values, solver_options=self.solver_options)
+
+    def solve_batch(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, num_values=None):
+        return _dense_linear_time_stepping_batch(operator, rhs, mass, initial_data, initial_time, end_time,
+                                                 self.nt, num_values, theta=0.5)
+
+
+class EmbeddedRungeKuttaTimeStepper(TimeStepper):
+    """Adaptive explicit Runge-Kutta time-stepper.
+
+    Solves equations of the form ::
+
+        M * d_t u + A(u, mu, t) = F(mu, t).
+
+    The time-step size is controlled using the local error estimate given by
+    the difference of the solutions of an embedded pair of explicit Runge-Kutta
+    methods :cite:`HNW93` (Section II.4). A time step is accepted if the root
+    mean square of this estimate is below `atol + rtol * |u|`, where `|u|` is the
+    root mean square of the solution. Available methods are the Dormand-Prince
+    5(4) pair (`'dopri5'`) and the Bogacki-Shampine 3(2) pair (`'bs23'`).
+    As these methods are explicit, they are only suited for non-stiff problems.
+    For stiff problems, use :class:`SDIRKTimeStepper`.
+
+    If `num_values` is specified, the solution is evaluated at `num_values`
+    equidistant points in time using the fourth-order continuous extension of
+    the Dormand-Prince pair :cite:`HNW93` (Section II.6) and cubic Hermite
+    interpolation between the time steps for the Bogacki-Shampine pair. Otherwise,
+    the solution after each time step is returned, i.e. the returned vectors are
+    in general not equidistant in time.
+
+    Parameters
+    ----------
+    method
+        The embedded Runge-Kutta pair to use (`'dopri5'` or `'bs23'`).
+    rtol
+        The relative tolerance for the local error estimate.
+    atol
+        The absolute tolerance for the local error estimate.
+    initial_time_step
+        The size of the first time step. If `None`, a hundredth of the time
+        interval is used.
+    max_time_step
+        The maximum time-step size. If `None`, the time-step size is not
+        bounded.
+    """
+
+    def __init__(self, method='dopri5', rtol=1e-6, atol=1e-8, initial_time_step=None, max_time_step=None):
+        assert method in _EMBEDDED_RUNGE_KUTTA_METHODS
+        self.__auto_init(locals())
+
+    def iterate(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mu=None,
+                num_values=None):
+        return _embedded_runge_kutta(operator, rhs, mass, initial_data, initial_time, end_time, mu, num_values,
+                                     method=self.method, rtol=self.rtol, atol=self.atol,
+                                     initial_time_step=self.initial_time_step, max_time_step=self.max_time_step)
+
+
+class SDIRKTimeStepper(TimeStepper):
+    """Adaptive singly diagonally implicit Runge-Kutta time-stepper for stiff problems.
+
+    Solves equations of the form ::
+
+        M * d_t u + A(u, mu, t) = F(mu, t)
+
+    with linear A using the L-stable two-stage SDIRK method of order 2 by
+    Alexander :cite:`HW96` (Section IV.6). The time-step size is controlled
+    using the difference to the embedded first-order solution, which is filtered
+    by `(M + gamma*dt*A)^(-1) M` in order to remove the stiff error components
+    :cite:`HW96` (Section IV.8). A time step is accepted if the root mean square
+    of this estimate is below `atol + rtol * |u|`, where `|u|` is the root mean
+    square of the solution.
+
+    Both stages require the inversion of the same operator `M + gamma*dt*A`.
+    In order to be able to reuse its assembly (and factorization) for
+    time-independent A, the time-step size is kept when the step-size control
+    only suggests a small increase.
+
+    If `num_values` is specified, the solution is evaluated at `num_values`
+    equidistant points in time by cubic Hermite interpolation between the time
+    steps. Otherwise, the solution after each time step is returned, i.e. the
+    returned vectors are in general not equidistant in time.
+
+    Parameters
+    ----------
+    rtol
+        The relative tolerance for the local error estimate.
+    atol
+        The absolute tolerance for the local error estimate.
+    initial_time_step
+        The size of the first time step. If `None`, a hundredth of the time
+        interval is used.
+    max_time_step
+        The maximum time-step size. If `None`, the time-step size is not
+        bounded.
+    solver_options
+        The |solver_options| used to invert `M + gamma*dt*A`.
+        The special values `'mass'` and `'operator'` are
+        recognized, in which case the solver_options of
+        M (resp. A) are used.
+    """
+
+    def __init__(self, rtol=1e-4, atol=1e-6, initial_time_step=None, max_time_step=None,
+                 solver_options='operator'):
+        self.__auto_init(locals())
+
+    def iterate(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mu=None,
+                num_values=None):
+        if not operator.linear:
+            raise NotImplementedError
+        return _sdirk(operator, rhs, mass, initial_data, initial_time, end_time, mu, num_values,
+                      rtol=self.rtol, atol=self.atol, initial_time_step=self.initial_time_step,
+                      max_time_step=self.max_time_step, solver_options=self.solver_options)
+
 
 class DiscreteTimeStepper(TimeStepper):
     """Discrete time-stepper.
@@ -159,11 +394,20 @@ class DiscreteTimeStepper(TimeStepper):
     def __init__(self):
         pass
 
-    def solve(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mu=None, num_values=None):
-        return discrete(operator, rhs, mass, initial_data, initial_time, end_time, mu, num_values)
+    def iterate(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mu=None,
+                num_values=None):
+        return _discrete(operator, rhs, mass, initial_data, initial_time, end_time, mu, num_values)
 
 
 def implicit_euler(A, F, M, U0, t0, t1, nt, mu=None, num_values=None, solver_options='operator'):
+    U = _dense_linear_time_stepping(A, F, M, U0, t0, t1, nt, mu, num_values, solver_options, theta=1.)
+    if U is not None:
+        return U
+    return _collect(A.source, num_values or nt + 1,
+                    _implicit_euler(A, F, M, U0, t0, t1, nt, mu, num_values, solver_options))
+
+
+def _implicit_euler(A, F, M, U0, t0, t1, nt, mu=None, num_values=None, solver_options='operator'):
     assert isinstance(A, Operator)
     assert isinstance(F, (type(None), Operator, VectorArray))
     assert isinstance(M, (type(None), Operator))
@@ -195,8 +439,8 @@ def implicit_euler(A, F, M, U0, t0, t1, nt, mu=None, num_values=None, solver_opt
     assert U0 in A.source
     assert len(U0) == 1
 
-    R = A.source.empty(reserve=num_values)
-    R.append(U0)
+    yield t0, U0.copy()
+    num_yielded = 1
 
     options = (A.solver_options if solver_options == 'operator' else
                M.solver_options if solver_options == 'mass' else
@@ -219,13 +463,16 @@ def implicit_euler(A, F, M, U0, t0, t1, nt, mu=None, num_values=None, solver_opt
         if F:
             rhs += dt_F
         U = M_dt_A.apply_inverse(rhs, mu=mu, initial_guess=U)
-        while t - t0 + (min(dt, DT) * 0.5) >= len(R) * DT:
-            R.append(U)
-
-    return R
+        while t - t0 + (min(dt, DT) * 0.5) >= num_yielded * DT:
+            yield t, U
+            num_yielded += 1
 
 
 def explicit_euler(A, F, U0, t0, t1, nt, mu=None, num_values=None):
+    return _collect(A.source, num_values or nt + 1, _explicit_euler(A, F, U0, t0, t1, nt, mu, num_values))
+
+
+def _explicit_euler(A, F, U0, t0, t1, nt, mu=None, num_values=None):
     assert isinstance(A, Operator)
     assert F is None or isinstance(F, (Operator, VectorArray))
     assert A.source == A.range
@@ -252,8 +499,8 @@ def explicit_euler(A, F, U0, t0, t1, nt, mu=None, num_values=None):
 
     dt = (t1 - t0) / nt
     DT = (t1 - t0) / (num_values - 1)
-    R = A.source.empty(reserve=num_values)
-    R.append(U0)
+    yield t0, U0.copy()
+    num_yielded = 1
 
     t = t0
     U = U0.copy()
@@ -265,8 +512,9 @@ def explicit_euler(A, F, U0, t0, t1, nt, mu=None, num_values=None):
             t += dt
             mu = mu.with_(t=t)
             U.axpy(-dt, A.apply(U, mu=mu))
-            while t - t0 + (min(dt, DT) * 0.5) >= len(R) * DT:
-                R.append(U)
+            while t - t0 + (min(dt, DT) * 0.5) >= num_yielded * DT:
+                yield t, U.copy()
+                num_yielded += 1
     else:
         for n in range(nt):
             t += dt
@@ -274,13 +522,20 @@ def explicit_euler(A, F, U0, t0, t1, nt, mu=None, num_values=None):
             if F_time_dep:
                 F_ass = F.as_vector(mu)
             U.axpy(dt, F_ass - A.apply(U, mu=mu))
-            while t - t0 + (min(dt, DT) * 0.5) >= len(R) * DT:
-                R.append(U)
-
-    return R
+            while t - t0 + (min(dt, DT) * 0.5) >= num_yielded * DT:
+                yield t, U.copy()
+                num_yielded += 1
 
 
 def implicit_midpoint_rule(A, F, M, U0, t0, t1, nt, mu=None, num_values=None, solver_options='operator'):
+    U = _dense_linear_time_stepping(A, F, M, U0, t0, t1, nt, mu, num_values, solver_options, theta=0.5)
+    if U is not None:
+        return U
+    return _collect(A.source, num_values or nt + 1,
+                    _implicit_midpoint_rule(A, F, M, U0, t0, t1, nt, mu, num_values, solver_options))
+
+
+def _implicit_midpoint_rule(A, F, M, U0, t0, t1, nt, mu=None, num_values=None, solver_options='operator'):
     assert isinstance(A, Operator)
     assert isinstance(F, (type(None), Operator, VectorArray))
     assert isinstance(M, (type(None), Operator))
@@ -312,8 +567,8 @@ def implicit_midpoint_rule(A, F, M, U0, t0, t1, nt, mu=None, num_values=None, so
     assert U0 in A.source
     assert len(U0) == 1
 
-    R = A.source.empty(reserve=num_values)
-    R.append(U0)
+    yield t0, U0.copy()
+    num_yielded = 1
 
     if solver_options == 'operator':
         options = A.solver_options
@@ -343,13 +598,244 @@ def implicit_midpoint_rule(A, F, M, U0, t0, t1, nt, mu=None, num_values=None, so
         if F:
             rhs += dt_F
         U = M_dt_A_impl.apply_inverse(rhs, mu=mu)
-        while t - t0 + (min(dt, DT) * 0.5) >= len(R) * DT:
-            R.append(U)
+        while t - t0 + (min(dt, DT) * 0.5) >= num_yielded * DT:
+            yield t, U
+            num_yielded += 1
+
+
+_EMBEDDED_RUNGE_KUTTA_METHODS = {
+    # c, A, b, b_hat and the order of the embedded method of first-same-as-last Butcher tableaus,
+    # and, if available, the coefficients P of a continuous extension
+    # u(t + theta*h) = u(t) + h * sum_i b_i(theta) K_i with b_i(theta) = sum_j P[i, j] theta^(j+1)
+    'dopri5': (np.array([0., 1/5, 3/10, 4/5, 8/9, 1., 1.]),
+               np.array([[0., 0., 0., 0., 0., 0., 0.],
+                         [1/5, 0., 0., 0., 0., 0., 0.],
+                         [3/40, 9/40, 0., 0., 0., 0., 0.],
+                         [44/45, -56/15, 32/9, 0., 0., 0., 0.],
+                         [19372/6561, -25360/2187, 64448/6561, -212/729, 0., 0., 0.],
+                         [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656, 0., 0.],
+                         [35/384, 0., 500/1113, 125/192, -2187/6784, 11/84, 0.]]),
+               np.array([35/384, 0., 500/1113, 125/192, -2187/6784, 11/84, 0.]),
+               np.array([5179/57600, 0., 7571/16695, 393/640, -92097/339200, 187/2100, 1/40]),
+               4,
+               # fourth-order continuous extension :cite:`HNW93` (Section II.6)
+               np.array([[1., -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+                         [0., 0., 0., 0.],
+                         [0., 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+                         [0., -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+                         [0., 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+                         [0., -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+                         [0., 40617522/29380423, -110615467/29380423, 69997945/29380423]])),
+    'bs23': (np.array([0., 1/2, 3/4, 1.]),
+             np.array([[0., 0., 0., 0.],
+                       [1/2, 0., 0., 0.],
+                       [0., 3/4, 0., 0.],
+                       [2/9, 1/3, 4/9, 0.]]),
+             np.array([2/9, 1/3, 4/9, 0.]),
+             np.array([7/24, 1/4, 1/3, 1/8]),
+             2,
+             None),
+}
+
+
+def embedded_runge_kutta(A, F, M, U0, t0, t1, mu=None, num_values=None, method='dopri5', rtol=1e-6, atol=1e-8,
+                         initial_time_step=None, max_time_step=None):
+    return _collect(A.source, num_values,
+                    _embedded_runge_kutta(A, F, M, U0, t0, t1, mu, num_values, method=method, rtol=rtol, atol=atol,
+                                          initial_time_step=initial_time_step, max_time_step=max_time_step))
+
+
+def _embedded_runge_kutta(A, F, M, U0, t0, t1, mu=None, num_values=None, method='dopri5', rtol=1e-6, atol=1e-8,
+                          initial_time_step=None, max_time_step=None):
+    assert isinstance(A, Operator)
+    assert isinstance(M, (type(None), Operator))
+    assert A.source == A.range
+    assert M is None or A.source == M.source == M.range
+    assert U0 in A.source
+    assert len(U0) == 1
+    c, a, b, b_hat, order, P = _EMBEDDED_RUNGE_KUTTA_METHODS[method]
 
-    return R
+    F = _rhs_function(F, A, mu)
+    if not _depends_on_time(A, mu):
+        A = A.assemble(mu)
+    if mu is None:
+        mu = Mu()
+
+    def derivative(t, U):
+        mu_t = mu.with_(t=t)
+        V = -A.apply(U, mu=mu_t)
+        if F:
+            V += F(mu_t)
+        return V if M is None else M.apply_inverse(V, mu=mu_t)
+
+    def step(t, U, dU, h):
+        K = dU.copy()
+        for i in range(1, len(c)):
+            U_i = U + K.lincomb(h * a[i, :i])
+            K.append(derivative(t + c[i] * h, U_i))
+        # the last stage is evaluated at the new solution
+        if P is None:
+            dense_output = None
+        else:
+            def dense_output(theta):
+                return U + K.lincomb(h * (P @ theta**np.arange(1, P.shape[1] + 1)))
+        return U_i, K[-1], K.lincomb(h * (b - b_hat)), dense_output
+
+    return _adaptive_time_stepping(step, U0, derivative(t0, U0), t0, t1, num_values, rtol, atol,
+                                   initial_time_step, max_time_step, order)
+
+
+def sdirk(A, F, M, U0, t0, t1, mu=None, num_values=None, rtol=1e-4, atol=1e-6, initial_time_step=None,
+          max_time_step=None, solver_options='operator'):
+    return _collect(A.source, num_values,
+                    _sdirk(A, F, M, U0, t0, t1, mu, num_values, rtol=rtol, atol=atol,
+                           initial_time_step=initial_time_step, max_time_step=max_time_step,
+                           solver_options=solver_options))
+
+
+def _sdirk(A, F, M, U0, t0, t1, mu=None, num_values=None, rtol=1e-4, atol=1e-6, initial_time_step=None,
+           max_time_step=None, solver_options='operator'):
+    assert isinstance(A, Operator)
+    assert isinstance(M, (type(None), Operator))
+    assert A.linear
+    assert A.source == A.range
+    assert U0 in A.source
+    assert len(U0) == 1
+
+    F = _rhs_function(F, A, mu)
+    if M is None:
+        from pymor.operators.constructions import IdentityOperator
+        M = IdentityOperator(A.source)
+    assert A.source == M.source == M.range
+    assert not M.parametric
+
+    options = (A.solver_options if solver_options == 'operator' else
+               M.solver_options if solver_options == 'mass' else
+               solver_options)
+    A_time_dep = _depends_on_time(A, mu)
+    if not A_time_dep:
+        A = A.assemble(mu)
+    if mu is None:
+        mu = Mu()
+
+    gamma = 1 - np.sqrt(2) / 2
+    M_gamma_dt_A = {}
+
+    def residual(t, U):
+        mu_t = mu.with_(t=t)
+        V = -A.apply(U, mu=mu_t)
+        if F:
+            V += F(mu_t)
+        return V
+
+    def step(t, U, dU, h):
+        if h not in M_gamma_dt_A:
+            M_gamma_dt_A.clear()
+            op = (M + A * (gamma * h)).with_(solver_options=options)
+            M_gamma_dt_A[h] = op if A_time_dep else op.assemble(mu)
+        op = M_gamma_dt_A[h]
+        K_1 = op.apply_inverse(residual(t + gamma * h, U), mu=mu.with_(t=t + gamma * h))
+        U_1 = U + K_1 * ((1 - gamma) * h)
+        K_2 = op.apply_inverse(residual(t + h, U_1), mu=mu.with_(t=t + h))
+        # the method is stiffly accurate, so K_2 is the time derivative at the new solution
+        U_1.axpy(gamma * h, K_2)
+        E = op.apply_inverse(M.apply((K_2 - K_1) * (gamma * h)), mu=mu.with_(t=t + h))
+        return U_1, K_2, E, None
+
+    dU0 = M.apply_inverse(residual(t0, U0), mu=mu.with_(t=t0))
+    return _adaptive_time_stepping(step, U0, dU0, t0, t1, num_values, rtol, atol,
+                                   initial_time_step, max_time_step, 1, keep_time_step=True)
+
+
+def _adaptive_time_stepping(step, U0, dU0, t0, t1, num_values, rtol, atol, initial_time_step, max_time_step,
+                            order, keep_time_step=False):
+    """Step-size control and dense output for :func:`embedded_runge_kutta` and :func:`sdirk`.
+
+    `step(t, U, dU, h)` has to return the solution and its time derivative after a time
+    step of size `h` starting at time `t` with solution `U` and time derivative `dU`,
+    the local error estimate of order `order + 1` and a function evaluating a continuous
+    extension of the method at `t + theta*h` for `0 <= theta <= 1`. If the latter is
+    `None`, cubic Hermite interpolation is used instead. The step-size control
+    follows :cite:`HNW93` (Section II.4). If `keep_time_step` is `True`, the
+    time-step size is not increased by factors below 1.2.
+    """
+    logger = getLogger('pymor.algorithms.timestepping.adaptive_time_stepping')
+
+    max_time_step = max_time_step or t1 - t0
+    h = min(initial_time_step or (t1 - t0) / 100, max_time_step)
+    times = None if num_values is None else np.linspace(t0, t1, num_values)
+
+    yield t0, U0.copy()
+    num_yielded = 1
+
+    t, U, dU = t0, U0, dU0
+    sqrt_dim = np.sqrt(U0.dim)
+    max_factor = 5.
+    accepted = rejected = 0
+    while t < t1:
+        # avoid a tiny last time step
+        final = t + 1.01 * h >= t1
+        if final:
+            h = t1 - t
+        U_new, dU_new, E, dense_output = step(t, U, dU, h)
+        err = E.norm()[0] / (atol * sqrt_dim + rtol * max(U.norm()[0], U_new.norm()[0]))
+
+        if err <= 1.:
+            accepted += 1
+            t_new = t1 if final else t + h
+            if times is None:
+                yield t_new, U_new
+            else:
+                while num_yielded < num_values and times[num_yielded] <= t_new:
+                    theta = (times[num_yielded] - t) / h
+                    yield times[num_yielded], (dense_output(theta) if dense_output else
+                                               _hermite_interpolation(U, dU, U_new, dU_new, h, theta))
+                    num_yielded += 1
+            t, U, dU = t_new, U_new, dU_new
+            factor = min(max_factor, 0.9 * err**(-1 / (order + 1))) if err > 0. else max_factor
+            if keep_time_step and 1. <= factor <= 1.2:
+                factor = 1.
+            max_factor = 5.
+        else:
+            rejected += 1
+            factor = max(0.2, 0.9 * err**(-1 / (order + 1))) if np.isfinite(err) else 0.2
+            max_factor = 1.
+
+        if t < t1:
+            h = min(h * factor, max_time_step)
+            if t + h <= t:
+                raise AccuracyError(f'Time-step size {h} too small at time {t}')
+
+    logger.info(f'{accepted} time steps accepted, {rejected} rejected')
+
+
+def _hermite_interpolation(U0, dU0, U1, dU1, h, theta):
+    U = U0 * (2 * theta**3 - 3 * theta**2 + 1)
+    U.axpy(h * (theta**3 - 2 * theta**2 + theta), dU0)
+    U.axpy(3 * theta**2 - 2 * theta**3, U1)
+    U.axpy(h * (theta**3 - theta**2), dU1)
+    return U
+
+
+def _rhs_function(F, A, mu):
+    if isinstance(F, Operator):
+        assert F.source.dim == 1
+        assert F.range == A.range
+        if _depends_on_time(F, mu):
+            return F.as_vector
+        F = F.as_vector(mu)
+    elif F is not None:
+        assert isinstance(F, VectorArray)
+        assert len(F) == 1
+        assert F in A.range
+    return None if F is None else lambda mu: F
 
 
 def discrete(A, F, M, U0, k0, k1, mu=None, num_values=None):
+    return _collect(A.source, num_values or k1 - k0 + 1, _discrete(A, F, M, U0, k0, k1, mu, num_values))
+
+
+def _discrete(A, F, M, U0, k0, k1, mu=None, num_values=None):
     assert isinstance(A, Operator)
     assert isinstance(F, (type(None), Operator, VectorArray))
     assert isinstance(M, (type(None), Operator))
@@ -381,8 +867,8 @@ def discrete(A, F, M, U0, k0, k1, mu=None, num_values=None):
     assert U0 in A.source
     assert len(U0) == 1
 
-    R = A.source.empty(reserve=num_values)
-    R.append(U0)
+    yield k0, U0.copy()
+    num_yielded = 1
 
     if not _depends_on_time(M, mu):
         M = M.assemble(mu)
@@ -399,12 +885,131 @@ def discrete(A, F, M, U0, k0, k1, mu=None, num_values=None):
         if F:
             rhs += Fk
         U = M.apply_inverse(rhs, mu=mu, initial_guess=U)
-        while k - k0 + 1 + (min(dt, DT) * 0.5) >= len(R) * DT:
-            R.append(U)
+        while k - k0 + 1 + (min(dt, DT) * 0.5) >= num_yielded * DT:
+            yield k + 1, U
+            num_yielded += 1
+
 
+def _collect(space, num_values, iterator):
+    R = space.empty(reserve=num_values or 0)
+    for _, U in iterator:
+        R.append(U)
     return R
 
 
+def _dense_linear_time_stepping(A, F, M, U0, t0, t1, nt, mu, num_values, solver_options, theta):
+    """Fast path for :func:`implicit_euler` and :func:`implicit_midpoint_rule`.
+
+    With `theta=1` (implicit Euler) or `theta=0.5` (implicit midpoint rule), both schemes
+    compute `U_(n+1)` from `(M + theta*dt*A) U_(n+1) = (M - (1-theta)*dt*A) U_n + dt*F`.
+    If `A`, `M` and `F` are linear and time-independent and `M + theta*dt*A` assembles to a dense
+    |NumpyMatrixOperator|, as it is usually the case for reduced models, the propagator
+    `(M + theta*dt*A)^(-1) (M - (1-theta)*dt*A)` is computed once and the time steps are carried
+    out as a NumPy recurrence on a preallocated array of the solution trajectory.
+
+    Returns `None` if this is not possible.
+    """
+    from pymor.operators.constructions import IdentityOperator
+    from pymor.operators.numpy import NumpyMatrixOperator
+    from pymor.vectorarrays.numpy import NumpyVectorSpace
+
+    if not (isinstance(A, Operator) and A.linear and A.source == A.range
+            and isinstance(A.source, NumpyVectorSpace) and not _depends_on_time(A, mu)):
+        return None
+    if M is None:
+        M = IdentityOperator(A.source)
+    elif not (isinstance(M, Operator) and M.linear and not M.parametric and M.source == M.range == A.source):
+        return None
+    if isinstance(F, Operator):
+        if not (F.linear and F.source.dim == 1 and F.range == A.range) or _depends_on_time(F, mu):
+            return None
+        F = F.as_vector(mu)
+    elif F is not None and not (isinstance(F, VectorArray) and len(F) == 1 and F in A.range):
+        return None
+    if not (isinstance(U0, VectorArray) and U0 in A.source and len(U0) == 1):
+        return None
+    options = (A.solver_options if solver_options == 'operator' else
+               M.solver_options if solver_options == 'mass' else
+               solver_options)
+    if options:
+        return None
+
+    num_values = num_values or nt + 1
+    dt = (t1 - t0) / nt
+    DT = (t1 - t0) / (num_values - 1)
+
+    lhs = (M + A * (theta * dt)).assemble(mu)
+    if not isinstance(lhs, NumpyMatrixOperator) or lhs.sparse:
+        return None
+    rhs = M if theta == 1. else M - A * ((1 - theta) * dt)
+    # the rows of the transposed propagator are the propagated unit vectors
+    propagator = lhs.apply_inverse(rhs.apply(A.source.from_numpy(np.eye(A.source.dim)), mu=mu)).to_numpy()
+    dt_F = None if F is None else lhs.apply_inverse(F * dt).to_numpy()[0]
+
+    u = U0.to_numpy()[0]
+    dtype = np.result_type(u, propagator, *([] if dt_F is None else [dt_F]))
+    trajectory = np.empty((num_values, A.source.dim), dtype=dtype)
+    trajectory[0] = u
+    num_yielded = 1
+
+    t = t0
+    for n in range(nt):
+        t += dt
+        u = u @ propagator
+        if dt_F is not None:
+            u += dt_F
+        while t - t0 + (min(dt, DT) * 0.5) >= num_yielded * DT:
+            trajectory[num_yielded] = u
+            num_yielded += 1
+
+    return A.source.make_array(trajectory[:num_yielded])
+
+
+def _dense_linear_time_stepping_batch(A, F, M, U0, t0, t1, nt, num_values, theta):
+    """Batched version of :func:`_dense_linear_time_stepping` for :meth:`TimeStepper.solve_batch`.
+
+    With `theta=0` (explicit Euler), `theta=1` (implicit Euler) or `theta=0.5` (implicit
+    midpoint rule), the propagators `(M + theta*dt*A_i)^(-1) (M - (1-theta)*dt*A_i)` of all
+    equations are computed by a single batched solve before time-stepping, such that each
+    time step only requires a batched matrix-vector product.
+    """
+    n, N = U0.shape
+    assert A.shape == (n, N, N)
+    assert F is None or F.shape == (n, N)
+    assert M is None or M.shape == (N, N)
+
+    num_values = num_values or nt + 1
+    dt = (t1 - t0) / nt
+    DT = (t1 - t0) / (num_values - 1)
+
+    M = np.eye(N) if M is None else M
+    lhs = M + (theta * dt) * A
+    rhs = M - ((1 - theta) * dt) * A
+    try:
+        propagators = np.linalg.solve(lhs, rhs)
+        dt_F = None if F is None else np.linalg.solve(lhs, dt * F[:, :, np.newaxis])
+    except np.linalg.LinAlgError as e:
+        raise InversionError(f'{str(type(e))}: {str(e)}') from e
+
+    u = U0[:, :, np.newaxis]
+    dtype = np.result_type(u, propagators, *([] if dt_F is None else [dt_F]))
+    trajectories = np.empty((n, num_values, N), dtype=dtype)
+    trajectories[:, 0] = U0
+    num_yielded = 1
+
+    t = t0
+    for _ in range(nt):
+        t += dt
+        u = propagators @ u
+        if dt_F is not None:
+            u += dt_F
+        while t - t0 + (min(dt, DT) * 0.5) >= num_yielded * DT:
+            trajectories[:, num_yielded] = u[:, :, 0]
+            num_yielded += 1
+
+    return trajectories[:, :num_yielded]
+
+
 def _depends_on_time(obj, mu):
     if not mu:
         return False
@@ -14,7 +14,7 @@ from pymor.algorithms.basic import almost_equal, relative_error, project_array
 from pymor.algorithms.dmd import dmd
 from pymor.algorithms.ei import interpolate_operators, interpolate_function, ei_greedy, deim
 from pymor.algorithms.error import plot_reduction_error_analysis, reduction_error_analysis
-from pymor.algorithms.gram_schmidt import gram_schmidt, gram_schmidt_biorth
+from pymor.algorithms.gram_schmidt import block_gram_schmidt, gram_schmidt, gram_schmidt_biorth
 from pymor.algorithms.greedy import rb_greedy
 from pymor.algorithms.adaptivegreedy import rb_adaptive_greedy
 from pymor.algorithms.newton import newton
@@ -61,7 +61,7 @@ from pymor.operators.numpy import NumpyGenericOperator, NumpyMatrixOperator
 from pymor.parallel.default import new_parallel_pool
 from pymor.parallel.manager import RemoteObjectManager
 
-from pymor.parameters.base import Parameters, Mu, ParametricObject, ParameterSpace
+from pymor.parameters.base import Parameters, Mu, MuArray, ParametricObject, ParameterSpace
 from pymor.parameters.functionals import (ProjectionParameterFunctional, GenericParameterFunctional,
                                           ExpressionParameterFunctional)
 
@@ -2,6 +2,7 @@
 # Copyright pyMOR developers and contributors. All rights reserved.
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 
+import hashlib
 
 import numpy as np
 from scipy.linalg import solve, solve_continuous_lyapunov, solve_discrete_lyapunov, solve_continuous_are
@@ -11,6 +12,7 @@ from pymor.algorithms.lyapunov import _solve_lyap_lrcf_check_args, _solve_lyap_d
 from pymor.algorithms.riccati import _solve_ricc_check_args, _solve_ricc_dense_check_args
 from pymor.algorithms.genericsolvers import _parse_options
 from pymor.algorithms.to_matrix import to_matrix
+from pymor.core.cache import LRUMemoryRegion
 from pymor.core.config import config
 from pymor.core.defaults import defaults
 from pymor.core.exceptions import InversionError
@@ -68,7 +70,8 @@ def solver_options(bicgstab_tol=1e-15,
     spsolve_permc_spec
         See :func:`scipy.sparse.linalg.spsolve`.
     spsolve_keep_factorization
-        See :func:`scipy.sparse.linalg.spsolve`.
+        If `True`, compute a :func:`scipy.sparse.linalg.splu` factorization of the
+        matrix and store it in the :func:`factorization_cache`.
     lgmres_tol
         See :func:`scipy.sparse.linalg.lgmres`.
     lgmres_maxiter
@@ -144,6 +147,113 @@ def solver_options(bicgstab_tol=1e-15,
     return opts
 
 
+class FactorizationCacheRegion(LRUMemoryRegion):
+    """|LRUMemoryRegion| for SuperLU factorizations computed by :func:`apply_inverse`.
+
+    Entries are tuples `(lu, dtype)` of a :class:`~scipy.sparse.linalg.SuperLU`
+    object and the dtype of the factorized matrix. As SuperLU objects are
+    never modified after construction, they are neither copied when being
+    stored nor when being retrieved. The size of an entry is estimated from
+    the number of non-zero entries of the factors.
+    """
+
+    def _freeze(self, value):
+        return value
+
+    def _share(self, value):
+        return value
+
+    def _estimate_size(self, value):
+        lu, dtype = value
+        index_size = np.dtype(np.int32).itemsize
+        return lu.nnz * (np.dtype(dtype).itemsize + index_size) + 2 * lu.shape[0] * index_size
+
+
+_factorization_cache = None
+
+
+@defaults('max_size')
+def factorization_cache(max_size=1024**3):
+    """Return the global cache for sparse LU factorizations.
+
+    All sparse LU factorizations computed by :func:`apply_inverse` with the
+    `scipy_spsolve` solver and `keep_factorization=True` are stored in this
+    cache. The factorizations are keyed by a hash of the matrix entries and
+    by the dtype of the factorization. In particular, factorizations are
+    reused when the same parametric |Operator| is assembled repeatedly for the
+    same |parameter values|, or after an operator has been pickled.
+    Factorizations of CSR matrices are computed for their CSC transposes, such
+    that `apply_inverse_adjoint` of a real |NumpyMatrixOperator| reuses the
+    factorization of the operator via transposed solves.
+
+    Parameters
+    ----------
+    max_size
+        Maximum estimated size (in bytes) of all cached factorizations.
+        When this size is exceeded, least recently used factorizations are
+        evicted.
+
+    Returns
+    -------
+    The :class:`FactorizationCacheRegion` holding the factorizations.
+    """
+    global _factorization_cache
+    if _factorization_cache is None:
+        _factorization_cache = FactorizationCacheRegion(max_size)
+    else:
+        _factorization_cache.max_size = max_size
+    return _factorization_cache
+
+
+def _matrix_key(matrix, csc_matrix):
+    # computing the hash is cheap compared to the factorization, but we still only
+    # do it once for each matrix object
+    try:
+        return matrix.factorization_key
+    except AttributeError:
+        pass
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f'{csc_matrix.shape} {csc_matrix.dtype}'.encode())
+    for a in (csc_matrix.indptr, csc_matrix.indices, csc_matrix.data):
+        h.update(np.ascontiguousarray(a).data)
+    matrix.factorization_key = key = h.hexdigest()
+    return key
+
+
+def _solve_factorized(matrix, V, permc_spec):
+    """Solve `matrix @ X = V.T` using a cached or newly computed SuperLU factorization."""
+    if matrix.format == 'csr':
+        # matrix.T is a CSC matrix sharing its data with matrix, so we solve the
+        # transposed system instead. In particular, this way the adjoint of a real
+        # NumpyMatrixOperator shares its factorization with the operator itself.
+        csc_matrix, trans = matrix.T, 'T'
+    else:
+        csc_matrix, trans = matrix.tocsc(), 'N'
+    key = _matrix_key(matrix, csc_matrix)
+    promoted_type = np.promote_types(matrix.dtype, V.dtype)
+    cache = factorization_cache()
+
+    # a real factorization can be applied to complex right-hand sides by solving for
+    # the real and imaginary parts separately
+    if np.isrealobj(matrix) and np.iscomplexobj(V):
+        found, value = cache.get((key, permc_spec, np.promote_types(matrix.dtype, V.real.dtype)))
+        if found:
+            lu, _ = value
+            R = lu.solve(np.ascontiguousarray(V.real.T), trans=trans).astype(promoted_type)
+            R.imag = lu.solve(np.ascontiguousarray(V.imag.T), trans=trans)
+            return R.T
+
+    found, value = cache.get((key, permc_spec, promoted_type))
+    if found:
+        lu, _ = value
+    else:
+        # the matrix is always converted to the promoted type.
+        # if matrix.dtype == promoted_type, this is a no_op
+        lu = splu(matrix_astype_nocopy(csc_matrix, promoted_type), permc_spec=permc_spec)
+        cache.set((key, permc_spec, promoted_type), (lu, promoted_type))
+    return lu.solve(V.T.astype(promoted_type, copy=False), trans=trans).T
+
+
 @defaults('check_finite', 'default_solver', 'default_least_squares_solver')
 def apply_inverse(op, V, initial_guess=None, options=None, least_squares=False, check_finite=True,
                   default_solver='scipy_spsolve', default_least_squares_solver='scipy_least_squares_lsmr'):
@@ -219,25 +329,8 @@ def apply_inverse(op, V, initial_guess=None, options=None, least_squares=False,
                                          format(info))
     elif options['type'] == 'scipy_spsolve':
         try:
-            # maybe remove unusable factorization:
-            if hasattr(matrix, 'factorization'):
-                fdtype = matrix.factorizationdtype
-                if not np.can_cast(V.dtype, fdtype, casting='safe'):
-                    del matrix.factorization
-
-            if hasattr(matrix, 'factorization'):
-                # we may use a complex factorization of a real matrix to
-                # apply it to a real vector. In that case, we downcast
-                # the result here, removing the imaginary part,
-                # which should be zero.
-                R = matrix.factorization.solve(V.T).T.astype(promoted_type, copy=False)
-            elif options['keep_factorization']:
-                # the matrix is always converted to the promoted type.
-                # if matrix.dtype == promoted_type, this is a no_op
-                matrix.factorization = splu(matrix_astype_nocopy(matrix.tocsc(), promoted_type),
-                                            permc_spec=options['permc_spec'])
-                matrix.factorizationdtype = promoted_type
-                R = matrix.factorization.solve(V.T).T
+            if options['keep_factorization']:
+                R = _solve_factorized(matrix, V, options['permc_spec'])
             else:
                 # the matrix is always converted to the promoted type.
                 # if matrix.dtype == promoted_type, this is a no_op
@@ -27,22 +27,24 @@ private attributes. It is the implementors responsibility not to break things.
 (See this :ref:`warning <ImmutableObjectWarning>`.)
 
 Backends for storage of cached return values derive from :class:`CacheRegion`.
-Currently two backends are provided for memory-based and disk-based caching
-(:class:`MemoryRegion` and :class:`DiskRegion`). The available regions
+Currently three backends are provided for memory-based and disk-based caching
+(:class:`MemoryRegion`, :class:`LRUMemoryRegion` and :class:`DiskRegion`). The available regions
 are stored in the module level `cache_regions` dict. The user can add
 additional regions (e.g. multiple disk cache regions) as required.
 :attr:`CacheableObject.cache_region` specifies a key of the `cache_regions` dict
 to select a cache region which should be used by the instance.
 (Setting :attr:`~CacheableObject.cache_region` to `None` or `'none'` disables caching.)
 
-By default, a 'memory', a 'disk' and a 'persistent' cache region are configured. The
-paths and maximum sizes of the disk regions, as well as the maximum number of keys of
-the memory cache region can be configured via the
+By default, a 'memory', an 'lru_memory', a 'disk' and a 'persistent' cache region are
+configured. The paths and maximum sizes of the disk regions, the maximum number of keys of
+the memory cache region, as well as the maximum size in bytes of the LRU memory cache region
+can be configured via the
 `pymor.core.cache.default_regions.disk_path`,
 `pymor.core.cache.default_regions.disk_max_size`,
 `pymor.core.cache.default_regions.persistent_path`,
-`pymor.core.cache.default_regions.persistent_max_size` and
-`pymor.core.cache.default_regions.memory_max_keys` |defaults|.
+`pymor.core.cache.default_regions.persistent_max_size`,
+`pymor.core.cache.default_regions.memory_max_keys` and
+`pymor.core.cache.default_regions.lru_memory_max_size` |defaults|.
 
 There two ways to disable and enable caching in pyMOR:
 
@@ -70,6 +72,7 @@ import hashlib
 import inspect
 from numbers import Number
 import os
+import sys
 import tempfile
 from types import MethodType
 
@@ -165,6 +168,148 @@ class MemoryRegion(CacheRegion):
         self._cache = OrderedDict()
 
 
+class LRUMemoryRegion(CacheRegion):
+    """Memory-based cache region with a byte-size budget and least-recently-used eviction.
+
+    In contrast to :class:`MemoryRegion`, values are not deep-copied. Instead,
+    |VectorArrays| are stored and returned as copy-on-write copies
+    (see :meth:`~pymor.vectorarrays.interface.VectorArray.copy`) and |NumPy arrays|
+    are stored as read-only copies of which read-only views are returned.
+    All other values are deep-copied.
+
+    The memory footprint of each entry is estimated by :func:`_estimate_size`.
+    When adding an entry would exceed `max_size`, least recently used entries
+    are evicted until the new entry fits. Entries larger than `max_size` are
+    not stored at all.
+
+    Parameters
+    ----------
+    max_size
+        Maximum size (in bytes) of all stored entries.
+
+    Attributes
+    ----------
+    size
+        Current estimated size (in bytes) of all stored entries.
+    hits
+        Number of successful cache lookups.
+    misses
+        Number of unsuccessful cache lookups.
+    evictions
+        Number of entries evicted to make room for new entries.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.clear()
+
+    def get(self, key):
+        try:
+            value, _ = self._cache[key]
+        except KeyError:
+            self.misses += 1
+            return False, None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return True, self._share(value)
+
+    def set(self, key, value):
+        if key in self._cache:
+            getLogger('pymor.core.cache.LRUMemoryRegion').warning('Key already present in cache region, ignoring.')
+            return
+        value = self._freeze(value)
+        size = self._estimate_size(value)
+        if size > self.max_size:
+            getLogger('pymor.core.cache.LRUMemoryRegion').info(
+                f'Entry of size {size} exceeds max_size of cache region. Not caching result.'
+            )
+            return
+        while self.size + size > self.max_size:
+            _, (_, evicted_size) = self._cache.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+        self._cache[key] = (value, size)
+        self.size += size
+
+    def clear(self):
+        self._cache = OrderedDict()
+        self.size = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def reset_statistics(self):
+        """Reset the hit, miss and eviction counters."""
+        self.hits = self.misses = self.evictions = 0
+
+    # the following methods can be overridden by subclasses which store values that
+    # cannot be handled by the module-level helper functions
+
+    def _freeze(self, value):
+        return _freeze(value)
+
+    def _share(self, value):
+        return _share(value)
+
+    def _estimate_size(self, value):
+        return _estimate_size(value)
+
+
+def _freeze(value):
+    from pymor.vectorarrays.interface import VectorArray
+    t = type(value)
+    if t is tuple:
+        return tuple(_freeze(v) for v in value)
+    elif t is np.ndarray:
+        if value.dtype == object:
+            return deepcopy(value)
+        value = value.copy()
+        value.flags.writeable = False
+        return value
+    elif isinstance(value, VectorArray):
+        return value.copy()
+    else:
+        return deepcopy(value)
+
+
+def _share(value):
+    from pymor.vectorarrays.interface import VectorArray
+    t = type(value)
+    if t is tuple:
+        return tuple(_share(v) for v in value)
+    elif t is np.ndarray:
+        if value.dtype == object:
+            return deepcopy(value)
+        return value.view()
+    elif isinstance(value, VectorArray):
+        return value.copy()
+    else:
+        return deepcopy(value)
+
+
+def _estimate_size(value):
+    """Estimate the memory footprint (in bytes) of a cached value.
+
+    For |NumPy arrays| the size of the array data is returned. For
+    |NumpyVectorArrays| the size of the underlying array is returned,
+    for all other |VectorArrays| double precision storage of
+    `len(value) * value.dim` entries is assumed. Tuples, lists and dicts are
+    traversed recursively. For all other objects, :func:`sys.getsizeof` is used.
+    """
+    from pymor.vectorarrays.interface import VectorArray
+    from pymor.vectorarrays.numpy import NumpyVectorArray
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    elif isinstance(value, NumpyVectorArray):
+        return len(value) * value.dim * value.impl._array.itemsize
+    elif isinstance(value, VectorArray):
+        return len(value) * value.dim * 8
+    elif isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_estimate_size(v) for v in value)
+    elif isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_estimate_size(k) + _estimate_size(v) for k, v in value.items())
+    else:
+        return sys.getsizeof(value)
+
+
 class DiskRegion(CacheRegion):
 
     def __init__(self, path, max_size, persistent):
@@ -197,12 +342,14 @@ class DiskRegion(CacheRegion):
         self._cache.clear()
 
 
-@defaults('disk_path', 'disk_max_size', 'persistent_path', 'persistent_max_size', 'memory_max_keys')
+@defaults('disk_path', 'disk_max_size', 'persistent_path', 'persistent_max_size', 'memory_max_keys',
+          'lru_memory_max_size')
 def default_regions(disk_path=os.path.join(tempfile.gettempdir(), 'pymor.cache.' + getpass.getuser()),
                     disk_max_size=1024 ** 3,
                     persistent_path=os.path.join(tempfile.gettempdir(), 'pymor.persistent.cache.' + getpass.getuser()),
                     persistent_max_size=1024 ** 3,
-                    memory_max_keys=1000):
+                    memory_max_keys=1000,
+                    lru_memory_max_size=1024 ** 3):
 
     parse_size_string = lambda size: \
         int(size[:-1]) * 1024 if size[-1] == 'K' else \
@@ -212,10 +359,13 @@ def default_regions(disk_path=os.path.join(tempfile.gettempdir(), 'pymor.cache.'
 
     if isinstance(disk_max_size, str):
         disk_max_size = parse_size_string(disk_max_size)
+    if isinstance(lru_memory_max_size, str):
+        lru_memory_max_size = parse_size_string(lru_memory_max_size)
 
     cache_regions['disk'] = DiskRegion(path=disk_path, max_size=disk_max_size, persistent=False)
     cache_regions['persistent'] = DiskRegion(path=persistent_path, max_size=persistent_max_size, persistent=True)
     cache_regions['memory'] = MemoryRegion(memory_max_keys)
+    cache_regions['lru_memory'] = LRUMemoryRegion(lru_memory_max_size)
 
 
 cache_regions = {}
@@ -16,6 +16,7 @@ from pymor.analyticalproblems.functions import Function, ConstantFunction, Linco
 from pymor.analyticalproblems.instationary import InstationaryProblem
 from pymor.discretizers.builtin.domaindiscretizers.default import discretize_domain_default
 from pymor.discretizers.builtin.grids.boundaryinfos import EmptyBoundaryInfo
+from pymor.discretizers.builtin.grids.interfaces import memoized
 from pymor.discretizers.builtin.grids.referenceelements import line, triangle, square
 from pymor.discretizers.builtin.gui.visualizers import PatchVisualizer, OnedVisualizer
 from pymor.models.basic import StationaryModel, InstationaryModel
@@ -53,6 +54,105 @@ def CGVectorSpace(grid, id='STATE'):
     return NumpyVectorSpace(grid.size(grid.dim), id)
 
 
+@memoized
+def _assembly_plan(grid, boundary_info, dirichlet_clear_rows, dirichlet_clear_columns, dirichlet_clear_diag):
+    """Precompute the CSC sparsity pattern of a matrix assembled from element matrices.
+
+    The returned plan is stored in `grid` and maps the entries of the element
+    matrices (ordered as `(element, local row, local column)`) to the entries
+    of the data array of the assembled CSC matrix. Entries of rows/columns
+    corresponding to Dirichlet DOFs which are cleared are mapped to the
+    additional index `nnz`.
+
+    Returns
+    -------
+    indptr
+        The `indptr` array of the CSC matrix.
+    indices
+        The `indices` array of the CSC matrix.
+    positions
+        Index in the data array for each entry of the element matrices.
+    diagonal_positions
+        Index in the data array of the diagonal entries which are set
+        to one for Dirichlet DOFs.
+    """
+    g = grid
+    n = g.size(g.dim)
+    SE = g.subentities(0, g.dim)
+    SF_I0 = np.repeat(SE, SE.shape[1], axis=1).ravel()
+    SF_I1 = np.tile(SE, [1, SE.shape[1]]).ravel()
+
+    keep = np.ones(len(SF_I0), dtype=bool)
+    diagonal = np.zeros(0, dtype=SF_I0.dtype)
+    if boundary_info.has_dirichlet:
+        if dirichlet_clear_rows:
+            keep &= ~boundary_info.dirichlet_mask(g.dim)[SF_I0]
+        if dirichlet_clear_columns:
+            keep &= ~boundary_info.dirichlet_mask(g.dim)[SF_I1]
+        if not dirichlet_clear_diag and (dirichlet_clear_rows or dirichlet_clear_columns):
+            diagonal = boundary_info.dirichlet_boundaries(g.dim)
+
+    # sort the entries by column and row, identify duplicates
+    keys = np.concatenate((SF_I1[keep].astype(np.int64) * n + SF_I0[keep],
+                           diagonal.astype(np.int64) * (n + 1)))
+    keys, inverse = np.unique(keys, return_inverse=True)
+    num_kept = len(inverse) - len(diagonal)
+
+    positions = np.full(len(SF_I0), len(keys))
+    positions[keep] = inverse[:num_kept]
+    diagonal_positions = inverse[num_kept:]
+    indices = (keys % n).astype(np.int32)
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(np.bincount(keys // n, minlength=n), out=indptr[1:])
+
+    return indptr, indices, positions, diagonal_positions
+
+
+def _assemble_csc(plan, SF_INTS):
+    """Assemble CSC matrix from element matrix entries `SF_INTS` using an :func:`_assembly_plan`."""
+    indptr, indices, positions, diagonal_positions = plan
+    n, nnz = len(indptr) - 1, len(indices)
+    if np.iscomplexobj(SF_INTS):
+        data = (np.bincount(positions, weights=SF_INTS.real, minlength=nnz + 1)
+                + 1j * np.bincount(positions, weights=SF_INTS.imag, minlength=nnz + 1))
+    else:
+        data = np.bincount(positions, weights=SF_INTS, minlength=nnz + 1)
+    data = data[:nnz]
+    data[diagonal_positions] += 1
+    # copy the index arrays, as scipy might modify them in-place
+    return csc_matrix((data, indices.copy(), indptr.copy()), shape=(n, n))
+
+
+@memoized
+def _transformed_gradients(grid):
+    """Gradients of the P1/Q1 shape functions transformed by the reference map of `grid`.
+
+    For |Grids| with quadrilateral elements, the gradients are evaluated in the
+    quadrature points of order 2, i.e. the result is indexed as
+    `SF_GRADS(element, function, component, quadrature point)`. Otherwise
+    the gradients are constant and indexed as `SF_GRADS(element, function, component)`.
+    """
+    g = grid
+    SF_GRAD = LagrangeShapeFunctionsGrads[g.reference_element][1]
+    if g.reference_element is square:
+        q, _ = g.reference_element.quadrature(order=2)
+        return np.einsum('eij,pjc->epic', g.jacobian_inverse_transposed(0), SF_GRAD(q))
+    else:
+        return np.einsum('eij,pj->epi', g.jacobian_inverse_transposed(0), SF_GRAD)
+
+
+@memoized
+def _local_stiffness_matrices(grid):
+    """Local P1/Q1 stiffness matrices `(element, function, function)` for a unit diffusion."""
+    g = grid
+    SF_GRADS = _transformed_gradients(g)
+    if g.reference_element is square:
+        _, w = g.reference_element.quadrature(order=2)
+        return np.einsum('epic,eqic,c,e->epq', SF_GRADS, SF_GRADS, w, g.integration_elements(0))
+    else:
+        return np.einsum('epi,eqi,e->epq', SF_GRADS, SF_GRADS, g.volumes(0))
+
+
 class L2ProductFunctionalP1(NumpyMatrixBasedOperator):
     """Linear functional representing the inner product with an L2-|Function|.
 
@@ -314,28 +414,10 @@ class L2ProductP1(NumpyMatrixBasedOperator):
 
         del SF
 
-        self.logger.info('Determine global dofs ...')
-        SF_I0 = np.repeat(g.subentities(0, g.dim), g.dim + 1, axis=1).ravel()
-        SF_I1 = np.tile(g.subentities(0, g.dim), [1, g.dim + 1]).ravel()
-
-        self.logger.info('Boundary treatment ...')
-        if bi.has_dirichlet:
-            if self.dirichlet_clear_rows:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I0], 0, SF_INTS)
-            if self.dirichlet_clear_columns:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I1], 0, SF_INTS)
-            if not self.dirichlet_clear_diag and (self.dirichlet_clear_rows or self.dirichlet_clear_columns):
-                SF_INTS = np.hstack((SF_INTS, np.ones(bi.dirichlet_boundaries(g.dim).size)))
-                SF_I0 = np.hstack((SF_I0, bi.dirichlet_boundaries(g.dim)))
-                SF_I1 = np.hstack((SF_I1, bi.dirichlet_boundaries(g.dim)))
-
         self.logger.info('Assemble system matrix ...')
-        A = coo_matrix((SF_INTS, (SF_I0, SF_I1)), shape=(g.size(g.dim), g.size(g.dim)))
-        del SF_INTS, SF_I0, SF_I1
-        A.eliminate_zeros()
-        A = csc_matrix(A).copy()  # See DiffusionOperatorP1 for why copy() is necessary
-
-        return A
+        plan = _assembly_plan(g, bi, self.dirichlet_clear_rows, self.dirichlet_clear_columns,
+                              self.dirichlet_clear_diag)
+        return _assemble_csc(plan, SF_INTS)
 
 
 class L2ProductQ1(NumpyMatrixBasedOperator):
@@ -394,28 +476,10 @@ class L2ProductQ1(NumpyMatrixBasedOperator):
 
         del SF
 
-        self.logger.info('Determine global dofs ...')
-        SF_I0 = np.repeat(g.subentities(0, g.dim), 4, axis=1).ravel()
-        SF_I1 = np.tile(g.subentities(0, g.dim), [1, 4]).ravel()
-
-        self.logger.info('Boundary treatment ...')
-        if bi.has_dirichlet:
-            if self.dirichlet_clear_rows:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I0], 0, SF_INTS)
-            if self.dirichlet_clear_columns:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I1], 0, SF_INTS)
-            if not self.dirichlet_clear_diag and (self.dirichlet_clear_rows or self.dirichlet_clear_columns):
-                SF_INTS = np.hstack((SF_INTS, np.ones(bi.dirichlet_boundaries(g.dim).size)))
-                SF_I0 = np.hstack((SF_I0, bi.dirichlet_boundaries(g.dim)))
-                SF_I1 = np.hstack((SF_I1, bi.dirichlet_boundaries(g.dim)))
-
         self.logger.info('Assemble system matrix ...')
-        A = coo_matrix((SF_INTS, (SF_I0, SF_I1)), shape=(g.size(g.dim), g.size(g.dim)))
-        del SF_INTS, SF_I0, SF_I1
-        A.eliminate_zeros()
-        A = csc_matrix(A).copy()  # See DiffusionOperatorP1 for why copy() is necessary
-
-        return A
+        plan = _assembly_plan(g, bi, self.dirichlet_clear_rows, self.dirichlet_clear_columns,
+                              self.dirichlet_clear_diag)
+        return _assemble_csc(plan, SF_INTS)
 
 
 class DiffusionOperatorP1(NumpyMatrixBasedOperator):
@@ -470,57 +534,25 @@ class DiffusionOperatorP1(NumpyMatrixBasedOperator):
         g = self.grid
         bi = self.boundary_info
 
-        # gradients of shape functions
-        SF_GRAD = LagrangeShapeFunctionsGrads[g.reference_element][1]
-
-        self.logger.info('Calculate gradients of shape functions transformed by reference map ...')
-        SF_GRADS = np.einsum('eij,pj->epi', g.jacobian_inverse_transposed(0), SF_GRAD)
-
         self.logger.info('Calculate all local scalar products between gradients ...')
         if self.diffusion_function is not None and self.diffusion_function.shape_range == ():
             D = self.diffusion_function(self.grid.centers(0), mu=mu)
-            SF_INTS = np.einsum('epi,eqi,e,e->epq', SF_GRADS, SF_GRADS, g.volumes(0), D).ravel()
+            SF_INTS = (_local_stiffness_matrices(g) * D[:, np.newaxis, np.newaxis]).ravel()
             del D
         elif self.diffusion_function is not None:
             D = self.diffusion_function(self.grid.centers(0), mu=mu)
+            SF_GRADS = _transformed_gradients(g)
             SF_INTS = np.einsum('epi,eqj,e,eij->epq', SF_GRADS, SF_GRADS, g.volumes(0), D).ravel()
             del D
         else:
-            SF_INTS = np.einsum('epi,eqi,e->epq', SF_GRADS, SF_GRADS, g.volumes(0)).ravel()
-
-        del SF_GRADS
+            SF_INTS = _local_stiffness_matrices(g).flatten()
 
         if self.diffusion_constant is not None:
             SF_INTS *= self.diffusion_constant
 
-        self.logger.info('Determine global dofs ...')
-        SF_I0 = np.repeat(g.subentities(0, g.dim), g.dim + 1, axis=1).ravel()
-        SF_I1 = np.tile(g.subentities(0, g.dim), [1, g.dim + 1]).ravel()
-
-        self.logger.info('Boundary treatment ...')
-        if bi.has_dirichlet:
-            SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I0], 0, SF_INTS)
-            if self.dirichlet_clear_columns:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I1], 0, SF_INTS)
-
-            if not self.dirichlet_clear_diag:
-                SF_INTS = np.hstack((SF_INTS, np.ones(bi.dirichlet_boundaries(g.dim).size)))
-                SF_I0 = np.hstack((SF_I0, bi.dirichlet_boundaries(g.dim)))
-                SF_I1 = np.hstack((SF_I1, bi.dirichlet_boundaries(g.dim)))
-
         self.logger.info('Assemble system matrix ...')
-        A = coo_matrix((SF_INTS, (SF_I0, SF_I1)), shape=(g.size(g.dim), g.size(g.dim)))
-        del SF_INTS, SF_I0, SF_I1
-        A.eliminate_zeros()
-        A = csc_matrix(A).copy()
-
-        # The call to copy() is necessary to resize the data arrays of the sparse matrix:
-        # During the conversion to crs_matrix, entries corresponding with the same
-        # coordinates are summed up, resulting in shorter data arrays. The shortening
-        # is implemented by calling self.prune() which creates the view self.data[:self.nnz].
-        # Thus, the original data array is not deleted and all memory stays allocated.
-
-        return A
+        plan = _assembly_plan(g, bi, True, self.dirichlet_clear_columns, self.dirichlet_clear_diag)
+        return _assemble_csc(plan, SF_INTS)
 
 
 class DiffusionOperatorQ1(NumpyMatrixBasedOperator):
@@ -575,60 +607,26 @@ class DiffusionOperatorQ1(NumpyMatrixBasedOperator):
         g = self.grid
         bi = self.boundary_info
 
-        # gradients of shape functions
-        q, w = g.reference_element.quadrature(order=2)
-        SF_GRAD = LagrangeShapeFunctionsGrads[g.reference_element][1]
-        SF_GRAD = SF_GRAD(q)
-
-        self.logger.info('Calculate gradients of shape functions transformed by reference map ...')
-        SF_GRADS = np.einsum('eij,pjc->epic', g.jacobian_inverse_transposed(0), SF_GRAD)
-
         self.logger.info('Calculate all local scalar products between gradients ...')
         if self.diffusion_function is not None and self.diffusion_function.shape_range == ():
             D = self.diffusion_function(self.grid.centers(0), mu=mu)
-            SF_INTS = np.einsum('epic,eqic,c,e,e->epq', SF_GRADS, SF_GRADS, w, g.integration_elements(0), D).ravel()
+            SF_INTS = (_local_stiffness_matrices(g) * D[:, np.newaxis, np.newaxis]).ravel()
             del D
         elif self.diffusion_function is not None:
             D = self.diffusion_function(self.grid.centers(0), mu=mu)
+            _, w = g.reference_element.quadrature(order=2)
+            SF_GRADS = _transformed_gradients(g)
             SF_INTS = np.einsum('epic,eqjc,c,e,eij->epq', SF_GRADS, SF_GRADS, w, g.integration_elements(0), D).ravel()
             del D
         else:
-            SF_INTS = np.einsum('epic,eqic,c,e->epq', SF_GRADS, SF_GRADS, w, g.integration_elements(0)).ravel()
-
-        del SF_GRADS
+            SF_INTS = _local_stiffness_matrices(g).flatten()
 
         if self.diffusion_constant is not None:
             SF_INTS *= self.diffusion_constant
 
-        self.logger.info('Determine global dofs ...')
-
-        SF_I0 = np.repeat(g.subentities(0, g.dim), 4, axis=1).ravel()
-        SF_I1 = np.tile(g.subentities(0, g.dim), [1, 4]).ravel()
-
-        self.logger.info('Boundary treatment ...')
-        if bi.has_dirichlet:
-            SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I0], 0, SF_INTS)
-            if self.dirichlet_clear_columns:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I1], 0, SF_INTS)
-
-            if not self.dirichlet_clear_diag:
-                SF_INTS = np.hstack((SF_INTS, np.ones(bi.dirichlet_boundaries(g.dim).size)))
-                SF_I0 = np.hstack((SF_I0, bi.dirichlet_boundaries(g.dim)))
-                SF_I1 = np.hstack((SF_I1, bi.dirichlet_boundaries(g.dim)))
-
         self.logger.info('Assemble system matrix ...')
-        A = coo_matrix((SF_INTS, (SF_I0, SF_I1)), shape=(g.size(g.dim), g.size(g.dim)))
-        del SF_INTS, SF_I0, SF_I1
-        A.eliminate_zeros()
-        A = csc_matrix(A).copy()
-
-        # The call to copy() is necessary to resize the data arrays of the sparse matrix:
-        # During the conversion to crs_matrix, entries corresponding with the same
-        # coordinates are summed up, resulting in shorter data arrays. The shortening
-        # is implemented by calling self.prune() which creates the view self.data[:self.nnz].
-        # Thus, the original data array is not deleted and all memory stays allocated.
-
-        return A
+        plan = _assembly_plan(g, bi, True, self.dirichlet_clear_columns, self.dirichlet_clear_diag)
+        return _assemble_csc(plan, SF_INTS)
 
 
 class AdvectionOperatorP1(NumpyMatrixBasedOperator):
@@ -686,8 +684,7 @@ class AdvectionOperatorP1(NumpyMatrixBasedOperator):
         SF = LagrangeShapeFunctions[g.reference_element][1]
 
         self.logger.info('Calculate gradients of shape functions transformed by reference map ...')
-        SF_GRAD = LagrangeShapeFunctionsGrads[g.reference_element][1]
-        SF_GRADS = np.einsum('eij,pj->epi', g.jacobian_inverse_transposed(0), SF_GRAD)
+        SF_GRADS = _transformed_gradients(g)
         # SF_GRADS(element, function, component)
 
         SFQ = np.array(tuple(f(q) for f in SF))
@@ -702,34 +699,9 @@ class AdvectionOperatorP1(NumpyMatrixBasedOperator):
         if self.advection_constant is not None:
             SF_INTS *= self.advection_constant
 
-        self.logger.info('Determine global dofs ...')
-        SF_I0 = np.repeat(g.subentities(0, g.dim), g.dim + 1, axis=1).ravel()
-        SF_I1 = np.tile(g.subentities(0, g.dim), [1, g.dim + 1]).ravel()
-
-        self.logger.info('Boundary treatment ...')
-        if bi.has_dirichlet:
-            SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I0], 0, SF_INTS)
-            if self.dirichlet_clear_columns:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I1], 0, SF_INTS)
-
-            if not self.dirichlet_clear_diag:
-                SF_INTS = np.hstack((SF_INTS, np.ones(bi.dirichlet_boundaries(g.dim).size)))
-                SF_I0 = np.hstack((SF_I0, bi.dirichlet_boundaries(g.dim)))
-                SF_I1 = np.hstack((SF_I1, bi.dirichlet_boundaries(g.dim)))
-
         self.logger.info('Assemble system matrix ...')
-        A = coo_matrix((SF_INTS, (SF_I0, SF_I1)), shape=(g.size(g.dim), g.size(g.dim)))
-        del SF_INTS, SF_I0, SF_I1
-        A.eliminate_zeros()
-        A = csc_matrix(A).copy()
-
-        # The call to copy() is necessary to resize the data arrays of the sparse matrix:
-        # During the conversion to crs_matrix, entries corresponding with the same
-        # coordinates are summed up, resulting in shorter data arrays. The shortening
-        # is implemented by calling self.prune() which creates the view self.data[:self.nnz].
-        # Thus, the original data array is not deleted and all memory stays allocated.
-
-        return A
+        plan = _assembly_plan(g, bi, True, self.dirichlet_clear_columns, self.dirichlet_clear_diag)
+        return _assemble_csc(plan, SF_INTS)
 
 
 class AdvectionOperatorQ1(NumpyMatrixBasedOperator):
@@ -784,8 +756,7 @@ class AdvectionOperatorQ1(NumpyMatrixBasedOperator):
 
         self.logger.info('Calculate gradients of shape functions transformed by reference map ...')
         q, w = g.reference_element.quadrature(order=2)
-        SF_GRAD = LagrangeShapeFunctionsGrads[g.reference_element][1](q)
-        SF_GRADS = np.einsum('eij,pjc->epic', g.jacobian_inverse_transposed(0), SF_GRAD)
+        SF_GRADS = _transformed_gradients(g)
         # SF_GRADS(element,function,component,quadraturepoint)
 
         SF = LagrangeShapeFunctions[g.reference_element][1]
@@ -802,35 +773,9 @@ class AdvectionOperatorQ1(NumpyMatrixBasedOperator):
         if self.advection_constant is not None:
             SF_INTS *= self.advection_constant
 
-        self.logger.info('Determine global dofs ...')
-
-        SF_I0 = np.repeat(g.subentities(0, g.dim), 4, axis=1).ravel()
-        SF_I1 = np.tile(g.subentities(0, g.dim), [1, 4]).ravel()
-
-        self.logger.info('Boundary treatment ...')
-        if bi.has_dirichlet:
-            SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I0], 0, SF_INTS)
-            if self.dirichlet_clear_columns:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I1], 0, SF_INTS)
-
-            if not self.dirichlet_clear_diag:
-                SF_INTS = np.hstack((SF_INTS, np.ones(bi.dirichlet_boundaries(g.dim).size)))
-                SF_I0 = np.hstack((SF_I0, bi.dirichlet_boundaries(g.dim)))
-                SF_I1 = np.hstack((SF_I1, bi.dirichlet_boundaries(g.dim)))
-
         self.logger.info('Assemble system matrix ...')
-        A = coo_matrix((SF_INTS, (SF_I0, SF_I1)), shape=(g.size(g.dim), g.size(g.dim)))
-        del SF_INTS, SF_I0, SF_I1
-        A.eliminate_zeros()
-        A = csc_matrix(A).copy()
-
-        # The call to copy() is necessary to resize the data arrays of the sparse matrix:
-        # During the conversion to crs_matrix, entries corresponding with the same
-        # coordinates are summed up, resulting in shorter data arrays. The shortening
-        # is implemented by calling self.prune() which creates the view self.data[:self.nnz].
-        # Thus, the original data array is not deleted and all memory stays allocated.
-
-        return A
+        plan = _assembly_plan(g, bi, True, self.dirichlet_clear_columns, self.dirichlet_clear_diag)
+        return _assemble_csc(plan, SF_INTS)
 
 
 class RobinBoundaryOperator(NumpyMatrixBasedOperator):
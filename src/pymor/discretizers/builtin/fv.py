@@ -6,7 +6,7 @@
 from functools import partial
 
 import numpy as np
-from scipy.sparse import coo_matrix, csc_matrix, dia_matrix
+from scipy.sparse import coo_matrix, csc_matrix, csr_matrix, dia_matrix
 
 from pymor.algorithms.preassemble import preassemble as preassemble_
 from pymor.algorithms.timestepping import ExplicitEulerTimeStepper, ImplicitEulerTimeStepper
@@ -16,7 +16,7 @@ from pymor.analyticalproblems.instationary import InstationaryProblem
 from pymor.core.base import abstractmethod
 from pymor.core.defaults import defaults
 from pymor.discretizers.builtin.domaindiscretizers.default import discretize_domain_default
-from pymor.discretizers.builtin.grids.interfaces import GridWithOrthogonalCenters
+from pymor.discretizers.builtin.grids.interfaces import GridWithOrthogonalCenters, memoized
 from pymor.discretizers.builtin.grids.referenceelements import line, triangle, square
 from pymor.discretizers.builtin.grids.subgrid import SubGrid, make_sub_grid_boundary_info
 from pymor.discretizers.builtin.gui.visualizers import PatchVisualizer, OnedVisualizer
@@ -93,7 +93,7 @@ class LaxFriedrichsFlux(NumericalConvectiveFlux):
 
     def evaluate_stage2(self, stage1_data, unit_outer_normals, volumes, mu=None):
         U, F = stage1_data
-        return (np.sum(np.sum(F, axis=1) * unit_outer_normals, axis=1) * 0.5
+        return (np.einsum('ij,ij->i', F[:, 0] + F[:, 1], unit_outer_normals) * 0.5
                 + (U[..., 0] - U[..., 1]) * (0.5 / self.lxf_lambda)) * volumes
 
 
@@ -120,9 +120,8 @@ class SimplifiedEngquistOsherFlux(NumericalConvectiveFlux):
 
     def evaluate_stage2(self, stage1_data, unit_outer_normals, volumes, mu=None):
         F_edge, F_d_edge = stage1_data
-        unit_outer_normals = unit_outer_normals[:, np.newaxis, :]
-        F_d_edge = np.sum(F_d_edge * unit_outer_normals, axis=2)
-        F_edge = np.sum(F_edge * unit_outer_normals, axis=2)
+        F_d_edge = np.einsum('ikj,ij->ik', F_d_edge, unit_outer_normals)
+        F_edge = np.einsum('ikj,ij->ik', F_edge, unit_outer_normals)
         F_edge[:, 0] = np.where(np.greater_equal(F_d_edge[:, 0], 0), F_edge[:, 0], 0)
         F_edge[:, 1] = np.where(np.less_equal(F_d_edge[:, 1], 0), F_edge[:, 1], 0)
         F_edge = np.sum(F_edge, axis=1)
@@ -175,11 +174,9 @@ class EngquistOsherFlux(NumericalConvectiveFlux):
                                for p, w in zip(self.points, self.weights)], axis=1)]
 
     def evaluate_stage2(self, stage1_data, unit_outer_normals, volumes, mu=None):
-        F0 = np.sum(self.flux.evaluate(np.array([[0.]]), mu=mu) * unit_outer_normals, axis=1)
-        Fs = np.sum(stage1_data[0] * unit_outer_normals[:, np.newaxis, np.newaxis, :], axis=3)
-        Fs[:, 0, :] = np.maximum(Fs[:, 0, :], 0)
-        Fs[:, 1, :] = np.minimum(Fs[:, 1, :], 0)
-        Fs = np.sum(np.sum(Fs, axis=2), axis=1) + F0
+        F0 = unit_outer_normals @ self.flux.evaluate(np.array([[0.]]), mu=mu)[0]
+        Fs = np.einsum('iklj,ij->ikl', stage1_data[0], unit_outer_normals)
+        Fs = np.maximum(Fs[:, 0, :], 0).sum(axis=1) + np.minimum(Fs[:, 1, :], 0).sum(axis=1) + F0
         Fs *= volumes
         return Fs
 
@@ -258,6 +255,15 @@ class NonlinearAdvectionOperator(Operator):
         self._grid_data.update(UNIT_OUTER_NORMALS=g.unit_outer_normals()[self._grid_data['SUPE'][:, 0],
                                                                          self._grid_data['SUPI'][:, 0]])
 
+        # sparse matrix scattering the numerical fluxes of all edges to the adjacent cells,
+        # including the division by the cell volumes
+        SUPE = self._grid_data['SUPE']
+        INNER = np.where(SUPE[:, 1] >= 0)[0]
+        I = np.hstack([SUPE[:, 0], SUPE[INNER, 1]])
+        J = np.hstack([np.arange(len(SUPE)), INNER])
+        V = np.hstack([np.ones(len(SUPE)), -np.ones(len(INNER))]) / self._grid_data['VOLS0'][I]
+        self._grid_data.update(FLUX_SCATTER=csr_matrix((V, (I, J)), shape=(g.size(0), len(SUPE))))
+
     def apply(self, U, mu=None):
         assert U in self.source
         assert self.parameters.assert_compatible(mu)
@@ -266,19 +272,34 @@ class NonlinearAdvectionOperator(Operator):
             self._fetch_grid_data()
 
         U = U.to_numpy()
-        R = np.zeros((len(U), self.source.dim + 1))
+        if len(U) == 0:
+            return self.range.zeros(0)
 
         bi = self.boundary_info
         gd = self._grid_data
         SUPE = gd['SUPE']
-        VOLS0 = gd['VOLS0']
         VOLS1 = gd['VOLS1']
         BOUNDARIES = gd['BOUNDARIES']
         CENTERS = gd['CENTERS']
         DIRICHLET_BOUNDARIES = gd['DIRICHLET_BOUNDARIES']
         NEUMANN_BOUNDARIES = gd['NEUMANN_BOUNDARIES']
         UNIT_OUTER_NORMALS = gd['UNIT_OUTER_NORMALS']
-
+        FLUX_SCATTER = gd['FLUX_SCATTER']
+
+        # evaluate the numerical fluxes for all vectors at once by treating the concatenation
+        # of all vectors as the DOFs of a single vector on len(U) disjoint copies of the grid
+        num_vectors, num_edges = len(U), len(SUPE)
+        SUPE_batch = (SUPE[np.newaxis, :, :]
+                      + (np.arange(num_vectors) * self.source.dim)[:, np.newaxis, np.newaxis]).reshape((-1, 2))
+        BOUNDARIES_batch = (BOUNDARIES[np.newaxis, :]
+                            + (np.arange(num_vectors) * num_edges)[:, np.newaxis]).ravel()
+
+        F = self.numerical_flux.evaluate_stage1(U.ravel(), mu)
+        F_edge = [np.take(f, SUPE_batch, axis=0) for f in F]
+        del F
+
+        for f in F_edge:
+            f[BOUNDARIES_batch, 1] = f[BOUNDARIES_batch, 0]
         if bi.has_dirichlet:
             if hasattr(self, '_dirichlet_values'):
                 dirichlet_values = self._dirichlet_values
@@ -287,31 +308,21 @@ class NonlinearAdvectionOperator(Operator):
             else:
                 dirichlet_values = np.zeros_like(DIRICHLET_BOUNDARIES)
             F_dirichlet = self.numerical_flux.evaluate_stage1(dirichlet_values, mu)
+            for f, f_d in zip(F_edge, F_dirichlet):
+                f.reshape((num_vectors, num_edges) + f.shape[1:])[:, DIRICHLET_BOUNDARIES, 1] = f_d
 
-        for i, j in enumerate(range(len(U))):
-            Ui = U[j]
-            Ri = R[i]
-
-            F = self.numerical_flux.evaluate_stage1(Ui, mu)
-            F_edge = [f[SUPE] for f in F]
-
-            for f in F_edge:
-                f[BOUNDARIES, 1] = f[BOUNDARIES, 0]
-            if bi.has_dirichlet:
-                for f, f_d in zip(F_edge, F_dirichlet):
-                    f[DIRICHLET_BOUNDARIES, 1] = f_d
+        NUM_FLUX = self.numerical_flux.evaluate_stage2(F_edge,
+                                                       np.tile(UNIT_OUTER_NORMALS, (num_vectors, 1)),
+                                                       np.tile(VOLS1, num_vectors),
+                                                       mu).reshape((num_vectors, num_edges))
+        del F_edge
 
-            NUM_FLUX = self.numerical_flux.evaluate_stage2(F_edge, UNIT_OUTER_NORMALS, VOLS1, mu)
-
-            if bi.has_neumann:
-                NUM_FLUX[NEUMANN_BOUNDARIES] = 0
-
-            np.add.at(Ri, SUPE[:, 0], NUM_FLUX)
-            np.subtract.at(Ri, SUPE[:, 1], NUM_FLUX)
+        if bi.has_neumann:
+            NUM_FLUX[:, NEUMANN_BOUNDARIES] = 0
 
-        R[:, :-1] /= VOLS0
+        R = (FLUX_SCATTER @ NUM_FLUX.T).T
 
-        return self.range.make_array(R[:, :-1])
+        return self.range.make_array(R)
 
     def jacobian(self, U, mu=None):
         assert U in self.source and len(U) == 1
@@ -781,77 +792,107 @@ class DiffusionOperator(NumpyMatrixBasedOperator):
 
     def _assemble(self, mu=None):
         grid = self.grid
+        indptr, indices, positions, geometric_fluxes, flux_points = _diffusion_assembly_plan(grid, self.boundary_info)
 
-        # compute the local coordinates of the codim-1 subentity centers in the reference element
-        reference_element = grid.reference_element(0)
-        subentity_embedding = reference_element.subentity_embedding(1)
-        subentity_centers = (np.einsum('eij,j->ei',
-                                       subentity_embedding[0], reference_element.sub_reference_element(1).center())
-                             + subentity_embedding[1])
-
-        # compute shift for periodic boundaries
-        embeddings = grid.embeddings(0)
-        superentities = grid.superentities(1, 0)
-        superentity_indices = grid.superentity_indices(1, 0)
-        boundary_mask = grid.boundary_mask(1)
-        inner_mask = ~boundary_mask
-        SE_I0 = superentities[:, 0]
-        SE_I1 = superentities[:, 1]
-        SE_I0_I = SE_I0[inner_mask]
-        SE_I1_I = SE_I1[inner_mask]
-
-        SHIFTS = (np.einsum('eij,ej->ei',
-                            embeddings[0][SE_I0_I, :, :],
-                            subentity_centers[superentity_indices[:, 0][inner_mask]])
-                  + embeddings[1][SE_I0_I, :])
-        SHIFTS -= (np.einsum('eij,ej->ei',
-                             embeddings[0][SE_I1_I, :, :],
-                             subentity_centers[superentity_indices[:, 1][inner_mask]])
-                   + embeddings[1][SE_I1_I, :])
-
-        # comute distances for gradient approximations
-        centers = grid.centers(1)
-        orthogonal_centers = grid.orthogonal_centers()
-        VOLS = grid.volumes(1)
-
-        INNER_DISTS = np.linalg.norm(orthogonal_centers[SE_I0_I, :] - orthogonal_centers[SE_I1_I, :] - SHIFTS,
-                                     axis=1)
-        del SHIFTS
-
-        # assemble matrix
-        FLUXES = VOLS[inner_mask] / INNER_DISTS
+        FLUXES = geometric_fluxes
         if self.diffusion_function is not None:
-            FLUXES *= self.diffusion_function(centers[inner_mask], mu=mu)
+            D = self.diffusion_function(flux_points, mu=mu)
+            num_inner = (len(FLUXES) - len(D)) // 3
+            FLUXES = FLUXES * np.concatenate((np.tile(D[:num_inner], 4), D[num_inner:]))
         if self.diffusion_constant is not None:
-            FLUXES *= self.diffusion_constant
-        del INNER_DISTS
-
-        FLUXES = np.concatenate((-FLUXES, -FLUXES, FLUXES, FLUXES))
-        FLUXES_I0 = np.concatenate((SE_I0_I, SE_I1_I, SE_I0_I, SE_I1_I))
-        FLUXES_I1 = np.concatenate((SE_I1_I, SE_I0_I, SE_I0_I, SE_I1_I))
-
-        if self.boundary_info.has_dirichlet:
-            dirichlet_mask = self.boundary_info.dirichlet_mask(1)
-            SE_I0_D = SE_I0[dirichlet_mask]
-            boundary_normals = grid.unit_outer_normals()[SE_I0_D, superentity_indices[:, 0][dirichlet_mask]]
-            BOUNDARY_DISTS = np.sum((centers[dirichlet_mask, :] - orthogonal_centers[SE_I0_D, :]) * boundary_normals,
-                                    axis=-1)
-
-            DIRICHLET_FLUXES = VOLS[dirichlet_mask] / BOUNDARY_DISTS
-            if self.diffusion_function is not None:
-                DIRICHLET_FLUXES *= self.diffusion_function(centers[dirichlet_mask], mu=mu)
-            if self.diffusion_constant is not None:
-                DIRICHLET_FLUXES *= self.diffusion_constant
-
-            FLUXES = np.concatenate((FLUXES, DIRICHLET_FLUXES))
-            FLUXES_I0 = np.concatenate((FLUXES_I0, SE_I0_D))
-            FLUXES_I1 = np.concatenate((FLUXES_I1, SE_I0_D))
-
-        A = coo_matrix((FLUXES, (FLUXES_I0, FLUXES_I1)), shape=(self.source.dim, self.source.dim))
-        A.eliminate_zeros()
-        A = (dia_matrix(([1. / grid.volumes(0)], [0]), shape=(grid.size(0),) * 2) * A).tocsc()
+            FLUXES = FLUXES * self.diffusion_constant
 
-        return A
+        data = np.bincount(positions, weights=FLUXES, minlength=len(indices))
+        # copy the index arrays, as scipy might modify them in-place
+        return csc_matrix((data, indices.copy(), indptr.copy()), shape=(self.source.dim, self.source.dim))
+
+
+@memoized
+def _diffusion_assembly_plan(grid, boundary_info):
+    """Precompute the parameter-independent parts of :class:`DiffusionOperator`.
+
+    Returns
+    -------
+    indptr
+        The `indptr` array of the assembled CSC matrix.
+    indices
+        The `indices` array of the assembled CSC matrix.
+    positions
+        Index in the data array of the CSC matrix for each flux.
+    geometric_fluxes
+        The fluxes for unit diffusion, already divided by the cell volumes.
+    flux_points
+        The inner and Dirichlet codim-1 entity centers at which the diffusion
+        function has to be evaluated.
+    """
+    # compute the local coordinates of the codim-1 subentity centers in the reference element
+    reference_element = grid.reference_element(0)
+    subentity_embedding = reference_element.subentity_embedding(1)
+    subentity_centers = (np.einsum('eij,j->ei',
+                                   subentity_embedding[0], reference_element.sub_reference_element(1).center())
+                         + subentity_embedding[1])
+
+    # compute shift for periodic boundaries
+    embeddings = grid.embeddings(0)
+    superentities = grid.superentities(1, 0)
+    superentity_indices = grid.superentity_indices(1, 0)
+    boundary_mask = grid.boundary_mask(1)
+    inner_mask = ~boundary_mask
+    SE_I0 = superentities[:, 0]
+    SE_I1 = superentities[:, 1]
+    SE_I0_I = SE_I0[inner_mask]
+    SE_I1_I = SE_I1[inner_mask]
+
+    SHIFTS = (np.einsum('eij,ej->ei',
+                        embeddings[0][SE_I0_I, :, :],
+                        subentity_centers[superentity_indices[:, 0][inner_mask]])
+              + embeddings[1][SE_I0_I, :])
+    SHIFTS -= (np.einsum('eij,ej->ei',
+                         embeddings[0][SE_I1_I, :, :],
+                         subentity_centers[superentity_indices[:, 1][inner_mask]])
+               + embeddings[1][SE_I1_I, :])
+
+    # comute distances for gradient approximations
+    centers = grid.centers(1)
+    orthogonal_centers = grid.orthogonal_centers()
+    VOLS = grid.volumes(1)
+
+    INNER_DISTS = np.linalg.norm(orthogonal_centers[SE_I0_I, :] - orthogonal_centers[SE_I1_I, :] - SHIFTS,
+                                 axis=1)
+    del SHIFTS
+
+    FLUXES = VOLS[inner_mask] / INNER_DISTS
+    del INNER_DISTS
+
+    FLUXES = np.concatenate((-FLUXES, -FLUXES, FLUXES, FLUXES))
+    FLUXES_I0 = np.concatenate((SE_I0_I, SE_I1_I, SE_I0_I, SE_I1_I))
+    FLUXES_I1 = np.concatenate((SE_I1_I, SE_I0_I, SE_I0_I, SE_I1_I))
+    POINTS = centers[inner_mask]
+
+    if boundary_info.has_dirichlet:
+        dirichlet_mask = boundary_info.dirichlet_mask(1)
+        SE_I0_D = SE_I0[dirichlet_mask]
+        boundary_normals = grid.unit_outer_normals()[SE_I0_D, superentity_indices[:, 0][dirichlet_mask]]
+        BOUNDARY_DISTS = np.sum((centers[dirichlet_mask, :] - orthogonal_centers[SE_I0_D, :]) * boundary_normals,
+                                axis=-1)
+
+        DIRICHLET_FLUXES = VOLS[dirichlet_mask] / BOUNDARY_DISTS
+
+        FLUXES = np.concatenate((FLUXES, DIRICHLET_FLUXES))
+        FLUXES_I0 = np.concatenate((FLUXES_I0, SE_I0_D))
+        FLUXES_I1 = np.concatenate((FLUXES_I1, SE_I0_D))
+        POINTS = np.concatenate((POINTS, centers[dirichlet_mask]))
+
+    FLUXES /= grid.volumes(0)[FLUXES_I0]
+
+    # sort the fluxes by column and row, identify duplicates
+    n = grid.size(0)
+    keys, positions = np.unique(FLUXES_I1.astype(np.int64) * n + FLUXES_I0, return_inverse=True)
+    indices = (keys % n).astype(np.int32)
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(np.bincount(keys // n, minlength=n), out=indptr[1:])
+
+    return indptr, indices, positions, FLUXES, POINTS
 
 
 class InterpolationOperator(NumpyMatrixBasedOperator):
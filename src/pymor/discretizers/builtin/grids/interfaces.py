@@ -2,9 +2,13 @@
 # Copyright pyMOR developers and contributors. All rights reserved.
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 
+import functools
+import inspect
+
 import numpy as np
 
 from pymor.analyticalproblems.domaindescriptions import KNOWN_BOUNDARY_TYPES
+from pymor.core import cache
 from pymor.core.base import abstractmethod
 from pymor.core.cache import CacheableObject, cached
 from pymor.core.logger import getLogger
@@ -12,6 +16,66 @@ from pymor.discretizers.builtin.inverse import inv_transposed_two_by_two
 from pymor.discretizers.builtin.relations import inverse_relation
 
 
+def memoized(function):
+    """Decorator to store the return values of a method in the instance it is called on.
+
+    This is a lightweight alternative to :func:`~pymor.core.cache.cached` for the
+    geometric and topological data of |Grids|: no cache key is built and the returned
+    values are not copied. Instead, all returned |NumPy arrays| are made read-only.
+    The values are stored in a dict attached to the instance, which is not pickled.
+
+    As with :func:`~pymor.core.cache.cached`, nothing is stored when caching is
+    disabled globally or for the given instance. The memory occupied by the stored
+    values can be determined using :func:`memoized_size`.
+    """
+    params = list(inspect.signature(function).parameters.values())[1:]  # first argument is self
+    if any(p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD) for p in params):
+        raise NotImplementedError
+    argnames = [p.name for p in params]
+    defaults = {p.name: p.default for p in params if p.default is not p.empty}
+    name = function.__name__
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        if cache._caching_disabled or self.cache_region is None:
+            return function(self, *args, **kwargs)
+        if kwargs or len(args) < len(argnames):
+            kwargs = dict(defaults, **kwargs, **dict(zip(argnames, args)))
+            args = tuple(kwargs[k] for k in argnames)
+        store = self.__dict__.get('_memoized_values')
+        if store is None:
+            store = self.__dict__['_memoized_values'] = {}
+        key = (name,) + args
+        try:
+            return store[key]
+        except KeyError:
+            value = store[key] = _make_read_only(function(self, *args))
+            return value
+
+    return wrapper
+
+
+def memoized_size(obj):
+    """Size in bytes of the |NumPy arrays| stored by :func:`memoized` methods of `obj`."""
+    def size(value):
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        elif isinstance(value, tuple):
+            return sum(size(v) for v in value)
+        else:
+            return 0
+    return sum(size(v) for v in obj.__dict__.get('_memoized_values', {}).values())
+
+
+def _make_read_only(value):
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, tuple):
+        for v in value:
+            _make_read_only(v)
+    return value
+
+
 class ReferenceElement(CacheableObject):
     """Defines a reference element.
 
@@ -149,6 +213,9 @@ class Grid(CacheableObject):
     The grid is completely determined via the subentity relation given by :meth:`~Grid.subentities`
     and the embeddings given by :meth:`~Grid.embeddings`. In addition, only :meth:`~Grid.size` and
     :meth:`~Grid.reference_element` have to be implemented.
+
+    All derived data is computed on first access and then stored in the grid
+    instance as read-only |NumPy arrays| (see :func:`memoized`).
     """
 
     cache_region = 'memory'
@@ -189,7 +256,7 @@ class Grid(CacheableObject):
         """
         return self._subentities(codim, subentity_codim)
 
-    @cached
+    @memoized
     def _subentities(self, codim, subentity_codim):
         assert 0 <= codim <= self.dim, 'Invalid codimension'
         assert 0 < codim, 'Not implemented'
@@ -217,7 +284,7 @@ class Grid(CacheableObject):
         """
         return self._superentities(codim, superentity_codim)
 
-    @cached
+    @memoized
     def _superentities(self, codim, superentity_codim):
         return self._superentities_with_indices(codim, superentity_codim)[0]
 
@@ -229,11 +296,11 @@ class Grid(CacheableObject):
         """
         return self._superentity_indices(codim, superentity_codim)
 
-    @cached
+    @memoized
     def _superentity_indices(self, codim, superentity_codim):
         return self._superentities_with_indices(codim, superentity_codim)[1]
 
-    @cached
+    @memoized
     def _superentities_with_indices(self, codim, superentity_codim):
         assert 0 <= codim <= self.dim, f'Invalid codimension (was {codim})'
         assert 0 <= superentity_codim <= codim, f'Invalid codimension (was {superentity_codim})'
@@ -256,7 +323,7 @@ class Grid(CacheableObject):
         """
         return self._neighbours(codim, neighbour_codim, intersection_codim)
 
-    @cached
+    @memoized
     def _neighbours(self, codim, neighbour_codim, intersection_codim):
         assert 0 <= codim <= self.dim, 'Invalid codimension'
         assert 0 <= neighbour_codim <= self.dim, 'Invalid codimension'
@@ -311,7 +378,7 @@ class Grid(CacheableObject):
         """
         return self._boundary_mask(codim)
 
-    @cached
+    @memoized
     def _boundary_mask(self, codim):
         M = np.zeros(self.size(codim), dtype='bool')
         B = self.boundaries(codim)
@@ -328,7 +395,7 @@ class Grid(CacheableObject):
         """
         return self._boundaries(codim)
 
-    @cached
+    @memoized
     def _boundaries(self, codim):
         assert 0 <= codim <= self.dim, 'Invalid codimension'
         if codim == 1:
@@ -372,7 +439,7 @@ class Grid(CacheableObject):
         """
         return self._embeddings(codim)
 
-    @cached
+    @memoized
     def _embeddings(self, codim):
         assert codim > 0, NotImplemented
         E = self.superentities(codim, codim - 1)[:, 0]
@@ -396,7 +463,7 @@ class Grid(CacheableObject):
         """
         return self._jacobian_inverse_transposed(codim)
 
-    @cached
+    @memoized
     def _jacobian_inverse_transposed(self, codim):
         assert 0 <= codim < self.dim,\
             f'Invalid Codimension (must be between 0 and {self.dim} but was {codim})'
@@ -412,7 +479,7 @@ class Grid(CacheableObject):
         """`retval[e]` is given as `sqrt(det(A^T*A))`, where `A = embeddings(codim)[0][e]`."""
         return self._integration_elements(codim)
 
-    @cached
+    @memoized
     def _integration_elements(self, codim):
         assert 0 <= codim <= self.dim,\
             f'Invalid Codimension (must be between 0 and {self.dim} but was {codim})'
@@ -442,7 +509,7 @@ class Grid(CacheableObject):
         """
         return self._volumes(codim)
 
-    @cached
+    @memoized
     def _volumes(self, codim):
         assert 0 <= codim <= self.dim,\
             f'Invalid Codimension (must be between 0 and {self.dim} but was {codim})'
@@ -454,7 +521,7 @@ class Grid(CacheableObject):
         """`retval[e] = 1 / volumes(codim)[e]`."""
         return self._volumes_inverse(codim)
 
-    @cached
+    @memoized
     def _volumes_inverse(self, codim):
         return np.reciprocal(self.volumes(codim))
 
@@ -466,7 +533,7 @@ class Grid(CacheableObject):
         """
         return self._unit_outer_normals()
 
-    @cached
+    @memoized
     def _unit_outer_normals(self):
         JIT = self.jacobian_inverse_transposed(0)
         N = np.dot(JIT, self.reference_element(0).unit_outer_normals().T).swapaxes(1, 2)
@@ -476,7 +543,7 @@ class Grid(CacheableObject):
         """`retval[e]` is the barycenter of the codim-`codim` entity with global index `e`."""
         return self._centers(codim)
 
-    @cached
+    @memoized
     def _centers(self, codim):
         assert 0 <= codim <= self.dim,\
             f'Invalid Codimension (must be between 0 and {self.dim} but was {codim})'
@@ -488,7 +555,7 @@ class Grid(CacheableObject):
         """`retval[e]` is the diameter of the codim-`codim` entity with global index `e`."""
         return self._diameters(codim)
 
-    @cached
+    @memoized
     def _diameters(self, codim):
         assert 0 <= codim <= self.dim,\
             f'Invalid Codimension (must be between 0 and {self.dim} but was {codim})'
@@ -507,7 +574,7 @@ class Grid(CacheableObject):
         """
         return self._quadrature_points(codim, order, npoints, quadrature_type)
 
-    @cached
+    @memoized
     def _quadrature_points(self, codim, order, npoints, quadrature_type):
         P, _ = self.reference_element(codim).quadrature(order, npoints, quadrature_type)
         A, B = self.embeddings(codim)
@@ -517,7 +584,7 @@ class Grid(CacheableObject):
         """Returns a `(2, dim)`-shaped array containing lower/upper bounding box coordinates."""
         return self._bounding_box()
 
-    @cached
+    @memoized
     def _bounding_box(self):
         bbox = np.empty((2, self.dim))
         centers = self.centers(self.dim)
@@ -526,6 +593,11 @@ class Grid(CacheableObject):
             bbox[1, dim] = np.max(centers[:, dim])
         return bbox
 
+    def __getstate__(self):
+        d = self.__dict__.copy()
+        d.pop('_memoized_values', None)
+        return d
+
     @classmethod
     def _check_domain(cls, domain):
         ll, rr = np.array(domain[0]), np.array(domain[1])
@@ -571,6 +643,11 @@ class BoundaryInfo(CacheableObject):
     boundary_types = frozenset()
     cache_region = 'memory'
 
+    def __getstate__(self):
+        d = self.__dict__.copy()
+        d.pop('_memoized_values', None)
+        return d
+
     def mask(self, boundary_type, codim):
         """Return mask.
 
@@ -628,7 +705,7 @@ class BoundaryInfo(CacheableObject):
     def robin_mask(self, codim):
         return self.mask('robin', codim)
 
-    @cached
+    @memoized
     def _boundaries(self, boundary_type, codim):
         return np.where(self.mask(boundary_type, codim))[0].astype('int32')
 
@@ -112,7 +112,7 @@ class SubGrid(Grid):
             return super().embeddings(codim)
 
     def __getstate__(self):
-        d = self.__dict__.copy()
+        d = super().__getstate__()
         del d['_SubGrid__parent_grid']
         return d
 
@@ -4,8 +4,7 @@
 
 import numpy as np
 
-from pymor.core.cache import cached
-from pymor.discretizers.builtin.grids.interfaces import GridWithOrthogonalCenters
+from pymor.discretizers.builtin.grids.interfaces import GridWithOrthogonalCenters, memoized
 from pymor.discretizers.builtin.grids.referenceelements import triangle
 
 
@@ -198,7 +197,7 @@ class TriaGrid(GridWithOrthogonalCenters):
     def bounding_box(self):
         return np.array(self.domain)
 
-    @cached
+    @memoized
     def orthogonal_centers(self):
         embeddings = self.embeddings(0)
         ne4 = len(embeddings[0]) // 4
@@ -5,8 +5,12 @@
 import numpy as np
 
 from pymor.algorithms.timestepping import TimeStepper
+from pymor.core.defaults import defaults
+from pymor.core.exceptions import InversionError
 from pymor.models.interface import Model
-from pymor.operators.constructions import IdentityOperator, VectorOperator, ZeroOperator, ConstantOperator
+from pymor.operators.constructions import (IdentityOperator, LincombOperator, VectorOperator, ZeroOperator,
+                                           ConstantOperator)
+from pymor.operators.numpy import NumpyMatrixOperator
 from pymor.vectorarrays.interface import VectorArray
 from pymor.vectorarrays.numpy import NumpyVectorSpace
 
@@ -85,6 +89,126 @@ class StationaryModel(Model):
             f'    dim_output:      {self.dim_output}'
         )
 
+    @defaults('batch_size')
+    def solve_batch(self, mus, batch_size=1000):
+        """Solve the model for multiple |parameter values| at once.
+
+        If :attr:`operator` and :attr:`rhs` are dense |NumpyMatrixOperators| or
+        |LincombOperators| of those, as it is usually the case for reduced models,
+        the linear coefficients are evaluated for all |parameter values|, the
+        system matrices are assembled by a single tensor contraction with the
+        affine components and all systems are solved by a single call of
+        :func:`numpy.linalg.solve`. Otherwise, :meth:`solve` is called for each
+        |parameter values|.
+
+        In contrast to :meth:`solve`, the solutions are not cached.
+
+        Parameters
+        ----------
+        mus
+            List of |parameter values| for which to solve or a 2D |NumPy array|
+            whose rows are the |parameter values| in the layout described in
+            :meth:`~pymor.parameters.base.Parameters.parse_batch`.
+        batch_size
+            The maximum number of systems which are assembled and solved at once.
+
+        Returns
+        -------
+        |VectorArray| containing the solutions for all `mus`.
+        """
+        mus = self._parse_mus(mus)
+        if not self._batchable(output=False):
+            U = self.solution_space.empty(reserve=len(mus))
+            for mu in mus:
+                U.append(self.solve(self.parameters.parse(mu)))
+            return U
+        U = [U for _, U in self._batch_solutions(mus, batch_size)]
+        return self.solution_space.make_array(np.concatenate(U) if U else np.zeros((0, self.solution_space.dim)))
+
+    @defaults('batch_size')
+    def output_batch(self, mus, batch_size=1000):
+        """Compute the model output for multiple |parameter values| at once.
+
+        See :meth:`solve_batch` for details.
+
+        Parameters
+        ----------
+        mus
+            List of |parameter values| for which to compute the output or a
+            2D |NumPy array| of |parameter values|, see :meth:`solve_batch`.
+        batch_size
+            The maximum number of systems which are assembled and solved at once.
+
+        Returns
+        -------
+        2D |NumPy array| of shape `(len(mus), self.dim_output)` whose rows are
+        the outputs for the respective `mus`.
+        """
+        mus = self._parse_mus(mus)
+        if not self._batchable(output=True):
+            outputs = [self.output(self.parameters.parse(mu))[0] for mu in mus]
+            return np.array(outputs).reshape((len(mus), self.dim_output))
+        C, C_matrices = _dense_affine_decomposition(self.output_functional)
+        outputs = [np.einsum('mq,qkn,mn->mk', C.evaluate_coefficients_batch(batch, self.parameters), C_matrices, U)
+                   for batch, U in self._batch_solutions(mus, batch_size)]
+        return np.concatenate(outputs) if outputs else np.zeros((0, self.dim_output))
+
+    @defaults('batch_size')
+    def estimate_error_batch(self, mus, batch_size=1000):
+        """Estimate the error of the solutions for multiple |parameter values| at once.
+
+        If the solutions can be computed in batches (see :meth:`solve_batch`) and
+        :attr:`error_estimator` provides an `estimate_error_batch` method, the error
+        estimates for each batch of solutions are computed by a single call of this
+        method. Otherwise, :meth:`estimate_error` is called for each |parameter values|.
+
+        In contrast to :meth:`estimate_error`, neither solutions nor estimates are cached.
+
+        Parameters
+        ----------
+        mus
+            List of |parameter values| for which to estimate the error or a
+            2D |NumPy array| of |parameter values|, see :meth:`solve_batch`.
+        batch_size
+            The maximum number of systems which are assembled and solved at once.
+
+        Returns
+        -------
+        1D |NumPy array| of the estimated errors for all `mus`.
+        """
+        if self.error_estimator is None:
+            raise ValueError('Model has no error estimator')
+        mus = self._parse_mus(mus)
+        if not (hasattr(self.error_estimator, 'estimate_error_batch') and self._batchable(output=False)):
+            estimates = [self.estimate_error(self.parameters.parse(mu)) for mu in mus]
+            return np.array(estimates, dtype=float).reshape(len(mus))
+        estimates = [self.error_estimator.estimate_error_batch(self.solution_space.make_array(U), batch, self)
+                     for batch, U in self._batch_solutions(mus, batch_size)]
+        return np.concatenate(estimates) if estimates else np.zeros(0)
+
+    def _batchable(self, output):
+        return (not self.operator.solver_options
+                and _dense_affine_decomposition(self.operator) is not None
+                and _dense_affine_decomposition(self.rhs) is not None
+                and (not output or _dense_affine_decomposition(self.output_functional) is not None))
+
+    def _batch_solutions(self, mus, batch_size):
+        A, A_matrices = _dense_affine_decomposition(self.operator)
+        F, F_matrices = _dense_affine_decomposition(self.rhs)
+        if A_matrices.shape[1] != A_matrices.shape[2]:
+            raise InversionError
+        for i in range(0, len(mus), batch_size):
+            batch = mus[i:i+batch_size]
+            A_batch = np.tensordot(A.evaluate_coefficients_batch(batch, self.parameters), A_matrices, axes=1)
+            F_batch = F.evaluate_coefficients_batch(batch, self.parameters) @ F_matrices[:, :, 0]
+            try:
+                U = np.linalg.solve(A_batch, F_batch[:, :, np.newaxis])[:, :, 0]
+            except np.linalg.LinAlgError as e:
+                raise InversionError(f'{str(type(e))}: {str(e)}') from e
+            if not np.isfinite(np.sum(U)):
+                raise InversionError('Result contains non-finite values')
+            yield batch, U
+
     def _compute_solution(self, mu=None, **kwargs):
         return self.operator.apply_inverse(self.rhs.as_range_array(mu), mu=mu)
 
@@ -217,6 +341,26 @@ class StationaryModel(Model):
                           error_estimator=None)
 
 
+def _dense_affine_decomposition(op):
+    """Linear combination and stacked matrices of an affinely decomposed dense operator."""
+    if isinstance(op, LincombOperator):
+        operators = op.operators
+    else:
+        operators, op = (op,), LincombOperator((op,), (1.,))
+    matrices = []
+    for o in operators:
+        if isinstance(o, NumpyMatrixOperator) and not o.sparse:
+            matrices.append(o.matrix)
+        elif isinstance(o, VectorOperator) and isinstance(o.range, NumpyVectorSpace):
+            matrices.append(o.array.to_numpy().T)
+        elif isinstance(o, ZeroOperator) and isinstance(o.source, NumpyVectorSpace) \
+                and isinstance(o.range, NumpyVectorSpace):
+            matrices.append(np.zeros((o.range.dim, o.source.dim)))
+        else:
+            return None
+    return op, np.array(matrices)
+
+
 class InstationaryModel(Model):
     """Generic class for models of instationary problems.
 
@@ -326,15 +470,167 @@ class InstationaryModel(Model):
     def with_time_stepper(self, **kwargs):
         return self.with_(time_stepper=self.time_stepper.with_(**kwargs))
 
+    def iterate(self, mu=None, input=None):
+        """Iterate over the solution trajectory for given |parameter values| `mu`.
+
+        In contrast to :meth:`~pymor.models.interface.Model.solve`, the solution
+        trajectory is not stored. Instead, the solution vectors are yielded one
+        after another as soon as they have been computed by the
+        :meth:`time-stepper <pymor.algorithms.timestepping.TimeStepper.iterate>`.
+        This allows to process long trajectories, e.g. to compute derived
+        quantities or to write the trajectory to disk, with constant memory
+        requirements.
+
+        Parameters
+        ----------
+        mu
+            |Parameter values| for which to solve.
+        input
+            The model input. Either a |NumPy array| of shape `(self.dim_input,)`,
+            a |Function| with `dim_domain == 1` and `shape_range == (self.dim_input,)`
+            mapping time to input, or a `str` expression with `t` as variable that
+            can be used to instantiate an |ExpressionFunction| of this type.
+            Can be `None` if `self.dim_input == 0`.
+
+        Yields
+        ------
+        t
+            The current time.
+        U
+            |VectorArray| of length 1 containing the solution at time `t`.
+        """
+        return self._iterate_solution(self._parse_mu_and_input(mu, input))
+
+    @defaults('batch_size')
+    def solve_batch(self, mus, batch_size=100):
+        """Solve the model for multiple |parameter values| at once.
+
+        If :attr:`operator`, :attr:`rhs` and :attr:`initial_data` are time-independent
+        dense |NumpyMatrixOperators| or |LincombOperators| of those, :attr:`mass` is
+        the identity or a non-parametric dense |NumpyMatrixOperator|, as it is usually
+        the case for reduced models, and the :attr:`time_stepper` implements
+        :meth:`~pymor.algorithms.timestepping.TimeStepper.solve_batch`, the system
+        matrices for all |parameter values| are assembled by a single tensor contraction
+        with the affine components and all trajectories are computed simultaneously.
+        Otherwise, :meth:`solve` is called for each |parameter values|.
+
+        In contrast to :meth:`solve`, the solutions are not cached.
+
+        Parameters
+        ----------
+        mus
+            List of |parameter values| for which to solve or a 2D |NumPy array|
+            whose rows are the |parameter values| in the layout described in
+            :meth:`~pymor.parameters.base.Parameters.parse_batch`.
+        batch_size
+            The maximum number of trajectories which are computed at once.
+
+        Returns
+        -------
+        List of |VectorArrays| containing the solution trajectories for all `mus`.
+        """
+        mus = self._parse_mus(mus)
+        if not self._batchable(output=False):
+            return [self.solve(self.parameters.parse(mu)) for mu in mus]
+        return [self.solution_space.make_array(U_mu)
+                for _, U in self._batch_trajectories(mus, batch_size) for U_mu in U]
+
+    @defaults('batch_size')
+    def output_batch(self, mus, batch_size=100):
+        """Compute the model output for multiple |parameter values| at once.
+
+        See :meth:`solve_batch` for details.
+
+        Parameters
+        ----------
+        mus
+            List of |parameter values| for which to compute the output or a
+            2D |NumPy array| of |parameter values|, see :meth:`solve_batch`.
+        batch_size
+            The maximum number of trajectories which are computed at once.
+
+        Returns
+        -------
+        3D |NumPy array| of shape `(len(mus), num_values, self.dim_output)`
+        containing the output trajectories for the respective `mus`.
+        """
+        mus = self._parse_mus(mus)
+        if not self._batchable(output=True):
+            outputs = [self.output(self.parameters.parse(mu)) for mu in mus]
+            return np.array(outputs) if outputs else np.zeros((0, 0, self.dim_output))
+        C, C_matrices = _dense_affine_decomposition(self.output_functional)
+        outputs = [np.einsum('mq,qon,mkn->mko', C.evaluate_coefficients_batch(batch, self.parameters), C_matrices, U)
+                   for batch, U in self._batch_trajectories(mus, batch_size)]
+        return np.concatenate(outputs) if outputs else np.zeros((0, 0, self.dim_output))
+
+    def _dense_system(self):
+        # whether mass and operator are time-independent dense matrices, as it is usually
+        # the case for reduced models
+        if not (isinstance(self.mass, IdentityOperator)
+                or isinstance(self.mass, NumpyMatrixOperator) and not self.mass.sparse and not self.mass.parametric):
+            return False
+        operators = self.operator.operators if isinstance(self.operator, LincombOperator) else (self.operator,)
+        return (not self.operator.solver_options
+                and 't' not in self.operator.parameters
+                and all(isinstance(op, NumpyMatrixOperator) and not op.sparse for op in operators))
+
+    def _batchable(self, output):
+        if not self._dense_system():
+            return False
+        if type(self.time_stepper).solve_batch is TimeStepper.solve_batch:
+            return False
+        operators = (self.operator, self.rhs, self.initial_data) + ((self.output_functional,) if output else ())
+        return (self.dim_input == 0
+                and all('t' not in op.parameters and _dense_affine_decomposition(op) is not None
+                        for op in operators))
+
+    def _batch_trajectories(self, mus, batch_size):
+        A, A_matrices = _dense_affine_decomposition(self.operator)
+        F, F_matrices = _dense_affine_decomposition(self.rhs)
+        U0, U0_matrices = _dense_affine_decomposition(self.initial_data)
+        M = None if isinstance(self.mass, IdentityOperator) else self.mass.matrix
+        for i in range(0, len(mus), batch_size):
+            batch = mus[i:i+batch_size]
+            A_batch = np.tensordot(A.evaluate_coefficients_batch(batch, self.parameters), A_matrices, axes=1)
+            F_batch = (None if isinstance(self.rhs, ZeroOperator) else
+                       F.evaluate_coefficients_batch(batch, self.parameters) @ F_matrices[:, :, 0])
+            U0_batch = U0.evaluate_coefficients_batch(batch, self.parameters) @ U0_matrices[:, :, 0]
+            U = self.time_stepper.solve_batch(0, self.T, U0_batch, A_batch, rhs=F_batch, mass=M,
+                                              num_values=self.num_values)
+            yield batch, U
+
+    def _compute(self, solution=False, output=False, solution_d_mu=False, output_d_mu=False,
+                 solution_error_estimate=False, output_error_estimate=False, mu=None, **kwargs):
+        # when only the output is requested and the solution trajectory is not going to be
+        # cached anyway, compute the output step by step without storing the trajectory;
+        # for dense systems, storing the trajectory is cheap and the time-stepper's own
+        # solve method (e.g. using a preassembled propagator) is much faster
+        if (output and not (solution or solution_d_mu or output_d_mu
+                            or solution_error_estimate or output_error_estimate)
+                and self.cache_region is None
+                and not (type(self.time_stepper).solve is not TimeStepper.solve and self._dense_system())):
+            return {'output': np.vstack([self.output_functional.apply(U, mu=mu).to_numpy()
+                                         for _, U in self._iterate_solution(mu)])}
+        return super()._compute(solution=solution, output=output,
+                                solution_d_mu=solution_d_mu, output_d_mu=output_d_mu,
+                                solution_error_estimate=solution_error_estimate,
+                                output_error_estimate=output_error_estimate,
+                                mu=mu, **kwargs)
+
     def _compute_solution(self, mu=None, **kwargs):
+        return self._time_stepper_call(self.time_stepper.solve, mu)
+
+    def _iterate_solution(self, mu):
+        return self._time_stepper_call(self.time_stepper.iterate, mu)
+
+    def _time_stepper_call(self, method, mu):
         mu = mu.with_(t=0.)
         U0 = self.initial_data.as_range_array(mu)
-        U = self.time_stepper.solve(operator=self.operator,
-                                    rhs=None if isinstance(self.rhs, ZeroOperator) else self.rhs,
-                                    initial_data=U0,
-                                    mass=None if isinstance(self.mass, IdentityOperator) else self.mass,
-                                    initial_time=0, end_time=self.T, mu=mu, num_values=self.num_values)
-        return U
+        return method(operator=self.operator,
+                      rhs=None if isinstance(self.rhs, ZeroOperator) else self.rhs,
+                      initial_data=U0,
+                      mass=None if isinstance(self.mass, IdentityOperator) else self.mass,
+                      initial_time=0, end_time=self.T, mu=mu, num_values=self.num_values)
 
     def to_lti(self):
         """Convert model to |LTIModel|.
@@ -336,15 +336,7 @@ class Model(CacheableObject, ParametricObject):
         assert kwargs.keys() <= self._compute_allowed_kwargs
         assert input is not None or self.dim_input == 0
 
-        # parse parameter values
-        if not isinstance(mu, Mu):
-            mu = self.parameters.parse(mu)
-        assert self.parameters.assert_compatible(mu)
-
-        # parse input and add it to the parameter values
-        mu_input = Parameters(input=self.dim_input).parse(input)
-        input = mu_input.get_time_dependent_value('input') if mu_input.is_time_dependent('input') else mu_input['input']
-        mu = mu.with_(input=input)
+        mu = self._parse_mu_and_input(mu, input)
 
         # log output
         # explicitly checking if logging is disabled saves some cpu cycles
@@ -422,6 +414,23 @@ class Model(CacheableObject, ParametricObject):
 
         return data
 
+    def _parse_mu_and_input(self, mu, input):
+        # parse parameter values
+        if not isinstance(mu, Mu):
+            mu = self.parameters.parse(mu)
+        assert self.parameters.assert_compatible(mu)
+
+        # parse input and add it to the parameter values
+        mu_input = Parameters(input=self.dim_input).parse(input)
+        input = mu_input.get_time_dependent_value('input') if mu_input.is_time_dependent('input') else mu_input['input']
+        return mu.with_(input=input)
+
+    def _parse_mus(self, mus):
+        mus = self.parameters.parse_batch(mus)
+        if not self.logging_disabled:
+            self.logger.info(f'Solving {self.name} for {len(mus)} parameter values ...')
+        return mus
+
     def solve(self, mu=None, input=None, return_error_estimate=False, **kwargs):
         """Solve the discrete problem for the |parameter values| `mu`.
 
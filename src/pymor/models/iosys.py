@@ -6,6 +6,7 @@ from numbers import Number
 import numpy as np
 import scipy.linalg as spla
 import scipy.sparse as sps
+import scipy.sparse.linalg as spsla
 
 from pymor.algorithms.bernoulli import bernoulli_stabilize
 from pymor.algorithms.eigs import eigs
@@ -37,7 +38,23 @@ def sparse_min_size(value=1000):
     return value
 
 
-class LTIModel(Model):
+class _PickleByInitArgumentsMixin:
+    """Pickle models by their `__init__` arguments.
+
+    The transfer functions of the models hold closures of the model, which cannot
+    be pickled. Instead, the transfer function is recreated by `__init__` when
+    unpickling.
+    """
+
+    def __reduce__(self):
+        return (_from_init_arguments, (type(self), {arg: getattr(self, arg) for arg in self._init_arguments}))
+
+
+def _from_init_arguments(cls, kwargs):
+    return cls(**kwargs)
+
+
+class LTIModel(_PickleByInitArgumentsMixin, Model):
     r"""Class for linear time-invariant systems.
 
     This class describes input-state-output systems given by
@@ -218,7 +235,9 @@ class LTIModel(Model):
         self.transfer_function = FactorizedTransferFunction(
             self.dim_input, self.dim_output,
             K, B, C, D, dK, dB, dC, dD,
-            parameters=parameters, sampling_time=sampling_time, name=self.name + '_transfer_function')
+            parameters=parameters, sampling_time=sampling_time, name=self.name + '_transfer_function',
+            tf_batch=self._tf_batch)
+        self.transfer_function._model = self
 
     def __str__(self):
         string = (
@@ -828,6 +847,69 @@ class LTIModel(Model):
 
         return y
 
+    def _tf_batch(self, s, mu=None):
+        """Evaluate the transfer function for a one-dimensional array `s`.
+
+        For dense systems, the transfer function is evaluated using a (generalized)
+        Schur decomposition of `A` (and `E`), which is computed only once, such that each
+        evaluation only requires the solution of a triangular system.
+        For sparse systems, the fill-reducing column ordering of the LU decomposition of
+        `s[0] * E - A` is reused for all values in `s`.
+        If `A` or `E` are not |NumpyMatrixOperators|, the transfer function is
+        evaluated separately for each value in `s`.
+        """
+        A, B, C, D, E = (op.assemble(mu=mu) for op in [self.A, self.B, self.C, self.D, self.E])
+        if (len(s) == 0
+                or not isinstance(A, NumpyMatrixOperator)
+                or not isinstance(E, (IdentityOperator, NumpyMatrixOperator))):
+            if len(s) == 0:
+                return np.empty((0, self.dim_output, self.dim_input), dtype=complex)
+            return np.stack([self.transfer_function.tf(si, mu=mu) for si in s])
+
+        B, C, D = (to_matrix(op, format='dense') for op in [B, C, D])
+        tfs = np.empty((len(s), self.dim_output, self.dim_input), dtype=complex)
+        if not A.sparse:
+            T, S, CZ, QB = self._tf_schur(mu=mu)
+            diag = np.diag_indices(self.order)
+            for i, si in enumerate(s):
+                if S is None:
+                    K = np.negative(T)
+                    K[diag] += si
+                else:
+                    K = si * S
+                    K -= T
+                if self.dim_input <= self.dim_output:
+                    tfs[i] = CZ @ spla.solve_triangular(K, QB, check_finite=False)
+                else:
+                    tfs[i] = spla.solve_triangular(K, CZ.conj().T, trans='C', check_finite=False).conj().T @ QB
+        else:
+            A = A.matrix
+            E = (sps.eye(self.order, format='csc') if isinstance(E, IdentityOperator)
+                 else sps.csc_matrix(E.matrix))
+            q = np.argsort(spsla.splu((s[0] * E - A).tocsc()).perm_c)
+            A, E = A.tocsc()[:, q], E[:, q]
+            for i, si in enumerate(s):
+                lu = spsla.splu((si * E - A).tocsc(), permc_spec='NATURAL')
+                if self.dim_input <= self.dim_output:
+                    X = np.empty((self.order, self.dim_input), dtype=complex)
+                    X[q] = lu.solve(B.astype(complex))
+                    tfs[i] = C @ X
+                else:
+                    Y = lu.solve(C.conj().T[q].astype(complex), trans='H')
+                    tfs[i] = Y.conj().T @ B
+        tfs += D
+        return tfs
+
+    @cached
+    def _tf_schur(self, mu=None):
+        A, B, C, E = (op.assemble(mu=mu) for op in [self.A, self.B, self.C, self.E])
+        A, B, C = (to_matrix(op, format='dense') for op in [A, B, C])
+        if isinstance(E, IdentityOperator):
+            T, Z = spla.schur(A, output='complex')
+            return T, None, C @ Z, Z.conj().T @ B
+        T, S, Q, Z = spla.qz(A, to_matrix(E, format='dense'), output='complex')
+        return T, S, C @ Z, Q.conj().T @ B
+
     @cached
     def _poles(self, mu=None):
         A = self.A.assemble(mu=mu)
@@ -1452,7 +1534,7 @@ class LTIModel(Model):
         return self.moebius_substitution(d2c, sampling_time=0)
 
 
-class PHLTIModel(Model):
+class PHLTIModel(_PickleByInitArgumentsMixin, Model):
     r"""Class for (continuous) port-Hamiltonian linear time-invariant systems.
 
     This class describes input-state-output systems given by
@@ -1578,6 +1660,7 @@ class PHLTIModel(Model):
             self.dim_input, self.dim_output,
             K, B, C, D, dK, dB, dC, dD,
             parameters=parameters, name=self.name + '_transfer_function')
+        self.transfer_function._model = self
 
         self._lti_model = LTIModel(A=self.J - self.R,
                                    B=self.G - self.P,
@@ -1935,7 +2018,7 @@ class PHLTIModel(Model):
         return other * self.to_lti()
 
 
-class SecondOrderModel(Model):
+class SecondOrderModel(_PickleByInitArgumentsMixin, Model):
     r"""Class for linear second order systems.
 
     This class describes input-output systems given by
@@ -2073,6 +2156,7 @@ class SecondOrderModel(Model):
             self.dim_input, self.dim_output,
             K, B, C, D, dK, dB, dC, dD,
             parameters=parameters, sampling_time=sampling_time, name=self.name + '_transfer_function')
+        self.transfer_function._model = self
 
         self._lti_model = LTIModel(A=SecondOrderModelOperator(0, 1, -self.E, -self.K),
                                    B=BlockColumnOperator([ZeroOperator(self.B.range, self.B.source), self.B]),
@@ -2622,7 +2706,7 @@ class SecondOrderModel(Model):
         return self.to_lti().hankel_norm(mu=mu)
 
 
-class LinearDelayModel(Model):
+class LinearDelayModel(_PickleByInitArgumentsMixin, Model):
     r"""Class for linear delay systems.
 
     This class describes input-state-output systems given by
@@ -2765,6 +2849,7 @@ class LinearDelayModel(Model):
             self.dim_input, self.dim_output,
             K, B, C, D, dK, dB, dC, dD,
             parameters=parameters, sampling_time=sampling_time, name=self.name + '_transfer_function')
+        self.transfer_function._model = self
 
     def __str__(self):
         string = (
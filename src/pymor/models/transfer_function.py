@@ -38,6 +38,13 @@ class TransferFunction(CacheableObject, ParametricObject):
         sampling time (in seconds).
     name
         Name of the system.
+    tf_batch
+        The transfer function H evaluated for multiple values of `s` at once, given by a
+        callable that takes a one-dimensional |NumPy array| `s` and, if parametric, a
+        |parameter value| `mu` (optional).
+        The result of `tf_batch(s, mu)` is a |NumPy array| of shape
+        `(len(s), dim_output, dim_input)`.
+        If not given, `tf` is called for each value in `s`.
 
     Attributes
     ----------
@@ -49,11 +56,14 @@ class TransferFunction(CacheableObject, ParametricObject):
         The transfer function.
     dtf
         The complex derivative of the transfer function.
+    tf_batch
+        The batched transfer function.
     """
 
     cache_region = 'memory'
 
-    def __init__(self, dim_input, dim_output, tf, dtf=None, parameters={}, sampling_time=0, name=None):
+    def __init__(self, dim_input, dim_output, tf, dtf=None, parameters={}, sampling_time=0, name=None,
+                 tf_batch=None):
         sampling_time = float(sampling_time)
         assert sampling_time >= 0
 
@@ -80,21 +90,28 @@ class TransferFunction(CacheableObject, ParametricObject):
         Parameters
         ----------
         s
-            Laplace variable as a complex number.
+            Laplace variable as a complex number or a one-dimensional |NumPy array|
+            of complex numbers.
         mu
             |Parameter values|.
 
         Returns
         -------
-        Transfer function value as a 2D |NumPy array|.
+        Transfer function value as a 2D |NumPy array| or, if `s` is a one-dimensional
+        array, a 3D |NumPy array| of shape `(len(s), self.dim_output, self.dim_input)`.
         """
         if not isinstance(mu, Mu):
             mu = self.parameters.parse(mu)
         assert self.parameters.assert_compatible(mu)
-        if not self.parametric:
-            return self.tf(s)
-        else:
-            return self.tf(s, mu=mu)
+        kwargs = {'mu': mu} if self.parametric else {}
+        if np.ndim(s) == 1:
+            s = np.asarray(s)
+            if self.tf_batch is not None:
+                return self.tf_batch(s, **kwargs)
+            if len(s) == 0:
+                return np.empty((0, self.dim_output, self.dim_input), dtype=complex)
+            return np.stack([self.tf(si, **kwargs) for si in s])
+        return self.tf(s, **kwargs)
 
     @cached
     def eval_dtf(self, s, mu=None):
@@ -121,8 +138,7 @@ class TransferFunction(CacheableObject, ParametricObject):
         else:
             return self.dtf(s, mu=mu)
 
-    @cached
-    def freq_resp(self, w, mu=None, adaptive_type='bode', adaptive_opts=None):
+    def freq_resp(self, w, mu=None, adaptive_type='bode', adaptive_opts=None, pool=None):
         """Evaluate the transfer function on the imaginary axis.
 
         Parameters
@@ -139,6 +155,11 @@ class TransferFunction(CacheableObject, ParametricObject):
         adaptive_opts
             Optional arguments for :func:`~pymor.tools.plot.adaptive` (ignored if `len(w) != 2`).
             If `xscale` and `yscale` are not set, `'log'` is used.
+        pool
+            If not `None`, the |WorkerPool| among which the frequencies are distributed
+            (ignored if `len(w) == 2`). For the transfer function of a model, the model
+            is sent to the workers, otherwise the transfer function itself has to be
+            picklable.
 
         Returns
         -------
@@ -156,6 +177,27 @@ class TransferFunction(CacheableObject, ParametricObject):
         if self.sampling_time > 0 and not all(-np.pi <= wi <= np.pi for wi in w):
             self.logger.warning('Some frequencies are not in the [-pi, pi] interval.')
 
+        if pool and len(w) != 2:
+            w = np.asarray(w)
+            w_complex = 1j * w if self.sampling_time == 0 else np.exp(1j * w)
+            chunks = [c for c in np.array_split(w_complex, len(pool)) if len(c) > 0]
+            if len(chunks) <= 1:
+                return self.eval_tf(w_complex, mu=mu)
+            # transfer functions of models hold closures which cannot be pickled,
+            # so the model is pushed to the workers instead
+            model = getattr(self, '_model', None)
+            if model is not None:
+                remote_model = pool.push(model)
+                tfw = pool.map(_eval_model_tf, chunks, model=remote_model, mu=mu)
+                del remote_model
+            else:
+                tfw = pool.map(_eval_tf, chunks, tf=self, mu=mu)
+            return np.concatenate(tfw)
+
+        return self._freq_resp(w, mu=mu, adaptive_type=adaptive_type, adaptive_opts=adaptive_opts)
+
+    @cached
+    def _freq_resp(self, w, mu=None, adaptive_type='bode', adaptive_opts=None):
         if len(w) == 2:
             if adaptive_type == 'bode':
                 if self.sampling_time == 0:
@@ -178,8 +220,9 @@ class TransferFunction(CacheableObject, ParametricObject):
         else:
             w_new = w
 
+        w_new = np.asarray(w_new)
         w_complex = 1j * w_new if self.sampling_time == 0 else np.exp(1j * w_new)
-        tfw = np.stack([self.eval_tf(wi, mu=mu) for wi in w_complex])
+        tfw = self.eval_tf(w_complex, mu=mu)
 
         if len(w) == 2:
             return w_new, tfw
@@ -438,7 +481,7 @@ class TransferFunction(CacheableObject, ParametricObject):
         dtf = (lambda s, mu=None: self.eval_dtf(s, mu=mu) + other.eval_dtf(s, mu=mu)
                if hasattr(other, 'eval_dtf')
                else None)
-        return self.with_(tf=tf, dtf=dtf)
+        return self.with_(tf=tf, dtf=dtf, tf_batch=tf)
 
     __radd__ = __add__
 
@@ -457,12 +500,12 @@ class TransferFunction(CacheableObject, ParametricObject):
         dtf = (lambda s, mu=None: other.eval_dtf(s, mu=mu) - self.eval_dtf(s, mu=mu)
                if hasattr(other, 'eval_dtf')
                else None)
-        return self.with_(tf=tf, dtf=dtf)
+        return self.with_(tf=tf, dtf=dtf, tf_batch=tf)
 
     def __neg__(self):
         tf = lambda s, mu=None: -self.eval_tf(s, mu=mu)
         dtf = (lambda s, mu=None: -self.eval_dtf(s, mu=mu)) if self.dtf is not None else None
-        return self.with_(tf=tf, dtf=dtf)
+        return self.with_(tf=tf, dtf=dtf, tf_batch=tf)
 
     def __mul__(self, other):
         assert isinstance(other, TransferFunction) or hasattr(other, 'transfer_function')
@@ -476,7 +519,7 @@ class TransferFunction(CacheableObject, ParametricObject):
                                    + self.eval_tf(s, mu=mu) @ other.eval_dtf(s, mu=mu))
                if hasattr(other, 'eval_dtf')
                else None)
-        return self.with_(tf=tf, dtf=dtf)
+        return self.with_(tf=tf, dtf=dtf, tf_batch=tf)
 
     def __rmul__(self, other):
         assert isinstance(other, TransferFunction) or hasattr(other, 'transfer_function')
@@ -490,7 +533,7 @@ class TransferFunction(CacheableObject, ParametricObject):
                                    + other.eval_tf(s, mu=mu) @ self.eval_dtf(s, mu=mu))
                if hasattr(other, 'eval_dtf')
                else None)
-        return self.with_(tf=tf, dtf=dtf)
+        return self.with_(tf=tf, dtf=dtf, tf_batch=tf)
 
 
 class FactorizedTransferFunction(TransferFunction):
@@ -519,10 +562,12 @@ class FactorizedTransferFunction(TransferFunction):
         sampling time (in seconds).
     name
         Name of the system.
+    tf_batch
+        See :class:`TransferFunction`.
     """
 
     def __init__(self, dim_input, dim_output, K, B, C, D, dK=None, dB=None, dC=None, dD=None,
-                 parameters={}, sampling_time=0, name=None):
+                 parameters={}, sampling_time=0, name=None, tf_batch=None):
         def tf(s, mu=None):
             if dim_input <= dim_output:
                 B_vec = B(s).as_range_array(mu=mu)
@@ -571,7 +616,7 @@ class FactorizedTransferFunction(TransferFunction):
                 return res
 
         super().__init__(dim_input, dim_output, tf, dtf=dtf, parameters=parameters,
-                         sampling_time=sampling_time, name=name)
+                         sampling_time=sampling_time, name=name, tf_batch=tf_batch)
         self.__auto_init(locals())
 
     def __add__(self, other):
@@ -603,7 +648,7 @@ class FactorizedTransferFunction(TransferFunction):
               if self.dD is not None and other.dD is not None
               else None)
 
-        return self.with_(K=K, B=B, C=C, D=D, dK=dK, dB=dB, dC=dC, dD=dD)
+        return self.with_(K=K, B=B, C=C, D=D, dK=dK, dB=dB, dC=dC, dD=dD, tf_batch=None)
 
     __radd__ = __add__
 
@@ -612,7 +657,7 @@ class FactorizedTransferFunction(TransferFunction):
         D = lambda s: -self.D(s)
         dC = lambda s: -self.dC(s) if self.dC is not None else None
         dD = lambda s: -self.dD(s) if self.dD is not None else None
-        return self.with_(C=C, D=D, dC=dC, dD=dD)
+        return self.with_(C=C, D=D, dC=dC, dD=dD, tf_batch=None)
 
     def __mul__(self, other):
         if (type(other) is not FactorizedTransferFunction
@@ -644,9 +689,17 @@ class FactorizedTransferFunction(TransferFunction):
               if self.dD is not None and other.dD is not None
               else None)
 
-        return self.with_(K=K, B=B, C=C, D=D, dK=dK, dB=dB, dC=dC, dD=dD)
+        return self.with_(K=K, B=B, C=C, D=D, dK=dK, dB=dB, dC=dC, dD=dD, tf_batch=None)
 
     def __rmul__(self, other):
         if not hasattr(other, 'transfer_function'):
             return NotImplemented
         return other.transfer_function * self
+
+
+def _eval_tf(s, tf=None, mu=None):
+    return tf.eval_tf(s, mu=mu)
+
+
+def _eval_model_tf(s, model=None, mu=None):
+    return model.transfer_function.eval_tf(s, mu=mu)
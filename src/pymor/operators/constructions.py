@@ -78,6 +78,30 @@ class LincombOperator(Operator):
         assert self.parameters.assert_compatible(mu)
         return [c.evaluate(mu) if hasattr(c, 'evaluate') else c for c in self.coefficients]
 
+    def evaluate_coefficients_batch(self, mus, parameters=None):
+        """Compute the linear coefficients for multiple |parameter values| at once.
+
+        Parameters
+        ----------
+        mus
+            A 2D |NumPy array| of |parameter values| w.r.t. `parameters` or an iterable
+            of |parameter values|, see
+            :meth:`~pymor.parameters.functionals.ParameterFunctional.evaluate_batch`.
+        parameters
+            The |Parameters| w.r.t. which `mus` is given. If `None`, the
+            operator's |Parameters| are used.
+
+        Returns
+        -------
+        2D |NumPy array| of shape `(len(mus), len(self.operators))` with the linear
+        coefficients for each item of `mus`.
+        """
+        parameters = self.parameters if parameters is None else parameters
+        assert self.parameters <= parameters
+        mus = parameters.parse_batch(mus)
+        return np.stack([c.evaluate_batch(mus, parameters) if hasattr(c, 'evaluate_batch') else np.full(len(mus), c)
+                         for c in self.coefficients], axis=1)
+
     def apply(self, U, mu=None):
         coeffs = self.evaluate_coefficients(mu)
         if coeffs[0]:
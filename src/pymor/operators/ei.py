@@ -104,15 +104,7 @@ class EmpiricalInterpolatedOperator(Operator):
             AU = self.restricted_operator.apply(U_dofs, mu=mu)
         else:
             AU = NumpyVectorSpace.make_array(self.operator.apply(U, mu=mu).dofs(self.interpolation_dofs))
-        try:
-            if self.triangular:
-                interpolation_coefficients = solve_triangular(self.interpolation_matrix, AU.to_numpy().T,
-                                                              lower=True, unit_diagonal=True).T
-            else:
-                interpolation_coefficients = solve(self.interpolation_matrix, AU.to_numpy().T).T
-        except ValueError:  # this exception occurs when AU contains NaNs ...
-            interpolation_coefficients = np.empty((len(AU), len(self.collateral_basis))) + np.nan
-        return self.collateral_basis.lincomb(interpolation_coefficients)
+        return self._interpolate(AU.to_numpy())
 
     def jacobian(self, U, mu=None):
         assert self.parameters.assert_compatible(mu)
@@ -134,15 +126,7 @@ class EmpiricalInterpolatedOperator(Operator):
             U_dofs = restricted_source.make_array(U.dofs(self.source_dofs))
             JU = self.restricted_operator.jacobian(U_dofs, mu=mu) \
                                          .apply(restricted_source.make_array(np.eye(len(self.source_dofs))))
-            try:
-                if self.triangular:
-                    interpolation_coefficients = solve_triangular(self.interpolation_matrix, JU.to_numpy().T,
-                                                                  lower=True, unit_diagonal=True).T
-                else:
-                    interpolation_coefficients = solve(self.interpolation_matrix, JU.to_numpy().T).T
-            except ValueError:  # this exception occurs when AU contains NaNs ...
-                interpolation_coefficients = np.empty((len(JU), len(self.collateral_basis))) + np.nan
-            J = self.collateral_basis.lincomb(interpolation_coefficients)
+            J = self._interpolate(JU.to_numpy())
             if isinstance(J.space, NumpyVectorSpace):
                 J = NumpyMatrixOperator(J.to_numpy().T, range_id=self.range.id)
             else:
@@ -150,6 +134,14 @@ class EmpiricalInterpolatedOperator(Operator):
             return ConcatenationOperator([J, ComponentProjectionOperator(self.source_dofs, self.source)],
                                          solver_options=options, name=self.name + '_jacobian')
 
+    def _interpolate(self, values):
+        # the collateral basis multiplied with the inverse transposed interpolation matrix
+        # is computed once, s.t. interpolation reduces to a single linear combination
+        if not hasattr(self, '_interpolation_basis'):
+            self._interpolation_basis = _interpolation_basis(self.collateral_basis, self.interpolation_matrix,
+                                                             self.triangular)
+        return self._interpolation_basis.lincomb(values)
+
     def __getstate__(self):
         d = self.__dict__.copy()
         del d['_operator']
@@ -173,15 +165,7 @@ class ProjectedEmpiciralInterpolatedOperator(Operator):
         assert self.parameters.assert_compatible(mu)
         U_dofs = self.source_basis_dofs.lincomb(U.to_numpy())
         AU = self.restricted_operator.apply(U_dofs, mu=mu)
-        try:
-            if self.triangular:
-                interpolation_coefficients = solve_triangular(self.interpolation_matrix, AU.to_numpy().T,
-                                                              lower=True, unit_diagonal=True).T
-            else:
-                interpolation_coefficients = solve(self.interpolation_matrix, AU.to_numpy().T).T
-        except ValueError:  # this exception occurs when AU contains NaNs ...
-            interpolation_coefficients = np.empty((len(AU), len(self.projected_collateral_basis))) + np.nan
-        return self.projected_collateral_basis.lincomb(interpolation_coefficients)
+        return self._interpolate(AU.to_numpy())
 
     def jacobian(self, U, mu=None):
         assert len(U) == 1
@@ -194,23 +178,20 @@ class ProjectedEmpiciralInterpolatedOperator(Operator):
 
         U_dofs = self.source_basis_dofs.lincomb(U.to_numpy()[0])
         J = self.restricted_operator.jacobian(U_dofs, mu=mu).apply(self.source_basis_dofs)
-        try:
-            if self.triangular:
-                interpolation_coefficients = solve_triangular(self.interpolation_matrix, J.to_numpy().T,
-                                                              lower=True, unit_diagonal=True).T
-            else:
-                interpolation_coefficients = solve(self.interpolation_matrix, J.to_numpy().T).T
-        except ValueError:  # this exception occurs when J contains NaNs ...
-            interpolation_coefficients = (np.empty((len(self.source_basis_dofs),
-                                                    len(self.projected_collateral_basis)))
-                                          + np.nan)
-        M = self.projected_collateral_basis.lincomb(interpolation_coefficients)
+        M = self._interpolate(J.to_numpy())
         if isinstance(M.space, NumpyVectorSpace):
             return NumpyMatrixOperator(M.to_numpy().T, solver_options=options)
         else:
             assert not options
             return VectorArrayOperator(M)
 
+    def _interpolate(self, values):
+        # see EmpiricalInterpolatedOperator._interpolate
+        if not hasattr(self, '_interpolation_basis'):
+            self._interpolation_basis = _interpolation_basis(self.projected_collateral_basis,
+                                                             self.interpolation_matrix, self.triangular)
+        return self._interpolation_basis.lincomb(values)
+
     def with_cb_dim(self, dim):
         assert dim <= self.restricted_operator.range.dim
 
@@ -227,3 +208,17 @@ class ProjectedEmpiciralInterpolatedOperator(Operator):
         return ProjectedEmpiciralInterpolatedOperator(restricted_operator, interpolation_matrix,
                                                       source_basis_dofs, projected_collateral_basis, self.triangular,
                                                       solver_options=self.solver_options, name=self.name)
+
+
+def _interpolation_basis(collateral_basis, interpolation_matrix, triangular):
+    """Collateral basis multiplied with the inverse transposed interpolation matrix.
+
+    The result `E` satisfies `E.lincomb(A) == collateral_basis.lincomb(C)`,
+    where `C` solves `interpolation_matrix @ C.T == A.T`.
+    """
+    identity = np.eye(len(interpolation_matrix))
+    if triangular:
+        coefficients = solve_triangular(interpolation_matrix, identity, trans='T', lower=True, unit_diagonal=True)
+    else:
+        coefficients = solve(interpolation_matrix, identity, transposed=True)
+    return collateral_basis.lincomb(coefficients)
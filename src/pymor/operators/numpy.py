@@ -355,6 +355,14 @@ class NumpyMatrixOperator(NumpyMatrixBasedOperator):
         common_coef_dtype = reduce(np.promote_types, (type(c) for c in coefficients + [identity_shift]))
         common_dtype = np.promote_types(common_mat_dtype, common_coef_dtype)
 
+        if len(operators) > 1 and all(op.sparse for op in operators):
+            matrix = self._assemble_sparse_lincomb(operators, coefficients, identity_shift, common_dtype)
+            if matrix is not None:
+                return NumpyMatrixOperator(matrix,
+                                           source_id=self.source.id,
+                                           range_id=self.range.id,
+                                           solver_options=solver_options)
+
         if coefficients[0] == 1:
             matrix = operators[0].matrix.astype(common_dtype)
         else:
@@ -395,10 +403,33 @@ class NumpyMatrixOperator(NumpyMatrixBasedOperator):
                                    range_id=self.range.id,
                                    solver_options=solver_options)
 
+    def _assemble_sparse_lincomb(self, operators, coefficients, identity_shift, dtype):
+        # The union sparsity pattern of all matrices and a sparse map from the coefficients
+        # to the entries of the linear combination are stored with the first operator
+        # when the same linear combination is assembled for the second time. Then,
+        # assembly for new coefficients only requires a single sparse matrix-vector product.
+        key = (tuple(op.uid for op in operators), identity_shift != 0)
+        patterns = self.__dict__.setdefault('_lincomb_patterns', {})
+        if key not in patterns:
+            if len(patterns) >= 8:
+                del patterns[next(iter(patterns))]
+            patterns[key] = None
+            return None
+        if patterns[key] is None:
+            matrices = [op.matrix for op in operators]
+            if identity_shift != 0:
+                matrices.append(scipy.sparse.eye(self.range.dim, self.source.dim))
+            patterns[key] = _union_sparsity_pattern(matrices, self.matrix.format)
+        matrix_type, indptr, indices, coefficient_map = patterns[key]
+        if identity_shift != 0:
+            coefficients = list(coefficients) + [identity_shift]
+        data = coefficient_map @ np.array(coefficients, dtype=dtype)
+        return matrix_type((data, indices, indptr), shape=self.matrix.shape)
+
     def __getstate__(self):
-        if hasattr(self.matrix, 'factorization'):  # remove unpicklable SuperLU factorization
-            del self.matrix.factorization
-        return self.__dict__
+        d = self.__dict__.copy()
+        d.pop('_lincomb_patterns', None)
+        return d
 
     def _format_repr(self, max_width, verbosity):
         if self.sparse:
@@ -408,6 +439,32 @@ class NumpyMatrixOperator(NumpyMatrixBasedOperator):
         return super()._format_repr(max_width, verbosity, override={'matrix': matrix_repr})
 
 
+def _union_sparsity_pattern(matrices, format):
+    """Compute the union sparsity pattern of sparse matrices of the same shape.
+
+    Returns the matrix type, `indptr` and `indices` of the union pattern in CSR format
+    if `format` is `'csr'` and in CSC format otherwise, together with a sparse matrix
+    mapping the coefficients of a linear combination of `matrices` to the data array
+    of the linear combination in the union pattern.
+    """
+    shape = matrices[0].shape
+    major_axis = 0 if format == 'csr' else 1
+    n_major, n_minor = shape[major_axis], shape[1 - major_axis]
+    coos = [m.tocoo() for m in matrices]
+    major = np.concatenate([c.row if major_axis == 0 else c.col for c in coos]).astype(np.int64)
+    minor = np.concatenate([c.col if major_axis == 0 else c.row for c in coos]).astype(np.int64)
+    terms = np.concatenate([np.full(c.nnz, i) for i, c in enumerate(coos)])
+    values = np.concatenate([c.data for c in coos])
+    pattern, positions = np.unique(major * n_minor + minor, return_inverse=True)
+    index_dtype = np.int32 if max(len(pattern), n_major, n_minor) < np.iinfo(np.int32).max else np.int64
+    indices = (pattern % n_minor).astype(index_dtype)
+    indptr = np.zeros(n_major + 1, dtype=index_dtype)
+    np.cumsum(np.bincount(pattern // n_minor, minlength=n_major), out=indptr[1:])
+    coefficient_map = scipy.sparse.csr_matrix((values, (positions.ravel(), terms)), shape=(len(pattern), len(coos)))
+    matrix_type = scipy.sparse.csr_matrix if format == 'csr' else scipy.sparse.csc_matrix
+    return matrix_type, indptr, indices, coefficient_map
+
+
 class NumpyHankelOperator(NumpyGenericOperator):
     r"""Implicit representation of a Hankel operator by a |NumPy Array|.
 
@@ -8,6 +8,7 @@ import weakref
 
 from pymor.core.base import ImmutableObject
 from pymor.parallel.interface import WorkerPool, RemoteObject
+from pymor.parameters.base import MuArray
 
 
 class WorkerPoolDefaultImplementations:
@@ -32,8 +33,8 @@ class WorkerPoolDefaultImplementations:
         slices = []
         for i in range(len(self)):
             slices.append(l[i*slice_len:(i+1)*slice_len])
+        remote_l = self.push(l[:0] if isinstance(l, MuArray) else [])
         del l
-        remote_l = self.push([])
         self.map(_append_list_slice, slices, l=remote_l)
         return remote_l
 
@@ -104,10 +105,12 @@ class GenericRemoteObject(RemoteObject):
 
     def _remove(self):
         pool = self.pool()
+        if pool is None:  # the pool has already been destroyed
+            return
         if self.uid is not None:
             remote_id, ref_count = pool._pushed_immutable_objects.pop(self.uid)
             if ref_count > 1:
-                pool._pushed_immutable_objects[self.remote_id] = (remote_id, ref_count - 1)
+                pool._pushed_immutable_objects[self.uid] = (remote_id, ref_count - 1)
             else:
                 pool._remove_object(remote_id)
         else:
@@ -9,14 +9,18 @@ from pymor.core.logger import getLogger
 from pymor.parallel.dummy import dummy_pool
 
 
-@defaults('ipython_num_engines', 'ipython_profile', 'allow_mpi')
-def new_parallel_pool(ipython_num_engines=None, ipython_profile=None, allow_mpi=True):
+@defaults('ipython_num_engines', 'ipython_profile', 'allow_mpi', 'num_processes')
+def new_parallel_pool(ipython_num_engines=None, ipython_profile=None, allow_mpi=True, num_processes=None):
     """Creates a new default |WorkerPool|.
 
     If `ipython_num_engines` or `ipython_profile` is provided as an argument or set as
     a |default|, an :class:`~pymor.parallel.ipython.IPythonPool` |WorkerPool| will
     be created using the given parameters via the `ipcluster` script.
 
+    Otherwise, if `num_processes` is provided, a
+    :class:`~pymor.parallel.processes.ProcessPool` |WorkerPool| with the given
+    number of local worker processes will be created.
+
     Otherwise, when `allow_mpi` is `True` and an MPI parallel run is detected,
     an :class:`~pymor.parallel.mpi.MPIPool` |WorkerPool| will be created.
 
@@ -35,6 +39,11 @@ def new_parallel_pool(ipython_num_engines=None, ipython_profile=None, allow_mpi=
         pool = nip.__enter__()
         _pool = ('ipython', pool, nip)
         return pool
+    elif num_processes:
+        from pymor.parallel.processes import ProcessPool
+        pool = ProcessPool(num_processes)
+        _pool = ('processes', pool)
+        return pool
     elif allow_mpi:
         from pymor.tools import mpi
         if mpi.parallel:
@@ -58,4 +67,6 @@ def _cleanup():
     global _pool
     if _pool and _pool[0] == 'ipython':
         _pool[2].__exit__(None, None, None)
+    elif _pool and _pool[0] == 'processes':
+        _pool[1].close()
     _pool = None
@@ -6,6 +6,7 @@ from copy import deepcopy
 
 from pymor.core.base import ImmutableObject
 from pymor.parallel.interface import WorkerPool, RemoteObject
+from pymor.parameters.base import MuArray
 
 
 class DummyPool(WorkerPool):
@@ -25,7 +26,7 @@ class DummyPool(WorkerPool):
         return DummyRemoteObject(U)
 
     def scatter_list(self, l):
-        l = list(l)
+        l = l.copy() if isinstance(l, MuArray) else list(l)
         return DummyRemoteObject(l)
 
     def _map_kwargs(self, kwargs):
@@ -82,7 +82,8 @@ class WorkerPool(BasicObject):
 
         On each worker a `list` is created holding an (up to rounding) equal
         amount of objects of `l`. The returned |RemoteObject| therefore refers
-        to different data on each of the workers.
+        to different data on each of the workers. If `l` is a |MuArray|, a
+        |MuArray| is created on each worker instead of a `list`.
 
         Parameters
         ----------
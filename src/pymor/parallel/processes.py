@@ -0,0 +1,405 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+"""|WorkerPool| based on local worker processes.
+
+:class:`ProcessPool` starts a fixed number of worker processes on the local
+machine using :mod:`multiprocessing`. Pushed objects are pickled only once into
+a :class:`~multiprocessing.shared_memory.SharedMemory` block from which each
+worker loads its own copy when the object is first used. :meth:`ProcessPool.map`
+dynamically distributes chunks of decreasing size to the workers as they
+become idle, such that workers with expensive tasks do not delay the
+completion of the whole map. Results can also be obtained asynchronously
+via :meth:`ProcessPool.map_async` and :meth:`ProcessPool.imap_unordered`.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import math
+import multiprocessing
+from multiprocessing.connection import wait
+from multiprocessing.shared_memory import SharedMemory
+import os
+import pickle
+import threading
+import traceback
+
+from pymor.core import defaults
+from pymor.core.pickle import dumps, loads
+from pymor.parallel.basic import WorkerPoolBase, _append_array_slice, _append_list_slice
+from pymor.parameters.base import MuArray
+from pymor.tools.counter import Counter
+
+
+class ProcessPool(WorkerPoolBase):
+    """|WorkerPool| based on local worker processes.
+
+    Parameters
+    ----------
+    num_workers
+        Number of worker processes to start. If `None`, the number of
+        CPUs available to the current process is used.
+    chunks_per_worker
+        :meth:`map` splits the remaining work into `chunks_per_worker * len(self)`
+        chunks whenever a worker becomes idle (guided self-scheduling). Larger
+        values result in better load balancing at the expense of more
+        communication.
+    start_method
+        The :mod:`multiprocessing` start method used to create the worker
+        processes.
+    """
+
+    _updated_defaults = 0
+
+    def __init__(self, num_workers=None, chunks_per_worker=4, start_method='spawn'):
+        super().__init__()
+        if num_workers is None:
+            num_workers = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+        assert num_workers >= 1
+        assert chunks_per_worker >= 1
+        self.num_workers = num_workers
+        self.chunks_per_worker = chunks_per_worker
+
+        from pymor.tools.random import get_seed_seq
+        context = multiprocessing.get_context(start_method)
+        self._connections, self._processes = [], []
+        for seed_seq in get_seed_seq().spawn(num_workers):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=_worker_main, args=(child_conn, seed_seq, os.getcwd()), daemon=True)
+            process.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._processes.append(process)
+        self.logger.info(f'Started {num_workers} worker processes')
+
+        self._lock = threading.RLock()
+        self._iterating = False
+        self._executor = None
+        self._shared_memory = {}
+        self._remote_objects_created = Counter()
+
+        if defaults.defaults_changes() > 0:
+            self._update_defaults()
+
+    def __len__(self):
+        return self.num_workers
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:  # the interpreter might already be shutting down
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Stop all worker processes and free all pushed objects."""
+        if not getattr(self, '_processes', None):
+            return
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+            for conn in self._connections:
+                try:
+                    conn.send_bytes(dumps(('stop',)))
+                except OSError:
+                    pass
+            for process in self._processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+            for conn in self._connections:
+                conn.close()
+            for shm in self._shared_memory.values():
+                shm.close()
+                shm.unlink()
+            self._shared_memory.clear()
+            self._processes, self._connections = [], []
+
+    def _push_object(self, obj):
+        data = dumps(obj)
+        with self._lock:
+            remote_id = RemoteId(self._remote_objects_created.inc())
+            shm = SharedMemory(create=True, size=max(len(data), 1))
+            shm.buf[:len(data)] = data
+            self._shared_memory[remote_id] = shm
+        remote_id.shm_name, remote_id.size = shm.name, len(data)
+        return remote_id
+
+    def _remove_object(self, remote_id):
+        with self._lock:
+            shm = self._shared_memory.pop(remote_id, None)
+            if shm is None:
+                return
+            shm.close()
+            shm.unlink()
+            for conn in self._connections:
+                conn.send_bytes(dumps(('remove', int(remote_id))))
+
+    def _call(self, workers, function, loop, args, kwargs):
+        with self._lock:
+            self._check_not_iterating()
+            if defaults.defaults_changes() > self._updated_defaults:
+                self._update_defaults()
+            for worker, a in zip(workers, args):
+                self._connections[worker].send_bytes(dumps(('call', _dumps_function(function), loop, a, kwargs)))
+            results = [self._receive(worker) for worker in workers]
+        return _unpack_results(results)
+
+    def _receive(self, worker):
+        try:
+            return loads(self._connections[worker].recv_bytes())
+        except EOFError:
+            return False, RuntimeError(f'Worker process {worker} died unexpectedly'), None
+
+    def _apply(self, function, *args, **kwargs):
+        return self._call(range(len(self)), function, False, [args] * len(self), kwargs)
+
+    def _apply_only(self, function, worker, *args, **kwargs):
+        return self._call([worker], function, False, [args], kwargs)[0]
+
+    def _map(self, function, chunks, **kwargs):
+        # static distribution: chunk i is processed by worker i
+        results = self._call(range(len(self)), function, True, list(zip(*chunks)), kwargs)
+        return [r for result in results for r in result]
+
+    def _check_not_iterating(self):
+        if self._iterating:
+            raise RuntimeError('Cannot use ProcessPool while iterating over the results of imap_unordered')
+
+    def _update_defaults(self):
+        self._updated_defaults = defaults.defaults_changes()
+        self._apply(defaults.set_defaults, defaults.get_defaults(user=True, file=True, code=False))
+
+    def scatter_array(self, U, copy=True):
+        slice_len = len(U) // len(self) + (1 if len(U) % len(self) else 0)
+        if copy:
+            slices = [U[i*slice_len:min((i+1)*slice_len, len(U))].copy() for i in range(len(self))]
+        else:
+            slices = [U.empty() for _ in range(len(self))]
+            for s in slices:
+                s.append(U[:min(slice_len, len(U))], remove_from_other=True)
+        remote_U = self.push(U.empty())
+        del U
+        self._map(_append_array_slice, ([[s] for s in slices],), U=remote_U.remote_id)
+        return remote_U
+
+    def scatter_list(self, l):
+        slice_len = len(l) // len(self) + (1 if len(l) % len(self) else 0)
+        slices = [l[i*slice_len:(i+1)*slice_len] for i in range(len(self))]
+        remote_l = self.push(l[:0] if isinstance(l, MuArray) else [])
+        del l
+        self._map(_append_list_slice, ([[s] for s in slices],), l=remote_l.remote_id)
+        return remote_l
+
+    def map(self, function, *args, **kwargs):
+        """Parallel version of the builtin :func:`map` function.
+
+        See :meth:`~pymor.parallel.interface.WorkerPool.map`. In contrast to
+        other |WorkerPools|, the arguments are not split into `len(self)` chunks
+        of equal size. Instead, chunks of decreasing size are handed out to
+        the workers as they become idle.
+        """
+        result = [None] * _common_len(args)
+        for indices, values in self._imap_chunks(function, args, kwargs):
+            for i, v in zip(indices, values):
+                result[i] = v
+        return result
+
+    def map_async(self, function, *args, **kwargs):
+        """Asynchronous version of :meth:`map`.
+
+        The map is executed in a background thread of the calling process.
+        Until it has finished, all other calls to the pool will block.
+
+        Returns
+        -------
+        A :class:`concurrent.futures.Future` whose result is the list
+        of return values of the function executions.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            return self._executor.submit(self.map, function, *args, **kwargs)
+
+    def imap_unordered(self, function, *args, **kwargs):
+        """Lazy version of :meth:`map` yielding results as soon as they are available.
+
+        Yields
+        ------
+        Tuples `(i, result)` where `result` is the return value of `function`
+        for the `i`-th combination of positional arguments. The tuples are
+        yielded in the order in which the function executions finish.
+        """
+        for indices, values in self._imap_chunks(function, args, kwargs):
+            yield from zip(indices, values)
+
+    def _imap_chunks(self, function, args, kwargs):
+        n = _common_len(args)
+        if n == 0:
+            return
+        with self._lock:
+            self._check_not_iterating()
+            if defaults.defaults_changes() > self._updated_defaults:
+                self._update_defaults()
+
+            # push all immutable keyword arguments only once instead of sending
+            # them along with each chunk
+            pushed = [self.push(v) for v in kwargs.values() if _is_immutable(v)]
+            try:
+                kwargs = self._map_kwargs(kwargs)
+                function_data = _dumps_function(function)
+                next_index = 0
+                busy = {}
+                error = None
+
+                def send_next_chunk(worker):
+                    nonlocal next_index
+                    remaining = n - next_index
+                    size = max(1, math.ceil(remaining / (self.chunks_per_worker * len(self))))
+                    indices = range(next_index, next_index + size)
+                    chunk = [a[next_index:next_index + size] for a in args]
+                    next_index += size
+                    self._connections[worker].send_bytes(dumps(('call', function_data, True, chunk, kwargs)))
+                    busy[self._connections[worker]] = (worker, indices)
+
+                self._iterating = True
+                try:
+                    for worker in range(min(len(self), n)):
+                        send_next_chunk(worker)
+                    while busy:
+                        for conn in wait(list(busy)):
+                            worker, indices = busy.pop(conn)
+                            result = self._receive(worker)
+                            if error is None and not result[0]:
+                                error = result
+                            if error is None and next_index < n:
+                                send_next_chunk(worker)
+                            if error is None:
+                                yield indices, result[1]
+                finally:
+                    # make sure that all workers are idle again when the generator is
+                    # closed early (e.g. by breaking out of imap_unordered)
+                    while busy:
+                        for conn in wait(list(busy)):
+                            worker, _ = busy.pop(conn)
+                            self._receive(worker)
+                    self._iterating = False
+                if error is not None:
+                    _unpack_results([error])
+            finally:
+                for remote_object in pushed:
+                    remote_object.remove()
+
+
+class RemoteId(int):
+    """Id of an object pushed to the workers of a :class:`ProcessPool`.
+
+    Additionally stores name and size of the shared memory block
+    containing the pickled object.
+    """
+
+    def __reduce__(self):
+        return _make_remote_id, (int(self), self.shm_name, self.size)
+
+
+def _make_remote_id(remote_id, shm_name, size):
+    remote_id = RemoteId(remote_id)
+    remote_id.shm_name, remote_id.size = shm_name, size
+    return remote_id
+
+
+def _dumps_function(function):
+    # Functions defined in the main script of the calling process can be pickled
+    # by reference, as the worker processes import the main script (but not
+    # the code guarded by `if __name__ == '__main__'`). In all other cases, we
+    # resort to pymor.core.pickle.dumps_function.
+    try:
+        return pickle.dumps(function, protocol=pickle.HIGHEST_PROTOCOL)
+    except (AttributeError, TypeError, pickle.PicklingError):
+        return dumps(function)
+
+
+def _common_len(args):
+    lens = set(map(len, args))
+    assert len(lens) == 1
+    return lens.pop()
+
+
+def _is_immutable(obj):
+    from pymor.core.base import ImmutableObject
+    return isinstance(obj, ImmutableObject)
+
+
+def _unpack_results(results):
+    for success, value, tb in results:
+        if not success:
+            if tb is not None:
+                raise value from RemoteError(tb)
+            raise value
+    return [value for _, value, _ in results]
+
+
+class RemoteError(Exception):
+    """Carries the traceback of an exception raised in a worker process."""
+
+    def __str__(self):
+        return '\n\n' + self.args[0]
+
+
+def _worker_main(conn, seed_seq, cwd):
+    # make sure all workers are in the same cwd, so they can import the same code
+    os.chdir(cwd)
+    # ensure that each worker starts with a different yet deterministically
+    # initialized rng
+    from pymor.tools.random import new_rng
+    new_rng(seed_seq).install()
+
+    remote_objects = {}
+
+    def get_remote_object(remote_id):
+        try:
+            return remote_objects[int(remote_id)]
+        except KeyError:
+            shm = SharedMemory(name=remote_id.shm_name)
+            try:
+                obj = loads(bytes(shm.buf[:remote_id.size]))
+            finally:
+                shm.close()
+            remote_objects[int(remote_id)] = obj
+            return obj
+
+    while True:
+        try:
+            message = loads(conn.recv_bytes())
+        except EOFError:
+            break
+        command = message[0]
+        if command == 'stop':
+            break
+        elif command == 'remove':
+            remote_objects.pop(message[1], None)
+        elif command == 'call':
+            _, function, loop, args, kwargs = message
+            try:
+                function = loads(function)
+                kwargs = {k: (get_remote_object(v) if isinstance(v, RemoteId) else v) for k, v in kwargs.items()}
+                if loop:
+                    result = (True, [function(*a, **kwargs) for a in zip(*args)], None)
+                else:
+                    result = (True, function(*args, **kwargs), None)
+                data = dumps(result)
+            except Exception as e:
+                tb = traceback.format_exc()
+                try:
+                    data = dumps((False, e, tb))
+                except Exception:
+                    data = dumps((False, RuntimeError(repr(e)), tb))
+            conn.send_bytes(data)
+        else:
+            raise NotImplementedError
+    conn.close()
@@ -181,6 +181,69 @@ class Parameters(SortedFrozenDict):
 
         return Mu({k: parse_value(k, v) for k, v in mu.items()})
 
+    def parse_batch(self, mus):
+        """Interpret `mus` as a batch of |parameter values| stored in a 2D |NumPy array|.
+
+        Each row of the returned array contains the values of all parameters
+        for one item of `mus`, concatenated in alphabetical order of the
+        parameter names as in :meth:`Mu.to_numpy`. The columns belonging to a
+        given parameter can be obtained via :meth:`columns`.
+
+        Parameters
+        ----------
+        mus
+            Either a 2D |NumPy array| of shape `(len(mus), self.dim)` or an iterable
+            of |parameter values|. Each item which is not a |Mu| instance is parsed
+            using :meth:`parse`. Values of additional parameters not contained in
+            the |Parameters| are ignored.
+
+        Returns
+        -------
+        The 2D |NumPy array| of parameter values.
+
+        Raises
+        ------
+        ValueError
+            Is raised if `mus` cannot be interpreted as a batch of |parameter values|
+            for the given |Parameters|.
+        """
+        if isinstance(mus, MuArray):
+            if mus.parameters == self:
+                return mus.to_numpy()
+            if not all(mus.parameters.get(k) == v for k, v in self.items()):
+                raise ValueError(f'{mus} is incompatible with Parameters {self}')
+            return (np.hstack([mus.to_numpy()[:, mus.parameters.columns(k)] for k in self]) if self
+                    else np.zeros((len(mus), 0)))
+        if isinstance(mus, np.ndarray):
+            if mus.ndim != 2 or mus.shape[1] != self.dim:
+                raise ValueError(f'Array of shape {mus.shape} is incompatible with Parameters {self} '
+                                 f'(expected shape (n, {self.dim}))')
+            return mus
+        mus = [mu if isinstance(mu, Mu) else self.parse(mu) for mu in mus]
+        assert all(self.assert_compatible(mu) for mu in mus)
+        if not self:
+            return np.zeros((len(mus), 0))
+        return np.array([np.hstack([mu[k] for k in self]) for mu in mus]).reshape((len(mus), self.dim))
+
+    def columns(self, parameter):
+        """Columns of the values of `parameter` in arrays returned by :meth:`parse_batch`.
+
+        Parameters
+        ----------
+        parameter
+            The name of the parameter.
+
+        Returns
+        -------
+        A `slice` of the corresponding columns.
+        """
+        offset = 0
+        for k, v in self.items():
+            if k == parameter:
+                return slice(offset, offset + v)
+            offset += v
+        raise KeyError(parameter)
+
     def space(self, *ranges):
         """Create a |ParameterSpace| with given ranges.
 
@@ -387,6 +450,94 @@ class Mu(FrozenDict):
         return f'Mu({dict(sorted(self._raw_values.items()))})'
 
 
+class MuArray:
+    """Compact sequence of |parameter values| stored in a single |NumPy array|.
+
+    In contrast to lists of |Mu| instances, a |MuArray| stores the |parameter values|
+    of all its items as rows of a contiguous 2D array of shape `(len(self), parameters.dim)`
+    in the layout described in :meth:`Parameters.parse_batch`. This keeps the memory
+    footprint small for large sample sets, which, e.g., can be efficiently distributed to
+    the workers of a |WorkerPool| or used for vectorized computations like
+    :meth:`~pymor.parameters.functionals.ParameterFunctional.evaluate_batch`.
+
+    Indexing a |MuArray| with an integer returns the corresponding |parameter values|
+    as a |Mu| instance which is created on demand. Indexing with a slice, a list
+    of indices or a boolean mask returns a new |MuArray|.
+
+    Parameters
+    ----------
+    parameters
+        The |Parameters| for which values are stored.
+    values
+        Either a 2D |NumPy array| of shape `(n, parameters.dim)` or an iterable
+        of |parameter values|, see :meth:`Parameters.parse_batch`. If `None`,
+        an empty |MuArray| is created.
+
+    Attributes
+    ----------
+    parameters
+        The |Parameters| for which values are stored.
+    """
+
+    def __init__(self, parameters, values=None):
+        assert isinstance(parameters, Parameters)
+        values = np.zeros((0, parameters.dim)) if values is None else parameters.parse_batch(values)
+        values = np.array(values, order='C')
+        values.setflags(write=False)
+        self.parameters = parameters
+        self._values = values
+
+    def to_numpy(self):
+        """All |parameter values| as a read-only 2D |NumPy array|.
+
+        See :meth:`Parameters.parse_batch` for the layout of the array.
+        """
+        return self._values
+
+    def extend(self, mus):
+        """Append the given |parameter values| to the array."""
+        values = self.parameters.parse_batch(mus)
+        if len(values):
+            self._values = np.concatenate([self._values, values])
+            self._values.setflags(write=False)
+
+    def copy(self):
+        return MuArray(self.parameters, self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, ind):
+        if isinstance(ind, (Number, np.integer)):
+            values = self._values[ind]
+            return Mu({k: values[self.parameters.columns(k)] for k in self.parameters})
+        result = MuArray.__new__(MuArray)
+        result.parameters = self.parameters
+        result._values = self._values[ind]
+        result._values.setflags(write=False)
+        return result
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other):
+        if isinstance(other, MuArray):
+            return self.parameters == other.parameters and np.array_equal(self._values, other._values)
+        try:
+            return len(self) == len(other) and all(mu == other_mu for mu, other_mu in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'MuArray({self.parameters!r}, {self._values!r})'
+
+    def __str__(self):
+        return f'MuArray of {len(self)} parameter values for {self.parameters}'
+
+
 class ParametricObject(ImmutableObject):
     """Base class for immutable mathematical entities depending on some |Parameters|.
 
@@ -526,7 +677,7 @@ class ParameterSpace(ParametricObject):
         self.parameters = parameters
         self.ranges = SortedFrozenDict((k, tuple(v)) for k, v in ranges.items())
 
-    def sample_uniformly(self, counts):
+    def sample_uniformly(self, counts, return_array=False):
         """Uniformly sample |parameter values| from the space.
 
         Parameters
@@ -535,23 +686,33 @@ class ParameterSpace(ParametricObject):
             Number of samples to take per parameter and component
             of the parameter. Either a dict of counts per |Parameter|
             or a single count that is taken for each parameter in |Parameters|.
+        return_array
+            If `True`, return the samples as a |MuArray| instead of a list.
 
         Returns
         -------
-        List of |parameter value| dicts.
+        List or |MuArray| of |parameter value| dicts.
         """
         if isinstance(counts, dict):
             pass
         else:
             counts = {k: counts for k in self.parameters}
 
+        if return_array:
+            linspaces = [np.linspace(self.ranges[k][0], self.ranges[k][1], num=counts[k])
+                         for k, sps in self.parameters.items() for _ in range(sps)]
+            if not linspaces:
+                return MuArray(self.parameters, np.zeros((1, 0)))
+            grids = np.meshgrid(*linspaces, indexing='ij')
+            return MuArray(self.parameters, np.stack([g.ravel() for g in grids], axis=1))
+
         linspaces = tuple(np.linspace(self.ranges[k][0], self.ranges[k][1], num=counts[k]) for k in self.parameters)
         iters = tuple(product(ls, repeat=max(0, np.zeros(sps).size))
                       for ls, sps in zip(linspaces, self.parameters.values()))
         return [Mu((k, np.array(v)) for k, v in zip(self.parameters, i))
                 for i in product(*iters)]
 
-    def sample_randomly(self, count=None):
+    def sample_randomly(self, count=None, return_array=False):
         """Randomly sample |parameter values| from the space.
 
         Parameters
@@ -560,11 +721,18 @@ class ParameterSpace(ParametricObject):
             If `None`, a single dict `mu` of |parameter values| is returned.
             Otherwise, the number of random samples to generate and return as
             a list of |parameter values| dicts.
+        return_array
+            If `True` and `count` is not `None`, return the samples as a |MuArray|
+            instead of a list. The same samples as for `return_array=False` are drawn.
 
         Returns
         -------
         The sampled |parameter values|.
         """
+        if return_array and count is not None:
+            lows = np.hstack([np.full(sps, self.ranges[k][0], dtype=float) for k, sps in self.parameters.items()])
+            highs = np.hstack([np.full(sps, self.ranges[k][1], dtype=float) for k, sps in self.parameters.items()])
+            return MuArray(self.parameters, get_rng().uniform(lows, highs, (count, self.parameters.dim)))
         get_param = lambda: Mu(((k, get_rng().uniform(self.ranges[k][0], self.ranges[k][1], size))
                                for k, size in self.parameters.items()))
         if count is None:
@@ -24,6 +24,31 @@ class ParameterFunctional(ParametricObject):
         """Evaluate the functional for given |parameter values| `mu`."""
         pass
 
+    def evaluate_batch(self, mus, parameters=None):
+        """Evaluate the functional for multiple |parameter values| at once.
+
+        The default implementation calls :meth:`evaluate` for each row of `mus`.
+        Most functionals override this method with a vectorized implementation.
+
+        Parameters
+        ----------
+        mus
+            A 2D |NumPy array| whose rows contain the values of all `parameters`
+            in the layout described in :meth:`~pymor.parameters.base.Parameters.parse_batch`
+            or an iterable of |parameter values|.
+        parameters
+            The |Parameters| w.r.t. which `mus` is given. Have to contain the
+            :attr:`~pymor.parameters.base.ParametricObject.parameters` of the
+            functional. If `None`, the functional's
+            :attr:`~pymor.parameters.base.ParametricObject.parameters` are used.
+
+        Returns
+        -------
+        1D |NumPy array| of the values of the functional for all `mus`.
+        """
+        mus, parameters = _parse_batch(mus, parameters, self.parameters)
+        return np.array([self.evaluate(parameters.parse(mu)) for mu in mus]).reshape(len(mus))
+
     def d_mu(self, parameter, index=0):
         """Return the functionals's derivative with respect to a given parameter.
 
@@ -153,6 +178,10 @@ class ProjectionParameterFunctional(ParameterFunctional):
         assert self.parameters.assert_compatible(mu)
         return mu[self.parameter].item(self.index)
 
+    def evaluate_batch(self, mus, parameters=None):
+        mus, parameters = _parse_batch(mus, parameters, self.parameters)
+        return mus[:, parameters.columns(self.parameter).start + self.index].copy()
+
     def d_mu(self, parameter, index=0):
         if parameter == self.parameter:
             assert 0 <= index < self.size
@@ -280,7 +309,8 @@ class ExpressionParameterFunctional(GenericParameterFunctional):
             for key_i, key_dicts in second_derivative_mappings.items():
                 if isinstance(key_dicts, dict):
                     key_dicts = [key_dicts]
-                key_dicts_array = np.array(key_dicts, dtype=object)
+                # copy the dicts to not overwrite the expressions with the mappings
+                key_dicts_array = np.array([dict(d) for d in key_dicts], dtype=object)
                 for key_dict in np.nditer(key_dicts_array, op_flags=['readwrite'], flags=['refs_ok']):
                     for key_j, exp in key_dict[()].items():
                         if isinstance(exp, str):
@@ -295,6 +325,34 @@ class ExpressionParameterFunctional(GenericParameterFunctional):
             second_derivative_mappings = None
         super().__init__(exp_mapping, parameters, name, derivative_mappings, second_derivative_mappings)
         self.__auto_init(locals())
+        self._batch_mapping = self.expression_obj.to_numpy(list(self.parameters))
+
+    def evaluate_batch(self, mus, parameters=None):
+        mus, parameters = _parse_batch(mus, parameters, self.parameters)
+        value = self._batch_mapping(*(mus[:, parameters.columns(k)] for k in self.parameters))
+        return np.broadcast_to(value, (len(mus),) + self.expression_obj.shape).reshape(len(mus))
+
+    def d_mu(self, parameter, index=0):
+        # return an ExpressionParameterFunctional for the derivative to allow vectorized evaluation
+        if parameter not in self.parameters or self.derivative_expressions is None \
+                or parameter not in self.derivative_expressions:
+            return super().d_mu(parameter, index)
+        assert 0 <= index < self.parameters[parameter]
+        expressions = self.derivative_expressions[parameter]
+        if isinstance(expressions, str):
+            expressions = [expressions]
+        if self.second_derivative_expressions is None:
+            second_derivative_expressions = None
+        elif parameter in self.second_derivative_expressions:
+            second_derivative_expressions = self.second_derivative_expressions[parameter]
+            if isinstance(second_derivative_expressions, dict):
+                second_derivative_expressions = [second_derivative_expressions]
+            second_derivative_expressions = second_derivative_expressions[index]
+        else:
+            second_derivative_expressions = {}
+        return ExpressionParameterFunctional(expressions[index], self.parameters,
+                                             name=f'{self.name}_d_{parameter}_{index}',
+                                             derivative_expressions=second_derivative_expressions)
 
     def __reduce__(self):
         return (ExpressionParameterFunctional,
@@ -323,6 +381,11 @@ class ProductParameterFunctional(ParameterFunctional):
         assert self.parameters.assert_compatible(mu)
         return np.array([f.evaluate(mu) if hasattr(f, 'evaluate') else f for f in self.factors]).prod()
 
+    def evaluate_batch(self, mus, parameters=None):
+        mus, parameters = _parse_batch(mus, parameters, self.parameters)
+        return np.prod([f.evaluate_batch(mus, parameters) if hasattr(f, 'evaluate_batch')
+                        else np.full(len(mus), f) for f in self.factors], axis=0)
+
     def d_mu(self, parameter, index=0):
         summands = []
         for i, f in enumerate(self.factors):
@@ -364,6 +427,10 @@ class ConjugateParameterFunctional(ParameterFunctional):
         assert self.parameters.assert_compatible(mu)
         return np.conj(self.functional.evaluate(mu))
 
+    def evaluate_batch(self, mus, parameters=None):
+        mus, parameters = _parse_batch(mus, parameters, self.parameters)
+        return np.conj(self.functional.evaluate_batch(mus, parameters))
+
     def d_mu(self, parameter, index=0):
         return self.with_(functional=self.functional.d_mu(parameter, index), name=f'{self.name}_d_{parameter}_{index}')
 
@@ -386,6 +453,10 @@ class ConstantParameterFunctional(ParameterFunctional):
     def evaluate(self, mu=None):
         return self.constant_value
 
+    def evaluate_batch(self, mus, parameters=None):
+        mus, parameters = _parse_batch(mus, parameters, self.parameters)
+        return np.full(len(mus), self.constant_value)
+
     def d_mu(self, parameter, index=0):
         return self.with_(constant_value=0, name=f'{self.name}_d_{parameter}_{index}')
 
@@ -423,6 +494,10 @@ class LincombParameterFunctional(ParameterFunctional):
         assert self.parameters.assert_compatible(mu)
         return sum(c * f(mu) for c, f in zip(self.coefficients, self.functionals))
 
+    def evaluate_batch(self, mus, parameters=None):
+        mus, parameters = _parse_batch(mus, parameters, self.parameters)
+        return sum(c * f.evaluate_batch(mus, parameters) for c, f in zip(self.coefficients, self.functionals))
+
     def d_mu(self, parameter, index=0):
         functionals_d_mu = [f.d_mu(parameter, index) for f in self.functionals]
         return self.with_(functionals=functionals_d_mu, name=f'{self.name}_d_{parameter}_{index}')
@@ -488,6 +563,12 @@ class MinThetaParameterFunctional(ParameterFunctional):
         assert np.all(thetas_mu > 0)
         return self.alpha_mu_bar * np.min(thetas_mu / self.thetas_mu_bar)
 
+    def evaluate_batch(self, mus, parameters=None):
+        mus, parameters = _parse_batch(mus, parameters, self.parameters)
+        thetas_mus = np.array([theta.evaluate_batch(mus, parameters) for theta in self.thetas])
+        assert np.all(thetas_mus > 0)
+        return self.alpha_mu_bar * np.min(thetas_mus / self.thetas_mu_bar[:, np.newaxis], axis=0)
+
 
 class BaseMaxThetaParameterFunctional(ParameterFunctional):
     """Implements a generalization of the max-theta approach from :cite:`Haa17` (Exercise 5.12).
@@ -587,6 +668,16 @@ class BaseMaxThetaParameterFunctional(ParameterFunctional):
             # special case
             return self.gamma_mu_bar * np.abs(np.max(thetas_prime_mu / self.abs_thetas_mu_bar))
 
+    def evaluate_batch(self, mus, parameters=None):
+        mus, parameters = _parse_batch(mus, parameters, self.parameters)
+        thetas_prime_mus = np.array([theta.evaluate_batch(mus, parameters) for theta in self.thetas_prime])
+        values = np.max(thetas_prime_mus / self.thetas_mu_bar[:, np.newaxis], axis=0)
+        if self.theta_mu_bar_has_negative:
+            # special case, see evaluate
+            special = ~np.all(np.logical_or(thetas_prime_mus < 0, thetas_prime_mus > 0), axis=0)
+            values[special] = np.max(thetas_prime_mus[:, special] / self.abs_thetas_mu_bar[:, np.newaxis], axis=0)
+        return self.gamma_mu_bar * np.abs(values)
+
     def d_mu(self, component, index=()):
         raise NotImplementedError
 
@@ -625,3 +716,9 @@ class MaxThetaParameterFunctional(BaseMaxThetaParameterFunctional):
 
     def __init__(self, thetas, mu_bar, gamma_mu_bar=1., name=None):
         super().__init__(thetas, thetas, mu_bar, gamma_mu_bar, name)
+
+
+def _parse_batch(mus, parameters, functional_parameters):
+    parameters = functional_parameters if parameters is None else parameters
+    assert functional_parameters <= parameters
+    return parameters.parse_batch(mus), parameters
@@ -48,6 +48,7 @@ class ProjectionBasedReductor(BasicObject):
         products = dict(products)
         self.__auto_init(locals())
         self._last_rom = None
+        self._projection_cache = {}
 
         if check_orthonormality:
             for basis in bases:
@@ -174,11 +175,12 @@ class StationaryRBReductor(ProjectionBasedReductor):
     def project_operators(self):
         fom = self.fom
         RB = self.bases['RB']
+        cache = self._projection_cache
         projected_operators = {
-            'operator':          project(fom.operator, RB, RB),
-            'rhs':               project(fom.rhs, RB, None),
-            'products':          {k: project(v, RB, RB) for k, v in fom.products.items()},
-            'output_functional': project(fom.output_functional, None, RB)
+            'operator':          project(fom.operator, RB, RB, cache=cache),
+            'rhs':               project(fom.rhs, RB, None, cache=cache),
+            'products':          {k: project(v, RB, RB, cache=cache) for k, v in fom.products.items()},
+            'output_functional': project(fom.output_functional, None, RB, cache=cache)
         }
         return projected_operators
 
@@ -235,27 +237,29 @@ class InstationaryRBReductor(ProjectionBasedReductor):
         fom = self.fom
         RB = self.bases['RB']
         product = self.products['RB']
+        cache = self._projection_cache
 
         if self.initial_data_product != product:
             # TODO there should be functionality for this somewhere else
             projection_matrix = RB.gramian(self.initial_data_product)
             projection_op = NumpyMatrixOperator(projection_matrix)
             inverse_projection_op = InverseOperator(projection_op, 'inverse_projection_op')
-            pid = project(fom.initial_data, range_basis=RB, source_basis=None, product=self.initial_data_product)
+            pid = project(fom.initial_data, range_basis=RB, source_basis=None, product=self.initial_data_product,
+                          cache=cache)
             projected_initial_data = ConcatenationOperator([inverse_projection_op, pid])
         else:
             projected_initial_data = project(fom.initial_data, range_basis=RB, source_basis=None,
-                                             product=product)
+                                             product=product, cache=cache)
 
         projected_operators = {
             'mass':              (None if (isinstance(fom.mass, IdentityOperator) and product is None
                                            or self.product_is_mass) else
-                                  project(fom.mass, RB, RB)),
-            'operator':          project(fom.operator, RB, RB),
-            'rhs':               project(fom.rhs, RB, None),
+                                  project(fom.mass, RB, RB, cache=cache)),
+            'operator':          project(fom.operator, RB, RB, cache=cache),
+            'rhs':               project(fom.rhs, RB, None, cache=cache),
             'initial_data':      projected_initial_data,
-            'products':          {k: project(v, RB, RB) for k, v in fom.products.items()},
-            'output_functional': project(fom.output_functional, None, RB)
+            'products':          {k: project(v, RB, RB, cache=cache) for k, v in fom.products.items()},
+            'output_functional': project(fom.output_functional, None, RB, cache=cache)
         }
 
         return projected_operators
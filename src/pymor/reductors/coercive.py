@@ -285,6 +285,35 @@ class SimpleCoerciveRBEstimator(ImmutableObject):
 
         return est
 
+    def estimate_error_batch(self, U, mus, m):
+        """Estimate the errors of the reduced solutions `U` for all `mus` at once.
+
+        `mus` is a 2D |NumPy array| of |parameter values| as returned by
+        :meth:`~pymor.parameters.base.Parameters.parse_batch` and the i-th
+        vector of `U` is the reduced solution for the i-th row of `mus`.
+        Returns a 1D |NumPy array| of the estimated errors.
+        """
+        assert len(U) == len(mus)
+        if not m.rhs.parametric:
+            CR = np.ones((len(mus), 1))
+        else:
+            CR = m.rhs.evaluate_coefficients_batch(mus, m.parameters)
+
+        if not m.operator.parametric:
+            CO = np.ones((len(mus), 1))
+        else:
+            CO = m.operator.evaluate_coefficients_batch(mus, m.parameters)
+
+        C = np.hstack((CR, (CO[:, :, np.newaxis] * U.to_numpy()[:, np.newaxis, :]).reshape((len(mus), -1))))
+
+        est = self.norm(NumpyVectorSpace.make_array(C))
+        if isinstance(self.coercivity_estimator, ParameterFunctional):
+            est /= self.coercivity_estimator.evaluate_batch(mus, m.parameters)
+        elif self.coercivity_estimator:
+            est /= np.array([self.coercivity_estimator(m.parameters.parse(mu)) for mu in mus]).reshape(len(mus))
+
+        return est
+
     def estimate_output_error(self, U, mu, m, return_vector=False):
         if not self.output_estimator_matrices or not self.output_functional_coeffs:
             raise NotImplementedError
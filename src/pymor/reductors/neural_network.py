@@ -45,12 +45,12 @@ class NeuralNetworkReductor(BasicObject):
         to consist of pairs of |parameter values| and corresponding solution
         |VectorArrays|.
     training_set
-        Set of |parameter values| to use for POD and training of the
+        Set of |parameter values| (e.g., a |MuArray|) to use for POD and training of the
         neural network. If `fom` is `None`, the `training_set` has
         to consist of pairs of |parameter values| and corresponding solution
         |VectorArrays|.
     validation_set
-        Set of |parameter values| to use for validation in the training
+        Set of |parameter values| (e.g., a |MuArray|) to use for validation in the training
         of the neural network. If `fom` is `None`, the `validation_set` has
         to consist of pairs of |parameter values| and corresponding solution
         |VectorArrays|.
@@ -402,11 +402,11 @@ class NeuralNetworkStatefreeOutputReductor(NeuralNetworkReductor):
         The full-order |Model| to reduce. If `None`, the `training_set` has
         to consist of pairs of |parameter values| and corresponding outputs.
     training_set
-        Set of |parameter values| to use for POD and training of the
+        Set of |parameter values| (e.g., a |MuArray|) to use for POD and training of the
         neural network. If `fom` is `None`, the `training_set` has
         to consist of pairs of |parameter values| and corresponding outputs.
     validation_set
-        Set of |parameter values| to use for validation in the training
+        Set of |parameter values| (e.g., a |MuArray|) to use for validation in the training
         of the neural network. If `fom` is `None`, the `validation_set` has
         to consist of pairs of |parameter values| and corresponding outputs.
     validation_ratio
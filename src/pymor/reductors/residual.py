@@ -68,6 +68,7 @@ class ResidualReductor(BasicObject):
         self.__auto_init(locals())
         self.residual_range = operator.range.empty()
         self.residual_range_dims = []
+        self._projection_cache = {}
 
     def reduce(self):
         if self.residual_range is not False:
@@ -87,13 +88,17 @@ class ResidualReductor(BasicObject):
             operator = project(self.operator, None, self.RB)
             return NonProjectedResidualOperator(operator, self.rhs, self.riesz_representatives, self.product)
 
+        # residual_range and RB are only extended, so the cache allows to reuse
+        # the previously projected matrices
+        cache = self._projection_cache
         with self.logger.block('Projecting residual operator ...'):
             if self.riesz_representatives:
-                operator = project(self.operator, self.residual_range, self.RB, product=None)  # the product cancels out
-                rhs = project(self.rhs, self.residual_range, None, product=None)
+                # the product cancels out
+                operator = project(self.operator, self.residual_range, self.RB, product=None, cache=cache)
+                rhs = project(self.rhs, self.residual_range, None, product=None, cache=cache)
             else:
-                operator = project(self.operator, self.residual_range, self.RB, product=self.product)
-                rhs = project(self.rhs, self.residual_range, None, product=self.product)
+                operator = project(self.operator, self.residual_range, self.RB, product=self.product, cache=cache)
+                rhs = project(self.rhs, self.residual_range, None, product=self.product, cache=cache)
 
         return ResidualOperator(operator, rhs)
 
@@ -219,6 +224,7 @@ class ImplicitEulerResidualReductor(BasicObject):
         self.__auto_init(locals())
         self.residual_range = operator.range.empty()
         self.residual_range_dims = []
+        self._projection_cache = {}
 
     def reduce(self):
         if self.residual_range is not False:
@@ -239,11 +245,12 @@ class ImplicitEulerResidualReductor(BasicObject):
             mass = project(self.mass, None, self.RB)
             return NonProjectedImplicitEulerResidualOperator(operator, mass, self.rhs, self.dt, self.product)
 
+        cache = self._projection_cache
         with self.logger.block('Projecting residual operator ...'):
             # the product always cancels out
-            operator = project(self.operator, self.residual_range, self.RB, product=None)
-            mass = project(self.mass, self.residual_range, self.RB, product=None)
-            rhs = project(self.rhs, self.residual_range, None, product=None)
+            operator = project(self.operator, self.residual_range, self.RB, product=None, cache=cache)
+            mass = project(self.mass, self.residual_range, self.RB, product=None, cache=cache)
+            rhs = project(self.rhs, self.residual_range, None, product=None, cache=cache)
 
         return ImplicitEulerResidualOperator(operator, mass, rhs, self.dt)
 
@@ -0,0 +1,376 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+"""Disk-backed |VectorArrays| for data sets which do not fit into memory."""
+
+import os
+import tempfile
+import weakref
+
+import numpy as np
+
+from pymor.core.defaults import defaults
+from pymor.vectorarrays.interface import VectorArray, VectorArrayImpl, VectorSpace, _create_random_values
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class MemmapVectorArrayImpl(VectorArrayImpl):
+    """Vectors stored row-wise in a memory-mapped file.
+
+    All operations process the vectors in consecutive blocks of at most
+    `block_size` bytes, such that only a bounded amount of data has to be
+    held in memory at any time and the file is read sequentially.
+    The file is removed when the object is garbage collected.
+    """
+
+    growth_factor = 1.5
+
+    def __init__(self, dim, dtype, directory, block_size, capacity=0):
+        self.dim = dim
+        self.dtype = np.dtype(dtype)
+        self.directory = directory
+        self.block_size = block_size
+        fd, self._path = tempfile.mkstemp(prefix='pymor_', suffix='.memmap', dir=directory)
+        os.close(fd)
+        self._finalizer = weakref.finalize(self, _remove_file, self._path)
+        self._len = 0
+        self._array = None
+        self._resize(capacity)
+
+    def __getstate__(self):
+        return {'dim': self.dim, 'dtype': self.dtype, 'directory': self.directory, 'block_size': self.block_size,
+                'array': self.to_numpy(False, None)}
+
+    def __setstate__(self, state):
+        self.__init__(state['dim'], state['dtype'], state['directory'], state['block_size'],
+                      capacity=len(state['array']))
+        self._write(state['array'])
+
+    def _resize(self, capacity):
+        """Change the number of vectors the file can hold."""
+        if isinstance(self._array, np.memmap):
+            self._array.flush()
+        self._array = None
+        os.truncate(self._path, capacity * self.dim * self.dtype.itemsize)
+        if capacity * self.dim == 0:
+            self._array = np.empty((capacity, self.dim), dtype=self.dtype)
+        else:
+            self._array = np.memmap(self._path, dtype=self.dtype, mode='r+', shape=(capacity, self.dim))
+
+    def _promote(self, dtype):
+        """Convert the stored data to a dtype which can hold values of type `dtype`."""
+        dtype = np.promote_types(self.dtype, dtype)
+        if dtype == self.dtype:
+            return
+        new = self._empty(self._len, dtype)
+        for sl in self._block_slices(self._len):
+            new._array[sl] = self._array[sl]
+        old_finalizer = self._finalizer
+        self._array, self._path, self.dtype = new._array, new._path, new.dtype
+        new._finalizer.detach()
+        self._finalizer = weakref.finalize(self, _remove_file, self._path)
+        old_finalizer()
+
+    def _empty(self, capacity, dtype=None):
+        return MemmapVectorArrayImpl(self.dim, self.dtype if dtype is None else dtype, self.directory,
+                                     self.block_size, capacity=capacity)
+
+    def _write(self, array):
+        """Append the vectors in the |NumPy array| `array`."""
+        self._reserve(self._len + len(array))
+        for sl in self._block_slices(len(array)):
+            self._array[self._len + sl.start:self._len + sl.stop] = array[sl]
+        self._len += len(array)
+
+    def _reserve(self, length):
+        if length > len(self._array):
+            self._resize(max(length, int(len(self._array) * self.growth_factor)))
+
+    def _block_slices(self, length):
+        """Split `range(length)` into slices of at most `block_size` bytes worth of vectors."""
+        block_len = max(self.block_size // max(self.dim * self.dtype.itemsize, 1), 1)
+        return [slice(start, min(start + block_len, length)) for start in range(0, length, block_len)]
+
+    def _sub_ind(self, ind, sl):
+        """Indices into the file of the vectors `ind[sl]`."""
+        if ind is None:
+            return sl
+        elif type(ind) is slice:
+            r = range(*ind.indices(self._len))[sl]
+            return slice(r.start, None if r.stop < 0 else r.stop, r.step)
+        else:
+            return np.asarray(ind)[sl]
+
+    def _blocks(self, ind):
+        """Iterate over `(sl, block)` where `block` is the data of the vectors `ind[sl]`."""
+        for sl in self._block_slices(self.len_ind(ind)):
+            yield sl, self._array[self._sub_ind(ind, sl)]
+
+    def __len__(self):
+        return self._len
+
+    def to_numpy(self, ensure_copy, ind):
+        A = self._array[:self._len] if ind is None else self._array[ind]
+        return np.array(A)
+
+    def real(self, ind):
+        result = self._empty(self.len_ind(ind), np.empty(0, dtype=self.dtype).real.dtype)
+        for sl, A in self._blocks(ind):
+            result._array[sl] = A.real
+        result._len = len(result._array)
+        return result
+
+    def imag(self, ind):
+        result = self._empty(self.len_ind(ind), np.empty(0, dtype=self.dtype).real.dtype)
+        for sl, A in self._blocks(ind):
+            result._array[sl] = A.imag
+        result._len = len(result._array)
+        return result
+
+    def conj(self, ind):
+        result = self._empty(self.len_ind(ind))
+        for sl, A in self._blocks(ind):
+            result._array[sl] = A.conj()
+        result._len = len(result._array)
+        return result
+
+    def delete(self, ind):
+        if ind is None:
+            self._len = 0
+            self._resize(0)
+            return
+        keep = np.ones(self._len, dtype=bool)
+        keep[ind] = False
+        if keep.all():
+            return
+        first = np.argmin(keep)
+        remaining = np.flatnonzero(keep)[first:]
+        # compact in place; the vectors are only moved to the front, so
+        # no vector is overwritten before it has been moved
+        for sl in self._block_slices(len(remaining)):
+            self._array[first + sl.start:first + sl.stop] = self._array[remaining[sl]]
+        self._len = first + len(remaining)
+
+    def shrink_to_fit(self):
+        if len(self._array) > self._len:
+            self._resize(self._len)
+
+    def copy(self, deep, ind):
+        result = self._empty(self.len_ind(ind))
+        for sl, A in self._blocks(ind):
+            result._array[sl] = A
+        result._len = len(result._array)
+        return result
+
+    def append(self, other, remove_from_other, oind):
+        len_other = other.len_ind(oind)
+        if len_other == 0:
+            return
+        self._promote(other.dtype)
+        self._reserve(self._len + len_other)
+        for sl, B in other._blocks(oind):
+            self._array[self._len + sl.start:self._len + sl.stop] = B
+        self._len += len_other
+
+        if remove_from_other:
+            other.delete(oind)
+
+    def scal(self, alpha, ind):
+        self._promote(np.result_type(alpha))
+        for sl in self._block_slices(self.len_ind(ind)):
+            self._array[self._sub_ind(ind, sl)] *= alpha[sl, np.newaxis] if type(alpha) is np.ndarray else alpha
+
+    def axpy(self, alpha, x, ind, xind):
+        if x is self:
+            # avoid reading vectors which have already been updated
+            x, xind = self.copy(False, xind), None
+        self._promote(np.result_type(alpha, x.dtype))
+        if x.len_ind(xind) == 1:
+            B = x._array[x._sub_ind(xind, slice(0, 1))]
+        for sl in self._block_slices(self.len_ind(ind)):
+            if x.len_ind(xind) != 1:
+                B = x._array[x._sub_ind(xind, sl)]
+            self._array[self._sub_ind(ind, sl)] += B * (alpha[sl, np.newaxis] if type(alpha) is np.ndarray else alpha)
+
+    def inner(self, other, ind, oind):
+        if other is self and ind is oind:
+            return self.gramian(ind)
+        slices, other_slices = self._block_slices(self.len_ind(ind)), other._block_slices(other.len_ind(oind))
+        result = np.empty((self.len_ind(ind), other.len_ind(oind)), dtype=np.result_type(self.dtype, other.dtype))
+        # keep blocks of the array with fewer blocks in memory, read the other array once per block
+        if len(slices) <= len(other_slices):
+            for sl in slices:
+                A = self._array[self._sub_ind(ind, sl)].conj()
+                for osl in other_slices:
+                    result[sl, osl] = A.dot(other._array[other._sub_ind(oind, osl)].T)
+        else:
+            for osl in other_slices:
+                B = other._array[other._sub_ind(oind, osl)].T
+                for sl in slices:
+                    result[sl, osl] = self._array[self._sub_ind(ind, sl)].conj().dot(B)
+        return result
+
+    def gramian(self, ind):
+        slices = self._block_slices(self.len_ind(ind))
+        result = np.empty((self.len_ind(ind),) * 2, dtype=self.dtype)
+        for i, sl in enumerate(slices):
+            A = self._array[self._sub_ind(ind, sl)].conj()
+            result[sl, sl] = A.dot(A.conj().T)
+            for osl in slices[i+1:]:
+                result[sl, osl] = A.dot(self._array[self._sub_ind(ind, osl)].T)
+                result[osl, sl] = result[sl, osl].T.conj()
+        return result
+
+    def pairwise_inner(self, other, ind, oind):
+        result = np.empty(self.len_ind(ind), dtype=np.result_type(self.dtype, other.dtype))
+        for sl, A in self._blocks(ind):
+            result[sl] = np.sum(A.conj() * other._array[other._sub_ind(oind, sl)], axis=1)
+        return result
+
+    def lincomb(self, coefficients, ind):
+        result = self._empty(len(coefficients), np.result_type(self.dtype, coefficients.dtype))
+        # each block of result vectors requires one pass over the array
+        for rsl in result._block_slices(len(coefficients)):
+            R = 0
+            for sl, A in self._blocks(ind):
+                R = R + coefficients[rsl, sl].dot(A)
+            result._array[rsl] = R
+        result._len = len(coefficients)
+        return result
+
+    def norm2(self, ind):
+        result = np.empty(self.len_ind(ind))
+        for sl, A in self._blocks(ind):
+            result[sl] = np.sum((A * A.conj()).real, axis=1)
+        return result
+
+    def dofs(self, dof_indices, ind):
+        result = np.empty((self.len_ind(ind), len(dof_indices)), dtype=self.dtype)
+        for sl, A in self._blocks(ind):
+            result[sl] = A[:, dof_indices]
+        return result
+
+    def amax(self, ind):
+        max_ind = np.empty(self.len_ind(ind), dtype=np.int64)
+        max_val = np.empty(self.len_ind(ind))
+        for sl, A in self._blocks(ind):
+            A = np.abs(A)
+            max_ind[sl] = np.argmax(A, axis=1)
+            max_val[sl] = A[np.arange(len(A)), max_ind[sl]]
+        return max_ind, max_val
+
+
+class MemmapVectorArray(VectorArray):
+    """Out-of-core |VectorArray| implementation based on memory-mapped files.
+
+    The vectors are stored in a temporary file in the directory specified
+    by the :class:`~MemmapVectorSpace`. All operations stream over the vectors in
+    blocks of bounded size, such that arrays larger than the available
+    memory can be processed with sequential I/O. In particular,
+    :meth:`~pymor.vectorarrays.interface.VectorArray.gramian` and
+    :meth:`~pymor.vectorarrays.interface.VectorArray.lincomb` only
+    require memory for a few blocks and the results. Thus, algorithms such as
+    :func:`~pymor.algorithms.pod.pod` or :func:`~pymor.algorithms.hapod.hapod`
+    can be applied to snapshot sets which do not fit into memory.
+
+    Note that :meth:`~pymor.vectorarrays.interface.VectorArray.to_numpy`
+    always loads the data into memory.
+
+    .. warning::
+        This class is not intended to be instantiated directly. Use
+        the associated :class:`VectorSpace <MemmapVectorSpace>` instead.
+    """
+
+    impl_type = MemmapVectorArrayImpl
+
+    def shrink_to_fit(self):
+        """Release the disk space reserved for appending further vectors to the array."""
+        self.impl.shrink_to_fit()
+
+    def __str__(self):
+        return f'{type(self).__name__} of {len(self)} vectors of dimension {self.dim}'
+
+
+class MemmapVectorSpace(VectorSpace):
+    """|VectorSpace| of |MemmapVectorArrays|.
+
+    Parameters
+    ----------
+    dim
+        The dimension of the vectors contained in the space.
+    id
+        See :attr:`~pymor.vectorarrays.interface.VectorSpace.id`.
+    directory
+        Directory in which the files holding the array data are created.
+        If `None`, the default directory for temporary files is used.
+    block_size
+        Maximum size in bytes of the blocks of vectors which are loaded
+        into memory at once.
+    """
+
+    @defaults('directory', 'block_size')
+    def __init__(self, dim, id=None, directory=None, block_size=2**26):
+        assert block_size > 0
+        self.dim = dim
+        self.id = id
+        self.directory = directory
+        self.block_size = block_size
+
+    def __eq__(self, other):
+        return type(other) is type(self) and self.dim == other.dim and self.id == other.id
+
+    def __hash__(self):
+        return hash(self.dim) + hash(self.id)
+
+    def zeros(self, count=1, reserve=0):
+        assert count >= 0
+        assert reserve >= 0
+        impl = MemmapVectorArrayImpl(self.dim, np.float64, self.directory, self.block_size,
+                                     capacity=max(count, reserve))
+        impl._len = count
+        return MemmapVectorArray(self, impl)
+
+    def full(self, value, count=1, reserve=0):
+        assert count >= 0
+        assert reserve >= 0
+        impl = MemmapVectorArrayImpl(self.dim, np.result_type(value), self.directory, self.block_size,
+                                     capacity=max(count, reserve))
+        impl._len = count
+        for sl in impl._block_slices(count):
+            impl._array[sl] = value
+        return MemmapVectorArray(self, impl)
+
+    def random(self, count=1, distribution='uniform', reserve=0, **kwargs):
+        assert count >= 0
+        assert reserve >= 0
+        va = self.zeros(count, reserve)
+        for sl in va.impl._block_slices(count):
+            va.impl._array[sl] = _create_random_values((sl.stop - sl.start, self.dim), distribution, **kwargs)
+        return va
+
+    def make_array(self, obj):
+        """Create a |MemmapVectorArray| containing the vectors given by the rows of `obj`.
+
+        The data is written to a new file. `obj` can be any two-dimensional
+        array-like object, e.g. an `np.memmap` of an existing data file.
+        The rows are read block-wise.
+        """
+        if not hasattr(obj, 'shape') or len(obj.shape) != 2:
+            obj = np.array(obj, ndmin=2)
+            if obj.ndim != 2:
+                assert obj.ndim == 1
+                obj = obj.reshape((1, -1))
+        assert obj.shape[1] == self.dim
+        impl = MemmapVectorArrayImpl(self.dim, obj.dtype, self.directory, self.block_size, capacity=len(obj))
+        impl._write(obj)
+        return MemmapVectorArray(self, impl)
+
+    def from_numpy(self, data, ensure_copy=False):
+        return self.make_array(data)
@@ -13,27 +13,38 @@ from pymor.vectorarrays.interface import VectorArray, VectorArrayImpl, VectorSpa
 
 class NumpyVectorArrayImpl(VectorArrayImpl):
 
-    def __init__(self, array, l=None):
+    growth_factor = 1.5
+
+    def __init__(self, array, l=None, owns_array=False):
         self._array = array
         self._len = len(array) if l is None else l
+        # only arrays which have been allocated by the impl and which are not referenced
+        # by any view handed out to the user may be compacted by delete; views only cover
+        # the first self._len vectors, so append may always use the remaining capacity
+        self._owns_array = owns_array
 
     def to_numpy(self, ensure_copy, ind):
         A = self._array[:self._len] if ind is None else self._array[ind]
         if ensure_copy and not A.flags['OWNDATA']:
             return A.copy()
         else:
+            if not A.flags['OWNDATA']:
+                self._owns_array = False
             return A
 
     def real(self, ind):
-        return NumpyVectorArrayImpl(self.to_numpy(False, ind).real.copy())
+        A = self._array[:self._len] if ind is None else self._array[ind]
+        return NumpyVectorArrayImpl(A.real.copy())
 
     def imag(self, ind):
-        return NumpyVectorArrayImpl(self.to_numpy(False, ind).imag.copy())
+        A = self._array[:self._len] if ind is None else self._array[ind]
+        return NumpyVectorArrayImpl(A.imag.copy())
 
     def conj(self, ind):
         if np.isrealobj(self._array):
             return self.copy(False, ind)
-        return NumpyVectorArrayImpl(np.conj(self.to_numpy(False, ind)))
+        A = self._array[:self._len] if ind is None else self._array[ind]
+        return NumpyVectorArrayImpl(np.conj(A))
 
     def __len__(self):
         return self._len
@@ -42,28 +53,37 @@ class NumpyVectorArrayImpl(VectorArrayImpl):
         if ind is None:
             self._array = np.empty((0, self._array.shape[1]))
             self._len = 0
+            self._owns_array = True
             return
-        if type(ind) is slice:
-            ind = set(range(*ind.indices(self._len)))
-        elif not hasattr(ind, '__len__'):
-            ind = {ind if 0 <= ind else self._len + ind}
+        keep = np.ones(self._len, dtype=bool)
+        keep[ind] = False
+        if keep.all():
+            return
+        first = np.argmin(keep)
+        remaining = np.flatnonzero(keep)
+        if self._owns_array:
+            # compact in place, moving only the vectors after the first removed one;
+            # the capacity of the array is kept for subsequent appends
+            self._array[first:len(remaining)] = self._array[remaining[first:]]
+            self._len = len(remaining)
         else:
-            l = self._len
-            ind = {i if 0 <= i else l+i for i in ind}
-        remaining = sorted(set(range(len(self))) - ind)
-        self._array = self._array[remaining]
-        self._len = len(self._array)
-        if not self._array.flags['OWNDATA']:
-            self._array = self._array.copy()
+            self._array = self._array[remaining]
+            self._len = len(self._array)
+            self._owns_array = True
+
+    def shrink_to_fit(self):
+        if self._array.shape[0] > self._len:
+            self._array = self._array[:self._len].copy()
+            self._owns_array = True
 
     def copy(self, deep, ind):
         new_array = self._array[:self._len] if ind is None else self._array[ind]
         if not new_array.flags['OWNDATA']:
             new_array = new_array.copy()
-        return NumpyVectorArrayImpl(new_array)
+        return NumpyVectorArrayImpl(new_array, owns_array=True)
 
     def append(self, other, remove_from_other, oind):
-        other_array = other.to_numpy(False, oind)
+        other_array = other._array[:other._len] if oind is None else other._array[oind]
         len_other = len(other_array)
         if len_other == 0:
             return
@@ -71,9 +91,16 @@ class NumpyVectorArrayImpl(VectorArrayImpl):
         if len_other <= self._array.shape[0] - self._len:
             if self._array.dtype != other_array.dtype:
                 self._array = self._array.astype(np.promote_types(self._array.dtype, other_array.dtype))
-            self._array[self._len:self._len + len_other] = other_array
+                self._owns_array = True
         else:
-            self._array = np.append(self._array[:self._len], other_array, axis=0)
+            # grow geometrically to make repeated appends amortized O(1) per vector
+            capacity = max(self._len + len_other, int(self._len * self.growth_factor))
+            new_array = np.empty((capacity, self._array.shape[1]),
+                                 dtype=np.promote_types(self._array.dtype, other_array.dtype))
+            new_array[:self._len] = self._array[:self._len]
+            self._array = new_array
+            self._owns_array = True
+        self._array[self._len:self._len + len_other] = other_array
         self._len += len_other
 
         if remove_from_other:
@@ -185,11 +212,15 @@ class NumpyVectorArray(VectorArray):
     are based on |NumpyVectorArray|.
 
     This class is just a thin wrapper around the underlying
-    |NumPy array|. Thus, while operations like
+    |NumPy array|. Thus, operations like
     :meth:`~pymor.vectorarrays.interface.VectorArray.axpy` or
     :meth:`~pymor.vectorarrays.interface.VectorArray.inner`
-    will be quite efficient, removing or appending vectors will
-    be costly.
+    will be quite efficient. When appending vectors exceeds the
+    allocated capacity of the array, the capacity is increased by a
+    constant factor, such that appending vectors one at a time has
+    amortized constant cost per vector. Removing vectors compacts the
+    array in place. Unused capacity can be released using
+    :meth:`shrink_to_fit`.
 
     .. warning::
         This class is not intended to be instantiated directly. Use
@@ -198,6 +229,10 @@ class NumpyVectorArray(VectorArray):
 
     impl_type = NumpyVectorArrayImpl
 
+    def shrink_to_fit(self):
+        """Release the memory reserved for appending further vectors to the array."""
+        self.impl.shrink_to_fit()
+
     def __str__(self):
         return str(self.to_numpy())
 
@@ -229,12 +264,14 @@ class NumpyVectorSpace(VectorSpace):
     def zeros(self, count=1, reserve=0):
         assert count >= 0
         assert reserve >= 0
-        return NumpyVectorArray(self, NumpyVectorArrayImpl(np.zeros((max(count, reserve), self.dim)), count))
+        return NumpyVectorArray(self, NumpyVectorArrayImpl(np.zeros((max(count, reserve), self.dim)), count,
+                                                           owns_array=True))
 
     def full(self, value, count=1, reserve=0):
         assert count >= 0
         assert reserve >= 0
-        return NumpyVectorArray(self, NumpyVectorArrayImpl(np.full((max(count, reserve), self.dim), value), count))
+        return NumpyVectorArray(self, NumpyVectorArrayImpl(np.full((max(count, reserve), self.dim), value), count,
+                                                           owns_array=True))
 
     def random(self, count=1, distribution='uniform', reserve=0, **kwargs):
         assert count >= 0
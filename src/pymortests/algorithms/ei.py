@@ -4,9 +4,11 @@
 
 import numpy as np
 
+from pymor.algorithms.ei import ei_greedy
 from pymor.algorithms.pod import pod
 from pymor.operators.ei import EmpiricalInterpolatedOperator
 from pymor.reductors.basic import StationaryRBReductor
+from pymor.vectorarrays.numpy import NumpyVectorSpace
 from pymortests.base import runmodule, assert_all_almost_equal
 
 
@@ -57,5 +59,27 @@ def test_ei_rom(stationary_models):
         assert_all_almost_equal(u, ru_rec, rtol=1e-10)
 
 
+def test_ei_greedy_coefficients():
+    x = np.linspace(0, 1, 50)
+    U = NumpyVectorSpace.from_numpy(np.array([np.exp(-mu * x) * np.sin(3 * mu * x) for mu in np.linspace(1, 5, 40)]))
+    for error_norm in (None, 'sup'):
+        dofs, cb, data = ei_greedy(U, error_norm=error_norm, max_interpolation_dofs=8)
+        assert len(dofs) == len(cb) == len(data['coefficients']) == 8
+        assert data['coefficients'].shape == (8, len(U))
+        assert_all_almost_equal(U.lincomb(data['coefficients']), cb, rtol=1e-8, atol=1e-10)
+
+
+def test_ei_op_apply(stationary_models):
+    op = stationary_models.operator
+    mu = stationary_models.parameters.space(1, 2).sample_randomly()
+    U = op.source.random(2)
+    cb = op.range.random(5)
+    dofs = np.arange(5) * (op.range.dim // 5)
+    interpolation_matrix = cb.dofs(dofs).T
+    AU = op.apply(U, mu=mu).dofs(dofs)
+    ei_op = EmpiricalInterpolatedOperator(op, collateral_basis=cb, interpolation_dofs=dofs, triangular=False)
+    assert_all_almost_equal(ei_op.apply(U, mu=mu), cb.lincomb(np.linalg.solve(interpolation_matrix, AU.T).T))
+
+
 if __name__ == "__main__":
     runmodule(filename=__file__)
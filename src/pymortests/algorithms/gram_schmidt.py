@@ -6,8 +6,9 @@ import numpy as np
 from hypothesis import settings, assume, given
 
 from pymor.algorithms.basic import almost_equal
-from pymor.algorithms.gram_schmidt import gram_schmidt, gram_schmidt_biorth
+from pymor.algorithms.gram_schmidt import block_gram_schmidt, gram_schmidt, gram_schmidt_biorth
 from pymor.core.logger import log_levels
+from pymor.vectorarrays.numpy import NumpyVectorSpace
 from pymor.algorithms.basic import contains_zero_vector
 from pymortests.base import runmodule
 import pymortests.strategies as pyst
@@ -86,6 +87,61 @@ def test_gram_schmidt_with_product_and_R(operator_with_arrays_and_products):
     assert np.all(almost_equal(onb, U))
 
 
+@pyst.given_vector_arrays()
+@settings(deadline=None)
+def test_block_gram_schmidt(vector_array):
+    U = vector_array
+    assume(len(U) > 1 or not contains_zero_vector(U))
+
+    V = U.copy()
+    onb, R = block_gram_schmidt(U, return_R=True, block_size=2, copy=True)
+    assert np.all(almost_equal(U, V))
+    assert np.allclose(onb.inner(onb), np.eye(len(onb)))
+    rtol = atol = 1e-13
+    assert np.all(almost_equal(U, onb.lincomb(onb.inner(U).T), rtol=rtol, atol=atol))
+    assert np.all(almost_equal(V, onb.lincomb(R.T), rtol=rtol, atol=atol))
+
+    onb2, R2 = block_gram_schmidt(U, return_R=True, block_size=2, copy=False)
+    assert np.all(almost_equal(onb, onb2))
+    assert np.all(R == R2)
+    assert np.all(almost_equal(onb, U))
+
+
+def test_block_gram_schmidt_with_product_and_R(operator_with_arrays_and_products):
+    _, _, U, _, p, _ = operator_with_arrays_and_products
+
+    V = U.copy()
+    onb, R = block_gram_schmidt(U, product=p, return_R=True, block_size=3, copy=True)
+    assert np.all(almost_equal(U, V))
+    assert np.allclose(p.apply2(onb, onb), np.eye(len(onb)))
+    assert np.all(almost_equal(U, onb.lincomb(p.apply2(onb, U).T), rtol=1e-13))
+    assert np.all(almost_equal(U, onb.lincomb(R.T)))
+
+
+def test_block_gram_schmidt_dependent_vectors():
+    space = NumpyVectorSpace(10)
+    U = space.random(8)
+    U.append(U[:3].lincomb(np.array([[1., -2., 3.]])))
+    U.append(space.zeros())
+    U.append(space.random(3))
+
+    onb, R = gram_schmidt(U, return_R=True)
+    onb_block, R_block = block_gram_schmidt(U, return_R=True, block_size=4)
+    assert len(onb_block) == 10
+    assert np.allclose(R_block, R)
+    assert np.all(almost_equal(onb_block, onb, rtol=1e-12, atol=1e-12))
+
+
+def test_block_gram_schmidt_offset():
+    space = NumpyVectorSpace(10)
+    U = gram_schmidt(space.random(4))
+    U.append(space.random(5))
+
+    onb = block_gram_schmidt(U, offset=4, block_size=2)
+    assert np.all(almost_equal(onb[:4], U[:4]))
+    assert np.allclose(onb.inner(onb), np.eye(len(onb)))
+
+
 @given(pyst.base_vector_arrays(count=2))
 @settings(deadline=None)
 def test_gram_schmidt_biorth(vector_arrays):
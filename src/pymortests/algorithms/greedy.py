@@ -0,0 +1,58 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+import numpy as np
+import pytest
+
+from pymor.algorithms.gram_schmidt import gram_schmidt
+from pymor.algorithms.greedy import WeakGreedySurrogate, weak_greedy
+from pymor.parameters.base import Parameters
+from pymor.vectorarrays.numpy import NumpyVectorSpace
+from pymortests.base import runmodule
+
+
+class ProjectionSurrogate(WeakGreedySurrogate):
+    """Best-approximation error of sin(mu * x) in the span of the selected snapshots."""
+
+    def __init__(self):
+        self.space = NumpyVectorSpace(50)
+        self.basis = self.space.empty()
+        self.evaluate_calls = 0
+
+    def vectors(self, mus):
+        x = np.linspace(0, 1, self.space.dim)
+        return self.space.from_numpy(np.array([np.sin(mu['k'][0] * x) for mu in mus]))
+
+    def evaluate(self, mus, return_all_values=False):
+        self.evaluate_calls += 1
+        U = self.vectors(mus)
+        errs = (U - self.basis.lincomb(U.inner(self.basis))).norm()
+        if return_all_values:
+            return errs
+        return errs[np.argmax(errs)], mus[np.argmax(errs)]
+
+    def extend(self, mu):
+        self.basis.append(self.vectors([mu]))
+        gram_schmidt(self.basis, offset=len(self.basis) - 1, copy=False)
+
+
+@pytest.mark.parametrize('saturation_constant', [None, 1., 2.])
+def test_weak_greedy(saturation_constant):
+    training_set = Parameters(k=1).space(1, 10).sample_uniformly(100)
+    reference = weak_greedy(ProjectionSurrogate(), training_set, max_extensions=6)
+    surrogate = ProjectionSurrogate()
+    result = weak_greedy(surrogate, training_set, max_extensions=6, saturation_constant=saturation_constant)
+    assert result['extensions'] == 6
+    assert result['max_err_mus'] == reference['max_err_mus']
+    assert np.allclose(result['max_errs'], reference['max_errs'])
+    assert reference['evaluations'] == 6 * len(training_set)
+    if saturation_constant == 1.:
+        assert result['evaluations'] < reference['evaluations']
+    if saturation_constant is not None:
+        # all candidates which might exceed the first re-evaluated values are evaluated at once
+        assert surrogate.evaluate_calls <= 1 + 2 * 5
+
+
+if __name__ == '__main__':
+    runmodule(filename=__file__)
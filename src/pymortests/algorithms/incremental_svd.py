@@ -0,0 +1,85 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+from functools import partial
+
+import numpy as np
+import pytest
+
+from pymor.algorithms.hapod import (
+    default_pod_method,
+    hapod,
+    inc_hapod_tree,
+    incremental_svd_pod_method,
+    std_local_eps,
+)
+from pymor.algorithms.incremental_svd import IncrementalSVD, incremental_svd
+from pymor.algorithms.pod import pod
+from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.vectorarrays.numpy import NumpyVectorSpace
+
+
+def _snapshots(count=200, dim=100):
+    x = np.linspace(0, 1, dim)
+    t = np.linspace(0, 1, count)
+    return NumpyVectorSpace.from_numpy(np.sin(np.pi * np.outer(1 + 5 * t, x)) * np.exp(-t)[:, np.newaxis])
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 200])
+@pytest.mark.parametrize('with_product', [False, True])
+def test_incremental_svd(chunk_size, with_product):
+    U = _snapshots()
+    product = NumpyMatrixOperator(np.diag(np.linspace(1, 2, U.dim))) if with_product else None
+
+    modes, svals = incremental_svd((U[i:i+chunk_size] for i in range(0, len(U), chunk_size)),
+                                   product=product, rtol=1e-10)
+    pod_modes, pod_svals = pod(U, product=product, rtol=1e-10)
+    # compare the singular values which are well above the accuracy of the method of snapshots
+    n = np.count_nonzero(pod_svals > 1e-6 * pod_svals[0])
+    assert len(svals) >= n
+    assert np.allclose(svals[:n], pod_svals[:n], rtol=1e-6)
+    assert np.allclose(modes.gramian(product), np.eye(len(modes)))
+    assert np.allclose(np.abs(modes[:5].inner(pod_modes[:5], product)), np.eye(5), atol=1e-5)
+
+
+def test_incremental_svd_l2_err():
+    U = _snapshots()
+    l2_err = 1e-2 * np.sqrt(np.sum(U.norm2()))
+    isvd = IncrementalSVD(U.space, rtol=0., l2_err=l2_err)
+    for i in range(0, len(U), 10):
+        isvd.update(U[i:i+10])
+    assert isvd.snapshot_count == len(U)
+    assert isvd.error <= l2_err
+    projection_error = np.sqrt(np.sum((U - isvd.modes.lincomb(U.inner(isvd.modes))).norm2()))
+    assert projection_error <= isvd.error * (1 + 1e-10)
+
+    modes, svals = incremental_svd([U], modes=3)
+    assert len(modes) == len(svals) == 3
+
+
+def test_incremental_svd_pod_method():
+    U = _snapshots()
+    eps = 1e-3 * np.max(U.norm())
+    tree = inc_hapod_tree(10)
+    modes, svals, snap_count = hapod(tree, lambda node: U[node.tag*20:(node.tag+1)*20],
+                                     std_local_eps(tree, eps, 0.75, True),
+                                     pod_method=partial(incremental_svd_pod_method, chunk_size=8))
+    assert snap_count == len(U)
+    assert np.allclose(modes.gramian(), np.eye(len(modes)))
+    # eps bounds the mean squared projection error
+    projection_error = np.sqrt(np.mean((U - modes.lincomb(U.inner(modes))).norm2()))
+    assert projection_error <= eps
+
+
+@pytest.mark.parametrize('is_root_node', [True, False])
+@pytest.mark.parametrize('eps', [0., 1e-8])
+def test_incremental_svd_pod_method_rank_deficient(is_root_node, eps):
+    rng = np.random.default_rng(0)
+    U = NumpyVectorSpace.from_numpy(rng.standard_normal((200, 3)) @ rng.standard_normal((3, 500)))
+    modes, svals = incremental_svd_pod_method(U, eps, is_root_node, None)
+    pod_modes, pod_svals = default_pod_method(U, eps, is_root_node, None)
+    assert len(modes) == len(svals) == 3
+    assert len(modes) <= len(pod_modes)
+    assert np.allclose(svals, pod_svals[:3])
+    assert np.allclose(modes.gramian(), np.eye(len(modes)))
@@ -56,6 +56,22 @@ def test_project_with_product_2(operator_with_arrays_and_products):
     assert np.all(almost_equal(Y0, Y2))
 
 
+def test_project_with_cache(operator_with_arrays_and_products):
+    op, mu, U, V, sp, rp = operator_with_arrays_and_products
+    U_ext, V_ext = U[:len(U) // 2].copy(), V[:len(V) // 2].copy()
+    cache = {}
+    for range_basis, source_basis in [(V_ext, U_ext), (None, U_ext), (V_ext, None)]:
+        project(op, range_basis, source_basis, product=rp if range_basis is not None else None, cache=cache)
+    U_ext.append(U[len(U) // 2:])
+    V_ext.append(V[len(V) // 2:])
+    for range_basis, source_basis, rb, sb in [(V_ext, U_ext, V, U), (None, U_ext, None, U), (V_ext, None, V, None)]:
+        product = rp if range_basis is not None else None
+        op_cached = project(op, range_basis, source_basis, product=product, cache=cache)
+        op_proj = project(op, rb, sb, product=product)
+        W = op_proj.source.random(1)
+        assert np.all(almost_equal(op_cached.apply(W, mu=mu), op_proj.apply(W, mu=mu)))
+
+
 def test_project_to_subbasis(operator_with_arrays):
     op, mu, U, V = operator_with_arrays
     op_UV = project(op, V, U)
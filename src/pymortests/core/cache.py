@@ -92,6 +92,7 @@ def test_region_api():
     key = 'mykey'
     with tempfile.TemporaryDirectory() as tmpdir:
         backends = [cache.MemoryRegion(100),
+                    cache.LRUMemoryRegion(1024 ** 2),
                     cache.DiskRegion(path=os.path.join(tmpdir, str(uuid4())),
                                      max_size=1024 ** 2, persistent=False)]
         for backend in backends:
@@ -122,5 +123,48 @@ def test_memory_region_safety():
     assert len(U) == 1
 
 
+def test_lru_memory_region():
+    region = cache.LRUMemoryRegion(3 * 8 * 100)
+    values = [np.full(100, float(i)) for i in range(4)]
+    for i, v in enumerate(values[:3]):
+        region.set(i, v)
+    assert region.size == 3 * 8 * 100
+
+    # stored values are decoupled from the original value and returned read-only
+    values[0][:] = -1
+    found, v = region.get(0)
+    assert found and np.all(v == 0.)
+    assert not v.flags.writeable
+
+    # key 1 is now least recently used
+    region.set(3, values[3])
+    assert region.get(1) == (False, None)
+    assert region.get(0)[0] and region.get(2)[0] and region.get(3)[0]
+    assert region.size == 3 * 8 * 100
+    assert (region.hits, region.misses, region.evictions) == (4, 1, 1)
+
+    # entries exceeding the budget are not stored
+    region.set(4, np.zeros(1000))
+    assert region.get(4) == (False, None)
+    assert region.size == 3 * 8 * 100
+
+
+def test_lru_memory_region_safety():
+
+    op = NumpyMatrixOperator(np.eye(1))
+    rhs = op.range.make_array(np.array([1]))
+    m = StationaryModel(op, rhs)
+    m.enable_caching('lru_memory')
+
+    U = m.solve()
+    del U[:]
+    U = m.solve()
+    assert len(U) == 1
+    U.scal(2.)
+    U = m.solve()
+    assert len(U) == 1
+    assert U.to_numpy()[0, 0] == 1.
+
+
 if __name__ == "__main__":
     runmodule(filename=__file__)
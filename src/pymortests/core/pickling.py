@@ -9,17 +9,31 @@ from types import FunctionType, MethodType
 from pymor.core.base import BasicObject
 from pymor.core.config import config
 from pymor.core.pickle import dumps, loads, dumps_function, PicklingError
+from pymor.discretizers.builtin.grids.interfaces import BoundaryInfo, Grid
 from pymor.discretizers.builtin.grids.subgrid import SubGrid
 from pymor.operators.numpy import NumpyMatrixBasedOperator
 from pymor.parameters.base import ParametricObject
+from pymor.vectorarrays.memmap import MemmapVectorArrayImpl
 
 is_equal_ignored_attributes = \
-    ((SubGrid, {'_uid', '_CacheableObject__cache_region', '_SubGrid__parent_grid'}),
-     (NumpyMatrixBasedOperator, {'_uid', '_CacheableObject__cache_region', '_parameters', '_assembled_operator'}),
+    ((SubGrid, {'_uid', '_CacheableObject__cache_region', '_SubGrid__parent_grid', '_memoized_values'}),
+     (Grid, {'_name', '_uid', '_CacheableObject__cache_region', '_memoized_values'}),
+     (BoundaryInfo, {'_name', '_uid', '_CacheableObject__cache_region', '_memoized_values'}),
+     (NumpyMatrixBasedOperator, {'_uid', '_CacheableObject__cache_region', '_parameters', '_assembled_operator',
+                                 '_lincomb_patterns'}),
      (ParametricObject, {'_name', '_uid', '_CacheableObject__cache_region', '_parameters'}),
      (BasicObject, {'_name', '_uid', '_CacheableObject__cache_region'}))
 
-is_equal_dispatch_table = {}
+
+def _assert_MemmapVectorArrayImpl_equal(first, second):
+    # the data is stored in a new file after unpickling
+    if not isinstance(second, MemmapVectorArrayImpl):
+        return False
+    assert_is_equal(first.__getstate__(), second.__getstate__())
+    return True
+
+
+is_equal_dispatch_table = {MemmapVectorArrayImpl: _assert_MemmapVectorArrayImpl_equal}
 
 if config.HAVE_DUNEGDT:
     from dune.xt.la import IstlVector
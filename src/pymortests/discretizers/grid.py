@@ -9,6 +9,8 @@ import pytest
 from hypothesis import given, settings
 
 from pymor.core.exceptions import QtMissing
+from pymor.core.pickle import dumps, loads
+from pymor.discretizers.builtin.grids.interfaces import memoized_size
 from pymortests.base import might_exceed_deadline
 from pymortests.fixtures.grid import hy_grids_with_visualize, hy_grid, hy_grid_and_dim_range_product, \
     hy_grid_and_dim_range_product_and_s_max_en, hy_grid_and_dim_range_product_and_s, \
@@ -420,6 +422,18 @@ def test_pickle(grid):
     assert_picklable_without_dumps_function(grid)
 
 
+@given(hy_grid)
+def test_memoized(grid):
+    g = grid
+    for d in range(g.dim + 1):
+        V = g.volumes(d)
+        assert g.volumes(d) is V
+        assert not V.flags.writeable
+        assert g.superentities(g.dim, 0) is g.superentities(g.dim, superentity_codim=0)
+    assert memoized_size(g) >= sum(g.volumes(d).nbytes for d in range(g.dim + 1))
+    assert '_memoized_values' not in loads(dumps(g)).__dict__
+
+
 @settings(deadline=None)
 @given(hy_grids_with_visualize)
 def test_visualize(grids_with_visualize):
@@ -90,6 +90,8 @@ def assert_tf_add(m1, m2, m):
     for s in (0, 1j):
         assert np.allclose(m.eval_tf(s), m1.eval_tf(s) + m2.eval_tf(s))
         assert np.allclose(m.eval_dtf(s), m1.eval_dtf(s) + m2.eval_dtf(s))
+    s = np.array([0, 1j])
+    assert np.allclose(m.eval_tf(s), m1.eval_tf(s) + m2.eval_tf(s))
 
 
 def assert_tf_sub(m1, m2, m):
@@ -99,6 +101,8 @@ def assert_tf_sub(m1, m2, m):
     for s in (0, 1j):
         assert np.allclose(m.eval_tf(s), m1.eval_tf(s) - m2.eval_tf(s))
         assert np.allclose(m.eval_dtf(s), m1.eval_dtf(s) - m2.eval_dtf(s))
+    s = np.array([0, 1j])
+    assert np.allclose(m.eval_tf(s), m1.eval_tf(s) - m2.eval_tf(s))
 
 
 def assert_tf_mul(m1, m2, m):
@@ -110,6 +114,8 @@ def assert_tf_mul(m1, m2, m):
                            m1.eval_tf(s) @ m2.eval_tf(s))
         assert np.allclose(m.eval_dtf(s),
                            m1.eval_dtf(s) @ m2.eval_tf(s) + m1.eval_tf(s) @ m2.eval_dtf(s))
+    s = np.array([0, 1j])
+    assert np.allclose(m.eval_tf(s), m1.eval_tf(s) @ m2.eval_tf(s))
 
 
 @pytest.mark.parametrize('p1', type_list)
@@ -4,17 +4,26 @@
 
 import numpy as np
 import pytest
+import scipy.linalg as spla
 
 from pymor.algorithms.basic import almost_equal
-from pymor.algorithms.timestepping import ExplicitEulerTimeStepper, ImplicitMidpointTimeStepper
+from pymor.algorithms.gram_schmidt import gram_schmidt
+from pymor.algorithms.timestepping import (DiscreteTimeStepper, EmbeddedRungeKuttaTimeStepper, ExplicitEulerTimeStepper,
+                                           ImplicitEulerTimeStepper, ImplicitMidpointTimeStepper, SDIRKTimeStepper,
+                                           TimeStepper)
 from pymor.analyticalproblems.functions import ExpressionFunction, ConstantFunction
 from pymor.analyticalproblems.thermalblock import thermal_block_problem
 from pymor.core.pickle import dumps, loads
 from pymor.discretizers.builtin import discretize_stationary_cg
+from pymor.models.basic import InstationaryModel
 from pymor.models.iosys import LTIModel
 from pymor.models.symplectic import QuadraticHamiltonianModel
 from pymor.operators.block import BlockDiagonalOperator
 from pymor.operators.constructions import IdentityOperator
+from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.parameters.functionals import ExpressionParameterFunctional
+from pymor.reductors.basic import StationaryRBReductor
+from pymor.reductors.coercive import CoerciveRBReductor, SimpleCoerciveRBReductor
 from pymor.vectorarrays.numpy import NumpyVectorSpace
 from pymortests.base import runmodule
 from pymortests.core.pickling import assert_picklable, assert_picklable_without_dumps_function
@@ -57,6 +66,50 @@ def test_StationaryModel_deaffinize():
     assert np.allclose(m.output(mu), m_deaff.output(mu))
 
 
+def test_StationaryModel_solve_batch():
+    p = thermal_block_problem((2, 2)).with_(
+        outputs=[('l2', ConstantFunction(1., 2)), ('l2_boundary', ConstantFunction(1., 2))]
+    )
+    m, _ = discretize_stationary_cg(p, diameter=1/10)
+    m.disable_caching()
+    RB = m.solution_space.empty()
+    for mu in p.parameter_space.sample_uniformly(2):
+        RB.append(m.solve(mu))
+    rom = StationaryRBReductor(m, gram_schmidt(RB)).reduce()
+    rom.disable_caching()
+
+    mus = p.parameter_space.sample_randomly(10)
+    for model in (m, rom):
+        U = model.solve_batch(mus, batch_size=3)
+        assert len(U) == len(mus)
+        for i, mu in enumerate(mus):
+            assert np.all(almost_equal(U[i], model.solve(mu)))
+        outputs = model.output_batch(mus, batch_size=3)
+        assert outputs.shape == (len(mus), 2)
+        assert np.allclose(outputs, np.vstack([model.output(mu) for mu in mus]))
+    assert len(rom.solve_batch([])) == 0
+    assert rom.output_batch([]).shape == (0, 2)
+
+
+@pytest.mark.parametrize('reductor', [CoerciveRBReductor, SimpleCoerciveRBReductor])
+def test_StationaryModel_estimate_error_batch(reductor):
+    p = thermal_block_problem((2, 2))
+    m, _ = discretize_stationary_cg(p, diameter=1/10)
+    RB = m.solution_space.empty()
+    for mu in p.parameter_space.sample_uniformly(2):
+        RB.append(m.solve(mu))
+    coercivity_estimator = ExpressionParameterFunctional('min(diffusion)', m.parameters)
+    RB = gram_schmidt(RB, product=m.h1_0_semi_product)
+    rom = reductor(m, RB, product=m.h1_0_semi_product, coercivity_estimator=coercivity_estimator).reduce()
+    rom.disable_caching()
+
+    mus = p.parameter_space.sample_randomly(10)
+    estimates = rom.estimate_error_batch(mus, batch_size=3)
+    assert estimates.shape == (len(mus),)
+    assert np.allclose(estimates, [rom.estimate_error(mu)[0] for mu in mus])
+    assert rom.estimate_error_batch([]).shape == (0,)
+
+
 @pytest.mark.parametrize('block_phase_space', (False, True))
 def test_quadratic_hamiltonian_model(block_phase_space):
     """Check QuadraticHamiltonianModel with implicit midpoint rule."""
@@ -133,5 +186,132 @@ def test_lti_solve(sampling_time, m, p, T, nt):
     assert all(len(Xi) == len(X) for Xi in X_step)
 
 
+@pytest.mark.parametrize('time_stepper', (ImplicitEulerTimeStepper(10), ExplicitEulerTimeStepper(10),
+                                          ImplicitMidpointTimeStepper(10), DiscreteTimeStepper()))
+@pytest.mark.parametrize('num_values', (None, 4, 15))
+def test_instationary_iterate(time_stepper, num_values):
+    space = NumpyVectorSpace(3)
+    T = 10 if isinstance(time_stepper, DiscreteTimeStepper) else 1.
+    m = InstationaryModel(T, space.ones(),
+                          NumpyMatrixOperator(np.diag([0.1, 0.5, 1.])),
+                          NumpyMatrixOperator(np.ones((3, 1))) * ExpressionParameterFunctional('t[0]', {'t': 1}),
+                          time_stepper=time_stepper, num_values=num_values,
+                          output_functional=NumpyMatrixOperator(np.arange(6.).reshape((2, 3))))
+    m.disable_caching()
+    U = m.solve()
+    times, vectors = zip(*m.iterate())
+    assert len(times) == len(U)
+    assert times[0] == 0 and np.isclose(times[-1], T)
+    V = space.empty()
+    for W in vectors:
+        V.append(W)
+    assert np.all(almost_equal(U, V))
+    # only the output is requested, so the trajectory is not stored
+    assert np.allclose(m.output(), m.output_functional.apply(U).to_numpy())
+    m.enable_caching('memory')
+    assert np.allclose(m.output(), m.output_functional.apply(U).to_numpy())
+
+
+def test_time_stepper_without_solve_or_iterate():
+    class IncompleteTimeStepper(TimeStepper):
+        pass
+
+    space = NumpyVectorSpace(3)
+    time_stepper = IncompleteTimeStepper()
+    with pytest.raises(NotImplementedError):
+        time_stepper.solve(0., 1., space.ones(), NumpyMatrixOperator(np.eye(3)))
+    with pytest.raises(NotImplementedError):
+        time_stepper.iterate(0., 1., space.ones(), NumpyMatrixOperator(np.eye(3)))
+
+
+@pytest.mark.parametrize('time_stepper', (ImplicitEulerTimeStepper(10), ImplicitMidpointTimeStepper(10)))
+@pytest.mark.parametrize('num_values', (None, 4))
+def test_instationary_dense_time_stepping(time_stepper, num_values, monkeypatch):
+    space = NumpyVectorSpace(3)
+    A = NumpyMatrixOperator(np.diag([0.1, 0.5, 1.])) * ExpressionParameterFunctional('a[0]', {'a': 1})
+    m = InstationaryModel(1., space.ones(), A,
+                          NumpyMatrixOperator(np.ones((3, 1))),
+                          mass=NumpyMatrixOperator(np.eye(3) + 0.1 * np.ones((3, 3))),
+                          time_stepper=time_stepper, num_values=num_values,
+                          output_functional=NumpyMatrixOperator(np.arange(6.).reshape((2, 3))))
+    m.disable_caching()
+    mu = m.parameters.parse(2.)
+    # solve uses a preassembled propagator, iterate performs the generic time steps
+    U = m.solve(mu)
+    V = space.empty()
+    for _, W in m.iterate(mu):
+        V.append(W)
+    assert len(U) == (num_values or 11)
+    assert np.all(almost_equal(U, V))
+
+    # the output is computed from the trajectory returned by solve instead of iterating
+    def iterate(*args, **kwargs):
+        raise AssertionError('iterate should not be called')
+
+    monkeypatch.setattr(type(time_stepper), 'iterate', iterate)
+    assert np.allclose(m.output(mu), m.output_functional.apply(U).to_numpy())
+
+
+@pytest.mark.parametrize('time_stepper', (ExplicitEulerTimeStepper(10), ImplicitEulerTimeStepper(10),
+                                          ImplicitMidpointTimeStepper(10)))
+@pytest.mark.parametrize('with_mass', (False, True))
+def test_instationary_solve_batch(time_stepper, with_mass):
+    if with_mass and isinstance(time_stepper, ExplicitEulerTimeStepper):
+        pytest.skip('explicit Euler does not support mass operators')
+    a = ExpressionParameterFunctional('a[0]', {'a': 2})
+    b = ExpressionParameterFunctional('a[1]', {'a': 2})
+    A = NumpyMatrixOperator(np.diag([0.1, 0.5, 1.])) * a + NumpyMatrixOperator(np.eye(3, k=1)) * b
+    m = InstationaryModel(1., NumpyMatrixOperator(np.ones((3, 1))) * b, A,
+                          NumpyMatrixOperator(np.arange(3.).reshape((3, 1))),
+                          mass=NumpyMatrixOperator(np.eye(3) + 0.1 * np.ones((3, 3))) if with_mass else None,
+                          time_stepper=time_stepper, num_values=6,
+                          output_functional=NumpyMatrixOperator(np.ones((1, 3))) * a)
+    m.disable_caching()
+    mus = m.parameters.space(0.1, 1.).sample_randomly(5)
+    U = m.solve_batch(mus, batch_size=2)
+    outputs = m.output_batch(mus, batch_size=2)
+    assert len(U) == len(mus)
+    assert outputs.shape == (len(mus), 6, 1)
+    for mu, U_mu, output in zip(mus, U, outputs):
+        assert np.all(almost_equal(U_mu, m.solve(mu)))
+        assert np.allclose(output, m.output(mu))
+
+
+@pytest.mark.parametrize('time_stepper', (EmbeddedRungeKuttaTimeStepper(), EmbeddedRungeKuttaTimeStepper('bs23'),
+                                          SDIRKTimeStepper(rtol=1e-6, atol=1e-8)))
+def test_adaptive_time_stepping(time_stepper):
+    n = 20
+    L = np.diag(2 * np.ones(n)) - np.diag(np.ones(n - 1), 1) - np.diag(np.ones(n - 1), -1)
+    M = np.eye(n) + 0.1 * np.diag(np.ones(n - 1), 1) + 0.1 * np.diag(np.ones(n - 1), -1)
+    u0, f = np.sin(np.linspace(0, np.pi, n)), np.ones(n)
+    m = InstationaryModel(1., NumpyVectorSpace.from_numpy(u0), NumpyMatrixOperator(L),
+                          NumpyVectorSpace.from_numpy(f), mass=NumpyMatrixOperator(M),
+                          time_stepper=time_stepper, num_values=11)
+    u_stat = np.linalg.solve(L, f)
+    exact = np.array([spla.expm(-np.linalg.solve(M, L) * t) @ (u0 - u_stat) + u_stat for t in np.linspace(0, 1, 11)])
+    assert np.allclose(m.solve().to_numpy(), exact, rtol=0, atol=1e-5)
+    # without num_values, the solution is returned after each time step
+    U = m.with_(num_values=None).solve()
+    assert len(U) > 2
+    assert np.allclose(U[-1].to_numpy()[0], exact[-1], rtol=0, atol=1e-5)
+
+
+@pytest.mark.parametrize('time_stepper', (EmbeddedRungeKuttaTimeStepper(rtol=1e-8, atol=1e-10),
+                                          EmbeddedRungeKuttaTimeStepper('bs23'), SDIRKTimeStepper()))
+def test_adaptive_time_stepping_dense_output(time_stepper):
+    m = InstationaryModel(10., NumpyVectorSpace(1).ones(), NumpyMatrixOperator(np.eye(1)),
+                          NumpyMatrixOperator(np.ones((1, 1))) * ExpressionParameterFunctional('cos(t[0])', {'t': 1}),
+                          time_stepper=time_stepper, num_values=21)
+
+    def exact(t):
+        return (np.cos(t) + np.sin(t) + np.exp(-t)) / 2
+
+    times, vectors = zip(*m.with_(num_values=None).iterate())
+    step_error = np.max(np.abs(np.hstack([U.to_numpy()[0] for U in vectors]) - exact(np.array(times))))
+    # the solution at the equidistant output times is as accurate as at the time steps
+    grid_error = np.max(np.abs(m.solve().to_numpy()[:, 0] - exact(np.linspace(0, 10, 21))))
+    assert grid_error <= 2 * max(step_error, time_stepper.rtol)
+
+
 if __name__ == "__main__":
     runmodule(filename=__file__)
@@ -0,0 +1,62 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+import numpy as np
+import pytest
+import scipy.sparse as sps
+
+from pymor.models.iosys import LTIModel
+from pymor.models.transfer_function import TransferFunction
+from pymor.parallel.processes import ProcessPool
+from pymortests.base import runmodule
+
+
+@pytest.mark.parametrize('sparse', [False, True])
+@pytest.mark.parametrize('with_E', [False, True])
+@pytest.mark.parametrize('m,p', [(2, 3), (3, 1)])
+@pytest.mark.parametrize('sampling_time', [0, 1])
+def test_lti_eval_tf_batch(sparse, with_E, m, p, sampling_time):
+    n = 10
+    rng = np.random.default_rng(0)
+    A = -2 * np.eye(n) + 0.1 * rng.standard_normal((n, n))
+    E = np.eye(n) + np.diag(rng.uniform(size=n)) if with_E else None
+    if sparse:
+        A = sps.csc_matrix(A)
+        E = sps.csc_matrix(E) if with_E else None
+    B = rng.standard_normal((n, m))
+    C = rng.standard_normal((p, n))
+    D = rng.standard_normal((p, m))
+    lti = LTIModel.from_matrices(A, B, C, D, E=E, sampling_time=sampling_time)
+    tf = lti.transfer_function
+
+    w = np.linspace(0.1, 3, 5)
+    s = 1j * w if sampling_time == 0 else np.exp(1j * w)
+    tfs = tf.eval_tf(s)
+    assert tfs.shape == (len(s), p, m)
+    assert np.allclose(tfs, np.stack([tf.eval_tf(si) for si in s]))
+    assert np.allclose(tf.freq_resp(w), tfs)
+    assert tf.eval_tf(np.array([])).shape == (0, p, m)
+
+
+def test_eval_tf_batch_fallback():
+    tf = TransferFunction(1, 2, lambda s: np.array([[1 / (s + 1)], [s]]))
+    s = np.array([0, 1j, 2j])
+    tfs = tf.eval_tf(s)
+    assert tfs.shape == (3, 2, 1)
+    assert np.allclose(tfs, np.stack([tf.eval_tf(si) for si in s]))
+
+
+def test_freq_resp_process_pool():
+    n = 30
+    rng = np.random.default_rng(0)
+    lti = LTIModel.from_matrices(-2 * np.eye(n) + 0.1 * rng.standard_normal((n, n)),
+                                 rng.standard_normal((n, 2)), rng.standard_normal((1, n)))
+    w = np.logspace(-1, 1, 10)
+    with ProcessPool(2) as pool:
+        tfw = lti.transfer_function.freq_resp(w, pool=pool)
+    assert np.allclose(tfw, lti.transfer_function.freq_resp(w))
+
+
+if __name__ == "__main__":
+    runmodule(filename=__file__)
@@ -10,6 +10,7 @@ from pymor.algorithms.projection import project
 from pymor.algorithms.to_matrix import to_matrix
 from pymor.core.exceptions import InversionError, LinAlgError
 from pymor.core.config import config
+from pymor.core.pickle import dumps, loads
 from pymor.operators.block import BlockDiagonalOperator
 from pymor.operators.constructions import (SelectionOperator, InverseOperator, InverseAdjointOperator, IdentityOperator,
                                            LincombOperator, VectorArrayOperator, QuadraticFunctional,
@@ -549,6 +550,200 @@ def test_hankel_operator(iscomplex):
     np.testing.assert_array_almost_equal(op.apply_adjoint(V).to_numpy().T, to_matrix(op).conj().T @ V.to_numpy().T)
 
 
+@pytest.mark.parametrize('num_flux', ['lax_friedrichs', 'engquist_osher', 'simplified_engquist_osher'])
+def test_nonlinear_advection_apply_batched(num_flux):
+    from pymor.analyticalproblems.burgers import burgers_problem_2d
+    from pymor.discretizers.builtin import discretize_instationary_fv
+    m, _ = discretize_instationary_fv(burgers_problem_2d(), diameter=1/6, num_flux=num_flux, nt=10)
+    op = m.operator
+    mu = m.parameters.parse(1.5)
+    U = op.source.random(5)
+    V = op.apply(U, mu=mu)
+    assert len(op.apply(U[[]], mu=mu)) == 0
+    for i in range(len(U)):
+        assert np.allclose(V[i].to_numpy(), op.apply(U[i], mu=mu).to_numpy(), rtol=1e-14, atol=1e-14)
+    # compare finite differences of the batched apply with the independently assembled jacobian
+    W = op.source.random(1)
+    delta = 1e-6
+    D = op.apply(U[0] + delta * W, mu=mu) - op.apply(U[0] - delta * W, mu=mu)
+    D.scal(0.5 / delta)
+    assert np.allclose(D.to_numpy(), op.jacobian(U[0], mu=mu).apply(W).to_numpy(), rtol=1e-5, atol=1e-5)
+
+
+def test_numpy_sparse_factorization_cache():
+    import scipy.sparse as sps
+    from pymor.bindings.scipy import factorization_cache
+    from pymor.parameters.functionals import ProjectionParameterFunctional
+    n = 100
+    A = sps.diags([-np.ones(n-1), 2.5 * np.ones(n), -np.ones(n-1)], [-1, 0, 1], format='csc')
+    B = sps.diags([np.linspace(0, 1, n)], [0], format='csc')
+    B = B + sps.diags([np.ones(n-1)], [1])
+    op = LincombOperator([NumpyMatrixOperator(A), NumpyMatrixOperator(B)], [1., ProjectionParameterFunctional('p')])
+    mu = op.parameters.parse(0.5)
+    V = op.range.random(3)
+    cache = factorization_cache()
+    cache.clear()
+
+    U = op.apply_inverse(V, mu=mu)
+    assert cache.misses == 1 and cache.hits == 0 and cache.size > 0
+    assert np.all(almost_equal(op.apply(U, mu=mu), V))
+    assert np.all(almost_equal(op.apply_inverse(V, mu=mu), U, rtol=1e-14, atol=1e-14))
+    assert cache.misses == 1 and cache.hits == 1
+
+    # the adjoint solve uses the same factorization
+    W = op.apply_inverse_adjoint(V, mu=mu)
+    assert cache.misses == 1 and cache.hits == 2
+    assert np.all(almost_equal(op.apply_adjoint(W, mu=mu), V))
+
+    # complex right-hand sides are solved with the real factorization
+    VC = V + 1j * op.range.random(3)
+    UC = op.apply_inverse(VC, mu=mu)
+    assert cache.misses == 1 and cache.hits == 3
+    assert np.all(almost_equal(op.apply(UC, mu=mu), VC))
+
+    # the factorization survives pickling
+    assembled_op = op.assemble(mu)
+    assert_picklable(assembled_op)
+    assert np.all(almost_equal(loads(dumps(assembled_op)).apply_inverse(V), U, rtol=1e-14, atol=1e-14))
+    assert cache.misses == 1 and cache.hits == 4
+
+    op.apply_inverse(V, mu=op.parameters.parse(0.7))
+    assert cache.misses == 2
+
+
+@pytest.mark.parametrize('format', ['csc', 'csr'])
+def test_numpy_sparse_lincomb_pattern_reuse(format):
+    import scipy.sparse as sps
+    from pymor.parameters.functionals import ProjectionParameterFunctional
+    matrices = [sps.random(20, 20, density=0.1, format=format, random_state=i) for i in range(3)]
+    ops = [NumpyMatrixOperator(m) for m in matrices]
+    op = LincombOperator(ops, [1., ProjectionParameterFunctional('p', 2, 0), ProjectionParameterFunctional('p', 2, 1)])
+    shifted_op = op + IdentityOperator(op.source) * 2.
+
+    for mu in op.parameters.space(-1, 1).sample_randomly(3):
+        c = op.evaluate_coefficients(mu)
+        A = sum(ci * m.toarray() for ci, m in zip(c, matrices))
+        assembled = op.assemble(mu)
+        assert assembled.sparse and assembled.matrix.format == format
+        assert np.allclose(assembled.matrix.toarray(), A)
+        assert np.allclose(shifted_op.assemble(mu).matrix.toarray(), A + 2. * np.eye(20))
+    assert all(p is not None for p in ops[0]._lincomb_patterns.values())
+    unpickled_op = loads(dumps(ops[0]))
+    assert not hasattr(unpickled_op, '_lincomb_patterns')
+    assert np.all(unpickled_op.matrix.toarray() == matrices[0].toarray())
+
+
+@pytest.mark.parametrize('operator_type', ['P1', 'Q1', 'FV'])
+def test_builtin_assembly_plan(operator_type):
+    from pymor.analyticalproblems.functions import ExpressionFunction
+    from pymor.discretizers.builtin.cg import DiffusionOperatorP1, DiffusionOperatorQ1
+    from pymor.discretizers.builtin.fv import DiffusionOperator
+    from pymor.discretizers.builtin.grids.boundaryinfos import GenericBoundaryInfo
+    from pymor.discretizers.builtin.grids.rect import RectGrid
+    from pymor.discretizers.builtin.grids.tria import TriaGrid
+
+    grid = (RectGrid if operator_type == 'Q1' else TriaGrid)((6, 4))
+    boundary_info = GenericBoundaryInfo.from_indicators(grid, {'dirichlet': lambda X: X[:, 1] < 1e-10})
+    diffusion = ExpressionFunction('1 + mu[0] * x[0]**2', 2, parameters={'mu': 1})
+    op = {'P1': DiffusionOperatorP1, 'Q1': DiffusionOperatorQ1, 'FV': DiffusionOperator}[operator_type](
+        grid, boundary_info, diffusion_function=diffusion, diffusion_constant=0.5)
+    A0, A1, A2 = (op.assemble(op.parameters.parse(mu)).matrix for mu in (0., 1., 2.))
+    # the reused plan yields the same matrix structure and the matrix depends affinely on mu
+    assert np.all(A0.indptr == A2.indptr) and np.all(A0.indices == A2.indices)
+    assert np.allclose((2 * A1 - A0 - A2).toarray(), 0.)
+    assert not np.allclose((A1 - A0).toarray(), 0.)
+    # the plan is rebuilt after pickling
+    A2_unpickled = loads(dumps(op)).assemble(op.parameters.parse(2.)).matrix
+    assert np.allclose((A2 - A2_unpickled).toarray(), 0.)
+
+
+def _reference_element_matrices(grid, operator_type):
+    """Element matrices computed element by element from the explicit local bases."""
+    vertices = grid.centers(grid.dim)
+    matrices = []
+    for e, dofs in enumerate(grid.subentities(0, grid.dim)):
+        X = vertices[dofs]
+        if operator_type.endswith('Q1'):
+            # bilinear basis a + b*x + c*y + d*x*y, integrated exactly by a 3x3 Gauss rule
+            coeffs = np.linalg.inv(np.column_stack((np.ones(4), X, X[:, 0] * X[:, 1])))
+            points, weights = np.polynomial.legendre.leggauss(3)
+            (x0, y0), (x1, y1) = X.min(axis=0), X.max(axis=0)
+            xs, ys = (x0 + x1 + (x1 - x0) * points) / 2, (y0 + y1 + (y1 - y0) * points) / 2
+            w = np.outer(weights, weights).ravel() * (x1 - x0) * (y1 - y0) / 4
+            x, y = np.meshgrid(xs, ys, indexing='ij')
+            x, y = x.ravel(), y.ravel()
+            values = np.column_stack((np.ones_like(x), x, y, x * y)) @ coeffs
+            grad_x = (coeffs[1][np.newaxis, :] + coeffs[3][np.newaxis, :] * y[:, np.newaxis])
+            grad_y = (coeffs[2][np.newaxis, :] + coeffs[3][np.newaxis, :] * x[:, np.newaxis])
+            if operator_type.startswith('L2'):
+                matrices.append(np.einsum('q,qi,qj->ij', w, values, values))
+            else:
+                matrices.append(np.einsum('q,qi,qj->ij', w, grad_x, grad_x)
+                                + np.einsum('q,qi,qj->ij', w, grad_y, grad_y))
+        else:
+            # linear basis a + b*x + c*y with constant gradients
+            coeffs = np.linalg.inv(np.column_stack((np.ones(3), X)))
+            area = grid.volumes(0)[e]
+            if operator_type.startswith('L2'):
+                matrices.append(area / 12 * (np.ones((3, 3)) + np.eye(3)))
+            else:
+                matrices.append(area * coeffs[1:].T @ coeffs[1:])
+    return np.array(matrices)
+
+
+@pytest.mark.parametrize('operator_type', ['P1', 'Q1', 'L2P1', 'L2Q1', 'FV'])
+@pytest.mark.parametrize('dirichlet_clear_columns', [False, True])
+def test_builtin_assembly_reference(operator_type, dirichlet_clear_columns):
+    from pymor.analyticalproblems.functions import ExpressionFunction
+    from pymor.discretizers.builtin.cg import DiffusionOperatorP1, DiffusionOperatorQ1, L2ProductP1, L2ProductQ1
+    from pymor.discretizers.builtin.fv import DiffusionOperator
+    from pymor.discretizers.builtin.grids.boundaryinfos import GenericBoundaryInfo
+    from pymor.discretizers.builtin.grids.rect import RectGrid
+    from pymor.discretizers.builtin.grids.tria import TriaGrid
+
+    if operator_type == 'FV' and dirichlet_clear_columns:
+        pytest.skip('no Dirichlet column clearing for finite volumes')
+    grid = (TriaGrid if operator_type.endswith('P1') else RectGrid)((3, 2))
+    boundary_info = GenericBoundaryInfo.from_indicators(grid, {'dirichlet': lambda X: X[:, 1] < 1e-10})
+    function = ExpressionFunction('1 + x[0]**2 + 2 * x[1]', 2)
+    mu = None
+
+    if operator_type == 'FV':
+        op = DiffusionOperator(grid, boundary_info, diffusion_function=function, diffusion_constant=0.5)
+        reference = np.zeros((grid.size(0), grid.size(0)))
+        cell_centers, face_centers = grid.centers(0), grid.centers(1)
+        dirichlet_mask = boundary_info.dirichlet_mask(1)
+        for face, (i, j) in enumerate(grid.superentities(1, 0)):
+            d = 0.5 * function(face_centers[face]) * grid.volumes(1)[face]
+            if j >= 0:
+                flux = d / np.linalg.norm(cell_centers[i] - cell_centers[j])
+                reference[[i, i, j, j], [i, j, j, i]] += np.array([flux, -flux, flux, -flux])
+            elif dirichlet_mask[face]:
+                reference[i, i] += d / np.linalg.norm(cell_centers[i] - face_centers[face])
+        reference /= grid.volumes(0)[:, np.newaxis]
+    else:
+        if operator_type.startswith('L2'):
+            op = (L2ProductP1 if operator_type == 'L2P1' else L2ProductQ1)(
+                grid, boundary_info, dirichlet_clear_columns=dirichlet_clear_columns, coefficient_function=function)
+        else:
+            op = (DiffusionOperatorP1 if operator_type == 'P1' else DiffusionOperatorQ1)(
+                grid, boundary_info, diffusion_function=function, diffusion_constant=0.5,
+                dirichlet_clear_columns=dirichlet_clear_columns)
+        # the coefficient functions are evaluated at the element centers
+        scaling = function(grid.centers(0)) * (1. if operator_type.startswith('L2') else 0.5)
+        element_matrices = _reference_element_matrices(grid, operator_type) * scaling[:, np.newaxis, np.newaxis]
+        reference = np.zeros((grid.size(grid.dim), grid.size(grid.dim)))
+        for dofs, element_matrix in zip(grid.subentities(0, grid.dim), element_matrices):
+            reference[np.ix_(dofs, dofs)] += element_matrix
+        dirichlet_dofs = boundary_info.dirichlet_boundaries(grid.dim)
+        reference[dirichlet_dofs, :] = 0.
+        if dirichlet_clear_columns:
+            reference[:, dirichlet_dofs] = 0.
+        reference[dirichlet_dofs, dirichlet_dofs] = 1.
+
+    assert np.allclose(op.assemble(mu).matrix.toarray(), reference, rtol=1e-13, atol=1e-13)
+
+
 if config.HAVE_DUNEGDT:
     from dune.xt.la import IstlSparseMatrix, SparsityPatternDefault
     from pymor.bindings.dunegdt import DuneXTMatrixOperator
@@ -0,0 +1,93 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+import time
+
+import numpy as np
+import pytest
+
+from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.parallel.processes import ProcessPool
+from pymor.parameters.base import MuArray, Parameters
+from pymor.vectorarrays.numpy import NumpyVectorSpace
+
+
+def _square(x):
+    return x * x
+
+
+def _sleep_and_add(x, y, offset=0):
+    time.sleep(0.01 * (x % 3))
+    return x + y + offset
+
+
+def _apply_op(x, op=None):
+    return op.apply(op.source.from_numpy(np.full(op.source.dim, x))).to_numpy()[0, 0]
+
+
+def _fail(x):
+    if x == 3:
+        raise ValueError('remote failure')
+    return x
+
+
+def _length(l=None):
+    return len(l)
+
+
+def _sum_values(l=None):
+    return l.to_numpy().sum()
+
+
+def _norms(U=None):
+    return U.norm()
+
+
+@pytest.fixture(scope='module')
+def pool():
+    with ProcessPool(2) as pool:
+        yield pool
+
+
+def test_process_pool_map(pool):
+    assert pool.map(_square, list(range(20))) == [x * x for x in range(20)]
+    assert pool.map(_sleep_and_add, list(range(10)), list(range(10)), offset=1) == [2 * x + 1 for x in range(10)]
+    assert pool.map(_square, []) == []
+
+
+def test_process_pool_push(pool):
+    op = NumpyMatrixOperator(2 * np.eye(3))
+    remote_op = pool.push(op)
+    assert pool.apply(_apply_op, 1., op=remote_op) == [2., 2.]
+    assert pool.apply_only(_apply_op, 1, 2., op=remote_op) == 4.
+    # immutable keyword arguments of map are pushed automatically
+    assert pool.map(_apply_op, [1., 2., 3.], op=op) == [2., 4., 6.]
+    del remote_op
+
+
+def test_process_pool_async(pool):
+    future = pool.map_async(_square, list(range(10)))
+    assert future.result() == [x * x for x in range(10)]
+    results = dict(pool.imap_unordered(_square, list(range(10))))
+    assert results == {x: x * x for x in range(10)}
+    for _ in pool.imap_unordered(_square, list(range(10))):
+        break
+    assert pool.apply(_square, 2) == [4, 4]
+
+
+def test_process_pool_exception(pool):
+    with pytest.raises(ValueError):
+        pool.map(_fail, list(range(10)))
+    assert pool.map(_fail, [1, 2]) == [1, 2]
+
+
+def test_process_pool_scatter(pool):
+    remote_l = pool.scatter_list(list(range(5)))
+    assert pool.apply(_length, l=remote_l) == [3, 2]
+    mus = MuArray(Parameters(a=1), np.arange(5.).reshape((5, 1)))
+    remote_mus = pool.scatter_list(mus)
+    assert pool.apply(_sum_values, l=remote_mus) == [3., 7.]
+    U = NumpyVectorSpace(3).ones(5)
+    remote_U = pool.scatter_array(U)
+    assert np.allclose(np.concatenate(pool.apply(_norms, U=remote_U)), U.norm())
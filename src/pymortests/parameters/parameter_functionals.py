@@ -2,8 +2,12 @@
 # Copyright pyMOR developers and contributors. All rights reserved.
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 
-from pymor.parameters.functionals import ProjectionParameterFunctional, ExpressionParameterFunctional
-from pymor.basic import Mu
+import numpy as np
+
+from pymor.parameters.functionals import (ConjugateParameterFunctional, ExpressionParameterFunctional,
+                                          GenericParameterFunctional, MaxThetaParameterFunctional,
+                                          MinThetaParameterFunctional, ProjectionParameterFunctional)
+from pymor.basic import Mu, Parameters
 
 
 def test_LincombParameterFunctional():
@@ -53,3 +57,33 @@ def test_LincombParameterFunctional():
     assert len(three_pf_named.coefficients) != len(three_pf_.coefficients)
     assert pf_times_pf_squared_named(mu) == pf_times_pf_squared(mu)
     assert len(pf_times_pf_squared_named.factors) != len(pf_times_pf_squared.factors)
+
+
+def test_evaluate_batch():
+    dict_of_d_mus = {'mu': ['200 * mu[0]', '2 * mu[0]'], 'nu': ['cos(nu[0])']}
+    dict_of_second_derivative = {
+        'mu': [{'mu': ['200', '2'], 'nu': ['0']}, {'mu': ['2', '0'], 'nu': ['0']}],
+        'nu': [{'mu': ['0', '0'], 'nu': ['-sin(nu[0])']}]
+    }
+    epf = ExpressionParameterFunctional('100 * mu[0]**2 + 2 * mu[1] * mu[0] + sin(nu[0])',
+                                        {'mu': 2, 'nu': 1}, derivative_expressions=dict_of_d_mus,
+                                        second_derivative_expressions=dict_of_second_derivative)
+    pf = ProjectionParameterFunctional('mu', 2, 1)
+    qf = ProjectionParameterFunctional('nu')
+    gf = GenericParameterFunctional(lambda mu: mu['mu'][0] * mu['nu'][0], {'mu': 2, 'nu': 1})
+    functionals = [epf, pf, gf, 3 * epf * pf - 2 + qf, ConjugateParameterFunctional(epf + pf),
+                   MinThetaParameterFunctional([pf, qf], {'mu': [1, 1], 'nu': 1}),
+                   MaxThetaParameterFunctional([pf, -qf, 2.], {'mu': [1, 1], 'nu': 1})]
+    functionals += [f.d_mu(p, i) for f in (epf, pf, 3 * epf * pf) for p, i in (('mu', 0), ('mu', 1), ('nu', 0))]
+    functionals += [epf.d_mu('mu', 0).d_mu('mu', 1), epf.d_mu('nu').d_mu('nu')]
+
+    parameters = Parameters({'mu': 2, 'nu': 1, 'xi': 2})
+    mus = [parameters.parse(v) for v in np.random.RandomState(0).uniform(0.1, 1, (5, parameters.dim))]
+    mus_array = parameters.parse_batch(mus)
+    for f in functionals:
+        values = np.array([f.evaluate(mu) for mu in mus])
+        assert np.allclose(f.evaluate_batch(mus), values)
+        assert np.allclose(f.evaluate_batch(mus_array, parameters), values)
+        assert f.evaluate_batch(mus_array[:0], parameters).shape == (0,)
+    # derivatives of ExpressionParameterFunctionals are ExpressionParameterFunctionals
+    assert isinstance(epf.d_mu('mu', 1).d_mu('mu', 0), ExpressionParameterFunctional)
@@ -7,7 +7,8 @@ import pytest
 from hypothesis import given
 
 from pymor.analyticalproblems.functions import ConstantFunction
-from pymor.parameters.base import Parameters, Mu
+from pymor.parameters.base import Parameters, Mu, MuArray
+from pymor.tools.random import new_rng
 from pymortests.base import runmodule
 import pymortests.strategies as pyst
 
@@ -37,6 +38,18 @@ def test_randomly(space):
         assert space.contains(value)
 
 
+def test_sample_array(space):
+    values = space.sample_uniformly(5, return_array=True)
+    assert isinstance(values, MuArray)
+    assert values == space.sample_uniformly(5)
+    with new_rng(0):
+        values = space.sample_randomly(num_samples, return_array=True)
+    with new_rng(0):
+        assert values == space.sample_randomly(num_samples)
+    assert values.to_numpy().shape == (num_samples, space.parameters.dim)
+    assert all(space.contains(mu) for mu in values)
+
+
 def test_randomly_without_count(space):
     mu = space.sample_randomly()
     assert isinstance(mu, Mu)
@@ -126,6 +139,38 @@ def test_mu_to_numpy(mu):
     assert mu == mu2
 
 
+def test_parse_batch():
+    parameters = Parameters(b=2, a=1)
+    mus = [parameters.parse([1, 2, 3]), [4, 5, 6], Mu(a=7, b=[8, 9], c=10)]
+    mus_array = parameters.parse_batch(mus)
+    assert np.all(mus_array == np.arange(1, 10).reshape((3, 3)))
+    assert parameters.parse_batch(mus_array) is mus_array
+    assert parameters.columns('a') == slice(0, 1)
+    assert parameters.columns('b') == slice(1, 3)
+    assert parameters.parse(mus_array[1]) == parameters.parse(mus[1])
+    assert parameters.parse_batch([]).shape == (0, 3)
+    with pytest.raises(ValueError):
+        parameters.parse_batch(np.zeros((3, 2)))
+
+
+def test_mu_array():
+    parameters = Parameters(b=2, a=1)
+    mus = MuArray(parameters, np.arange(12.).reshape((4, 3)))
+    assert len(mus) == 4
+    assert mus[1] == Mu(a=3, b=[4, 5])
+    assert mus[-1] == Mu(a=9, b=[10, 11])
+    assert isinstance(mus[1:3], MuArray) and mus[1:3] == [mus[1], mus[2]]
+    assert mus[[3, 0]] == [mus[3], mus[0]]
+    assert parameters.parse_batch(mus) is mus.to_numpy()
+    assert np.all(Parameters(b=2).parse_batch(mus) == mus.to_numpy()[:, 1:])
+    with pytest.raises(ValueError):
+        mus.to_numpy()[0, 0] = 1
+    mus.extend([[12, 13, 14]])
+    assert len(mus) == 5 and mus[4] == Mu(a=12, b=[13, 14])
+    assert MuArray(parameters, list(mus)) == mus
+    assert len(MuArray(parameters)) == 0
+
+
 def test_mu_t_wrong_value():
     with pytest.raises(Exception):
         Mu(t=ConstantFunction(np.array([3])))
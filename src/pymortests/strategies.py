@@ -14,6 +14,7 @@ from pymor.analyticalproblems.functions import Function, ExpressionFunction, Con
 from pymor.core.config import config
 from pymor.parameters.base import Mu
 from pymor.vectorarrays.list import NumpyListVectorSpace
+from pymor.vectorarrays.memmap import MemmapVectorSpace
 from pymor.vectorarrays.block import BlockVectorSpace
 from pymor.vectorarrays.numpy import NumpyVectorSpace
 
@@ -83,6 +84,12 @@ def _numpy_list_vector_spaces(draw, np_data_list, compatible, count, dims):
     return [(NumpyListVectorSpace(d), ar) for d, ar in zip(dims, np_data_list)]
 
 
+def _memmap_vector_spaces(draw, np_data_list, compatible, count, dims):
+    # use small blocks to test the block-wise processing of the vectors
+    return [(MemmapVectorSpace(d, block_size=draw(hyst.sampled_from([1, 8 * d + 1, 2**26]))), ar)
+            for d, ar in zip(dims, np_data_list)]
+
+
 def _block_vector_spaces(draw, np_data_list, compatible, count, dims):
     ret = []
     rr = draw(hyst.randoms())
@@ -161,7 +168,7 @@ else:
     assert not os.environ.get('DOCKER_PYMOR', False)
 
 
-_picklable_vector_space_types = ['numpy', 'numpy_list', 'block']
+_picklable_vector_space_types = ['numpy', 'numpy_list', 'memmap', 'block']
 
 
 @hyst.composite
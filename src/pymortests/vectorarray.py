@@ -12,6 +12,7 @@ from hypothesis import strategies as hyst
 from pymor.algorithms.basic import almost_equal
 from pymor.core.config import config
 from pymor.vectorarrays.interface import VectorSpace
+from pymor.vectorarrays.memmap import MemmapVectorSpace
 from pymor.vectorarrays.numpy import NumpyVectorSpace
 from pymor.tools.floatcmp import float_cmp, bounded
 from pymortests.base import might_exceed_deadline
@@ -1040,3 +1041,76 @@ def test_axpy_wrong_coefficients(vectors_and_indices):
 @pyst.given_vector_arrays(which='picklable')
 def test_pickle(vector_array):
     assert_picklable_without_dumps_function(vector_array)
+
+
+def test_numpy_append_amortized_growth():
+    space = NumpyVectorSpace(3)
+    U = space.empty()
+    data = np.arange(3. * 100).reshape((100, 3))
+    for i in range(100):
+        U.append(space.from_numpy(data[i]))
+    assert len(U) == 100
+    assert U.impl._array.shape[0] >= 100
+    assert np.all(U.to_numpy() == data)
+
+    del U[[0, 3, 99]]
+    assert np.all(U.to_numpy() == np.delete(data, [0, 3, 99], axis=0))
+    U.append(space.from_numpy(data[:2]))
+    assert np.all(U.to_numpy() == np.vstack([np.delete(data, [0, 3, 99], axis=0), data[:2]]))
+
+    U.shrink_to_fit()
+    assert U.impl._array.shape[0] == len(U) == 99
+
+
+def test_memmap_pod(tmp_path):
+    from pymor.algorithms.pod import pod
+    data = np.sin(np.outer(np.linspace(1., 2., 30), np.linspace(0., 10., 50)))
+    # blocks of 4 vectors
+    space = MemmapVectorSpace(50, directory=str(tmp_path), block_size=4 * 50 * 8)
+    U = space.empty()
+    for i in range(0, 30, 7):
+        U.append(space.from_numpy(data[i:i+7]))
+    assert np.all(U.to_numpy() == data)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    modes, svals = pod(U, modes=5)
+    modes_np, svals_np = pod(NumpyVectorSpace.from_numpy(data), modes=5)
+    assert modes in space
+    assert np.allclose(svals, svals_np)
+    assert np.allclose(np.abs(modes.inner(U)), np.abs(modes_np.to_numpy() @ data.T))
+
+    del U, modes
+    assert len(list(tmp_path.iterdir())) == 0
+
+
+def test_numpy_delete_keeps_user_arrays():
+    space = NumpyVectorSpace(3)
+    data = np.arange(12.).reshape((4, 3))
+    source = data.copy()
+    U = space.from_numpy(data)
+    del U[0]
+    assert np.all(data == source)
+    assert np.all(U.to_numpy() == source[1:])
+
+    U = space.zeros(4, reserve=10)
+    U.append(space.from_numpy(data))
+    V = U.to_numpy()
+    V_copy = V.copy()
+    del U[[0, 5]]
+    U.append(space.from_numpy(data[:1]))
+    assert np.all(V == V_copy)
+    assert np.all(data == source)
+    assert np.all(U.to_numpy() == np.vstack([np.delete(V_copy, [0, 5], axis=0), source[:1]]))
+
+
+def test_numpy_append_growth_with_views():
+    space = NumpyVectorSpace(3)
+    U = space.empty()
+    data = np.arange(3. * 200).reshape((200, 3))
+    views = []
+    for i in range(200):
+        U.append(space.from_numpy(data[i]))
+        views.append(U.to_numpy())
+        assert U.impl._array.shape[0] <= 2 * len(U)
+    assert np.all(U.to_numpy() == data)
+    assert all(np.all(V == data[:len(V)]) for V in views)